@@ -1,7 +1,11 @@
 import heapq
-from typing import List, Tuple, Generator
+from typing import List, Optional, Tuple, Generator, TYPE_CHECKING
 from maze.grid import Grid, Cell
 from utils.timer import Timer
+from utils.constants import PALETTE_VISITED, PALETTE_FRONTIER, PALETTE_PATH
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class AStar:
@@ -12,6 +16,8 @@ class AStar:
         self.timer = Timer()
         self.nodes_explored = 0
         self.path_length = 0
+        self.frontier = ()  # Open set of a running batched search, read for progress
+        self.best_h = None  # Smallest heuristic ever pushed to that open set, read for the ETA
 
     def heuristic(self, cell: Cell, goal: Cell) -> float:
         """
@@ -87,22 +93,48 @@ class AStar:
         Find path with step-by-step animation.
 
         Yields:
-            Tuple of (cell, state) where state is 'visiting', 'visited', or 'path'
+            Tuple of (cell, state) where state is 'frontier', 'visited', or 'path'
 
         Returns:
             Tuple of (path, stats)
         """
+        from algorithms.search_trace import cell_events
+
+        # One event per chunk keeps the cell flags in step with the yielded events;
+        # raw chunks skip building two arrays per event
+        return (yield from cell_events(self.grid, self.find_path_batched(1, raw=True)))
+
+    def find_path_batched(self, budget: int = 256, raw: bool = False) -> Generator[Tuple['np.ndarray', 'np.ndarray'], Optional[int], Tuple[List[Cell], dict]]:
+        """
+        Find path using A*, yielding search events in chunks.
+
+        Args:
+            budget: Maximum events per chunk; send() a new budget to change it
+            raw: Yield plain lists instead of arrays (used by find_path_animated)
+
+        Yields:
+            Tuple of (indices, codes): flat cell indices (int32) and
+            PALETTE_VISITED / PALETTE_FRONTIER / PALETTE_PATH codes (uint8)
+
+        Returns:
+            Tuple of (path, stats)
+        """
+        from algorithms.search_trace import EventBatch
+
         if not self.grid.start_cell or not self.grid.end_cell:
             return [], {}
 
         self.timer.start()
         self.nodes_explored = 0
         self.grid.reset_search_states()
+        batch = EventBatch(self.grid.cols, budget, raw)
 
         start = self.grid.start_cell
         goal = self.grid.end_cell
 
         pq = [(self.heuristic(start, goal), 0, id(start), start)]
+        self.frontier = pq
+        self.best_h = pq[0][0]
         start.distance = 0
         g_scores = {start: 0}
 
@@ -114,7 +146,9 @@ class AStar:
 
             current.visited = True
             self.nodes_explored += 1
-            yield (current, 'visited')
+            batch.add(current, PALETTE_VISITED)
+            if batch.full:
+                batch.resize((yield batch.take()))
 
             # Goal found
             if current == goal:
@@ -122,7 +156,11 @@ class AStar:
 
                 for cell in path:
                     cell.in_path = True
-                    yield (cell, 'path')
+                    batch.add(cell, PALETTE_PATH)
+                    if batch.full:
+                        batch.resize((yield batch.take()))
+                if len(batch):
+                    yield batch.take()
 
                 elapsed = self.timer.stop()
                 return path, self._get_stats(elapsed, path)
@@ -138,10 +176,15 @@ class AStar:
                         neighbor.parent = current
                         neighbor.in_frontier = True
 
-                        f_score = tentative_g + self.heuristic(neighbor, goal)
-                        heapq.heappush(pq, (f_score, tentative_g, id(neighbor), neighbor))
-                        yield (neighbor, 'frontier')
+                        h_score = self.heuristic(neighbor, goal)
+                        self.best_h = min(self.best_h, h_score)
+                        heapq.heappush(pq, (tentative_g + h_score, tentative_g, id(neighbor), neighbor))
+                        batch.add(neighbor, PALETTE_FRONTIER)
+                        if batch.full:
+                            batch.resize((yield batch.take()))
 
+        if len(batch):
+            yield batch.take()
         elapsed = self.timer.stop()
         return [], self._get_stats(elapsed, [])
 
@@ -1,7 +1,11 @@
 from collections import deque
-from typing import List, Optional, Tuple, Generator
+from typing import List, Optional, Tuple, Generator, TYPE_CHECKING
 from maze.grid import Grid, Cell
 from utils.timer import Timer
+from utils.constants import PALETTE_VISITED, PALETTE_FRONTIER, PALETTE_PATH
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class BFS:
@@ -12,6 +16,7 @@ class BFS:
         self.timer = Timer()
         self.nodes_explored = 0
         self.path_length = 0
+        self.frontier = ()  # Open set of a running batched search, read for progress
 
     def find_path(self) -> Tuple[List[Cell], dict]:
         """
@@ -58,19 +63,44 @@ class BFS:
         Find path with step-by-step animation.
 
         Yields:
-            Tuple of (cell, state) where state is 'visiting', 'visited', or 'path'
+            Tuple of (cell, state) where state is 'frontier', 'visited', or 'path'
+
+        Returns:
+            Tuple of (path, stats)
+        """
+        from algorithms.search_trace import cell_events
+
+        # One event per chunk keeps the cell flags in step with the yielded events;
+        # raw chunks skip building two arrays per event
+        return (yield from cell_events(self.grid, self.find_path_batched(1, raw=True)))
+
+    def find_path_batched(self, budget: int = 256, raw: bool = False) -> Generator[Tuple['np.ndarray', 'np.ndarray'], Optional[int], Tuple[List[Cell], dict]]:
+        """
+        Find path using BFS, yielding search events in chunks.
+
+        Args:
+            budget: Maximum events per chunk; send() a new budget to change it
+            raw: Yield plain lists instead of arrays (used by find_path_animated)
+
+        Yields:
+            Tuple of (indices, codes): flat cell indices (int32) and
+            PALETTE_VISITED / PALETTE_FRONTIER / PALETTE_PATH codes (uint8)
 
         Returns:
             Tuple of (path, stats)
         """
+        from algorithms.search_trace import EventBatch
+
         if not self.grid.start_cell or not self.grid.end_cell:
             return [], {}
 
         self.timer.start()
         self.nodes_explored = 0
         self.grid.reset_search_states()
+        batch = EventBatch(self.grid.cols, budget, raw)
 
         queue = deque([self.grid.start_cell])
+        self.frontier = queue
         self.grid.start_cell.visited = True
         self.grid.start_cell.distance = 0
 
@@ -78,18 +108,22 @@ class BFS:
             current = queue.popleft()
             self.nodes_explored += 1
 
-            # Mark as visited for visualization
             current.visited = True
-            yield (current, 'visited')
+            batch.add(current, PALETTE_VISITED)
+            if batch.full:
+                batch.resize((yield batch.take()))
 
             # Goal found
             if current == self.grid.end_cell:
                 path = self._reconstruct_path(current)
 
-                # Animate path
                 for cell in path:
                     cell.in_path = True
-                    yield (cell, 'path')
+                    batch.add(cell, PALETTE_PATH)
+                    if batch.full:
+                        batch.resize((yield batch.take()))
+                if len(batch):
+                    yield batch.take()
 
                 elapsed = self.timer.stop()
                 return path, self._get_stats(elapsed, path)
@@ -101,8 +135,12 @@ class BFS:
                     neighbor.parent = current
                     neighbor.distance = current.distance + 1
                     queue.append(neighbor)
-                    yield (neighbor, 'frontier')
+                    batch.add(neighbor, PALETTE_FRONTIER)
+                    if batch.full:
+                        batch.resize((yield batch.take()))
 
+        if len(batch):
+            yield batch.take()
         elapsed = self.timer.stop()
         return [], self._get_stats(elapsed, [])
 
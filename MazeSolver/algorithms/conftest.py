@@ -0,0 +1,18 @@
+"""Pytest fixtures for the algorithm tests (test_algorithms.main() runs without pytest)."""
+
+import pytest
+
+from algorithms import BFS, Dijkstra, AStar
+from algorithms.test_algorithms import create_simple_maze
+
+
+@pytest.fixture
+def grid():
+    """A fresh simple maze for each test."""
+    return create_simple_maze()
+
+
+@pytest.fixture(params=[BFS, Dijkstra, AStar], ids=lambda cls: cls.__name__)
+def algorithm_class(request):
+    """Each pathfinding algorithm in turn."""
+    return request.param
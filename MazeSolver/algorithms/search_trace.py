@@ -0,0 +1,272 @@
+"""Compact recording of search events for seeking and replay.
+
+A trace stores every event of an animated search as two parallel arrays:
+flat cell indices (int32) and event codes (uint8, PALETTE_* values). Every
+keyframe_interval events a snapshot of the per-cell state bits is kept, so
+the state at any step is one snapshot copy plus at most keyframe_interval
+events, without re-running the algorithm. Snapshots are rows * cols bytes
+each; when they outgrow keyframe_budget the interval doubles and every
+other snapshot is dropped, so large grids seek a little slower instead of
+holding hundreds of full-grid copies.
+"""
+
+from array import array
+from typing import List, Optional
+
+import numpy as np
+
+from utils.constants import PALETTE_FRONTIER, PALETTE_VISITED, PALETTE_PATH
+
+# Per-cell state bits (a cell can be frontier, visited and on the path at once)
+FRONTIER_BIT = 1
+VISITED_BIT = 2
+PATH_BIT = 4
+
+# Event state names yielded by find_path_animated -> event codes
+EVENT_CODES = {
+    'frontier': PALETTE_FRONTIER,
+    'visited': PALETTE_VISITED,
+    'path': PALETTE_PATH,
+}
+
+EVENT_STATES = {code: state for state, code in EVENT_CODES.items()}
+
+EVENT_BITS = np.zeros(256, dtype=np.uint8)
+EVENT_BITS[PALETTE_FRONTIER] = FRONTIER_BIT
+EVENT_BITS[PALETTE_VISITED] = VISITED_BIT
+EVENT_BITS[PALETTE_PATH] = PATH_BIT
+
+# Bytes of keyframe snapshots a trace may hold before thinning them out
+KEYFRAME_BUDGET = 64 * 1024 * 1024
+
+
+class SearchTrace:
+    """Event trace of one search run with keyframes for random access."""
+
+    def __init__(self, rows: int, cols: int, keyframe_interval: int = 4096, algorithm: str = '',
+                 keyframe_budget: int = KEYFRAME_BUDGET):
+        """
+        Args:
+            rows: Grid rows
+            cols: Grid columns
+            keyframe_interval: Events between state snapshots (grows to stay within keyframe_budget)
+            algorithm: Name of the recorded algorithm
+            keyframe_budget: Maximum bytes of state snapshots to keep
+        """
+        self.rows = rows
+        self.cols = cols
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.algorithm = algorithm
+        self.max_keyframes = max(2, keyframe_budget // max(1, rows * cols))
+
+        self._indices = array('i')
+        self._events = array('B')
+        self._keyframes: List[np.ndarray] = [np.zeros(rows * cols, dtype=np.uint8)]
+
+        # State bits currently written to the grid cells by apply()
+        self._shown: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def indices(self) -> np.ndarray:
+        """Flat cell index of every event (row * cols + col), as a copy."""
+        return np.array(self._indices, dtype=np.int32)
+
+    @property
+    def events(self) -> np.ndarray:
+        """Event code (PALETTE_*) of every event, as a copy."""
+        return np.array(self._events, dtype=np.uint8)
+
+    def _bits(self, lo: int, hi: int):
+        """(flat indices, state bits) of events [lo, hi)."""
+        # Slicing copies only the range; a buffer view would lock the arrays against appends
+        indices = np.frombuffer(self._indices[lo:hi], dtype=np.int32) if hi > lo else np.zeros(0, np.int32)
+        events = np.frombuffer(self._events[lo:hi], dtype=np.uint8) if hi > lo else np.zeros(0, np.uint8)
+        return indices, EVENT_BITS[events]
+
+    def record(self, index: int, code: int):
+        """Append one event by flat cell index and event code."""
+        self._indices.append(index)
+        self._events.append(code)
+
+    def record_cell(self, cell, state: str):
+        """Append one (cell, state) event as yielded by find_path_animated."""
+        self._indices.append(cell.row * self.cols + cell.col)
+        self._events.append(EVENT_CODES[state])
+
+    def record_batch(self, indices, codes):
+        """Append a chunk of events (arrays of flat indices and event codes)."""
+        self._indices.frombytes(np.asarray(indices, dtype=np.int32).tobytes())
+        self._events.frombytes(np.asarray(codes, dtype=np.uint8).tobytes())
+
+    def _update_keyframes(self):
+        """Build snapshots for all complete keyframe intervals recorded so far."""
+        complete = len(self) // self.keyframe_interval
+        if len(self._keyframes) > complete:
+            return
+
+        # Keyframe k of the doubled interval is keyframe 2k of the old one
+        while complete >= self.max_keyframes:
+            self.keyframe_interval *= 2
+            self._keyframes = self._keyframes[::2]
+            complete = len(self) // self.keyframe_interval
+
+        interval = self.keyframe_interval
+        state = self._keyframes[-1].copy()
+        for k in range(len(self._keyframes), complete + 1):
+            np.bitwise_or.at(state, *self._bits((k - 1) * interval, k * interval))
+            self._keyframes.append(state.copy())
+
+    def state_at(self, step: int) -> np.ndarray:
+        """Per-cell state bits after the first `step` events."""
+        step = max(0, min(step, len(self)))
+        self._update_keyframes()
+
+        k = step // self.keyframe_interval
+        state = self._keyframes[k].copy()
+        lo = k * self.keyframe_interval
+        if step > lo:
+            np.bitwise_or.at(state, *self._bits(lo, step))
+        return state
+
+    def apply(self, grid, step: int) -> np.ndarray:
+        """
+        Set the grid's search flags to their state after `step` events.
+        Only cells whose state differs from the last applied state are touched.
+
+        Returns:
+            Flat indices of the changed cells
+        """
+        target = self.state_at(step)
+        if self._shown is None:
+            self._shown = self.grid_state(grid)
+
+        changed = np.flatnonzero(target != self._shown)
+        cells = grid.cells
+        for index, bits in zip(changed.tolist(), target[changed].tolist()):
+            cell = cells[index // self.cols][index % self.cols]
+            cell.in_frontier = bool(bits & FRONTIER_BIT)
+            cell.visited = bool(bits & VISITED_BIT)
+            cell.in_path = bool(bits & PATH_BIT)
+
+        self._shown = target
+        return changed
+
+    def sync(self, grid):
+        """Re-read the grid's current flags (after it was changed outside apply())."""
+        self._shown = self.grid_state(grid)
+
+    @staticmethod
+    def grid_state(grid) -> np.ndarray:
+        """Per-cell state bits of a grid's search flags."""
+        return np.array([
+            (FRONTIER_BIT if cell.in_frontier else 0)
+            | (VISITED_BIT if cell.visited else 0)
+            | (PATH_BIT if cell.in_path else 0)
+            for row in grid.cells for cell in row
+        ], dtype=np.uint8)
+
+    def save(self, filepath: str):
+        """Save the trace as .npz (keyframes are rebuilt on load)."""
+        np.savez_compressed(
+            filepath,
+            indices=self.indices,
+            events=self.events,
+            shape=np.array([self.rows, self.cols, self.keyframe_interval], dtype=np.int64),
+            algorithm=np.array(self.algorithm),
+        )
+
+    @staticmethod
+    def load(filepath: str) -> 'SearchTrace':
+        """Load a trace saved with save()."""
+        with np.load(filepath) as data:
+            rows, cols, interval = (int(v) for v in data['shape'])
+            trace = SearchTrace(rows, cols, interval, str(data['algorithm']))
+            trace._indices.frombytes(data['indices'].astype(np.int32).tobytes())
+            trace._events.frombytes(data['events'].astype(np.uint8).tobytes())
+        return trace
+
+
+class EventBatch:
+    """Collect search events and hand them out as (indices, codes) chunks."""
+
+    def __init__(self, cols: int, budget: int, raw: bool = False):
+        """
+        Args:
+            cols: Grid columns (for flat indices)
+            budget: Maximum events per chunk
+            raw: Hand out plain lists instead of arrays (cheaper for tiny chunks)
+        """
+        self.cols = cols
+        self.budget = max(1, budget)
+        self.raw = raw
+        self._indices: List[int] = []
+        self._codes: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    @property
+    def full(self) -> bool:
+        """True once the chunk holds `budget` events."""
+        return len(self._codes) >= self.budget
+
+    def add(self, cell, code: int):
+        """Add one event for a cell."""
+        self._indices.append(cell.row * self.cols + cell.col)
+        self._codes.append(code)
+
+    def take(self):
+        """Return the collected events as (int32 indices, uint8 codes) and start a new chunk."""
+        if self.raw:
+            chunk = (self._indices, self._codes)
+        else:
+            chunk = (np.array(self._indices, dtype=np.int32), np.array(self._codes, dtype=np.uint8))
+        self._indices = []
+        self._codes = []
+        return chunk
+
+    def resize(self, budget: Optional[int]):
+        """Change the chunk size (value passed to the generator's send(); None keeps it)."""
+        if budget:
+            self.budget = max(1, budget)
+
+
+def apply_events(grid, indices, codes):
+    """Set the search flags of a chunk of events on the grid's cells (flags are only ever set)."""
+    cells = grid.cells
+    cols = grid.cols
+    for index, code in zip(indices.tolist(), codes.tolist()):
+        cell = cells[index // cols][index % cols]
+        if code == PALETTE_VISITED:
+            cell.visited = True
+        elif code == PALETTE_FRONTIER:
+            cell.in_frontier = True
+        else:
+            cell.in_path = True
+
+
+def cell_events(grid, chunks):
+    """
+    Adapt a find_path_batched generator to (cell, state) events, one per yield.
+
+    Args:
+        grid: Grid the search runs on
+        chunks: Generator yielding (indices, codes) chunks, as arrays or raw lists
+
+    Returns:
+        The batched generator's return value (path, stats)
+    """
+    cells = grid.cells
+    cols = grid.cols
+    while True:
+        try:
+            indices, codes = next(chunks)
+        except StopIteration as stop:
+            return stop.value
+        if not isinstance(indices, list):
+            indices, codes = indices.tolist(), codes.tolist()
+        for index, code in zip(indices, codes):
+            yield cells[index // cols][index % cols], EVENT_STATES[code]
@@ -2,6 +2,7 @@
 
 from maze.grid import Grid
 from algorithms import BFS, Dijkstra, AStar
+from algorithms.search_trace import SearchTrace, EVENT_CODES
 
 
 def create_simple_maze():
@@ -34,6 +35,159 @@ def test_algorithm(algorithm_class, grid):
     print(f"Time: {stats['time_formatted']}")
 
 
+def test_search_trace(algorithm_class, grid):
+    """Check that a recorded trace reproduces the search state at every step."""
+    trace = SearchTrace(grid.rows, grid.cols, keyframe_interval=16)
+    states = [SearchTrace.grid_state(grid)]
+
+    for cell, state in algorithm_class(grid).find_path_animated():
+        trace.record_cell(cell, state)
+        states.append(SearchTrace.grid_state(grid))
+
+    for step in (0, 1, len(trace) // 2, len(trace) - 1, len(trace)):
+        assert (trace.state_at(step) == states[step]).all(), f"state mismatch at step {step}"
+
+    # A budget of three snapshots thins the keyframes out as the trace grows
+    small = SearchTrace(grid.rows, grid.cols, keyframe_interval=1, keyframe_budget=3 * grid.rows * grid.cols)
+    small.record_batch(trace.indices, trace.events)
+    for step in range(len(trace) + 1):
+        assert (small.state_at(step) == states[step]).all(), f"thinned state mismatch at step {step}"
+    assert len(small._keyframes) <= 3 and small.keyframe_interval > 1
+
+    # Seek backwards and forwards through the grid's cells
+    trace.apply(grid, 0)
+    assert not SearchTrace.grid_state(grid).any()
+    trace.apply(grid, len(trace))
+    assert (SearchTrace.grid_state(grid) == states[-1]).all()
+
+    print(f"{algorithm_class.__name__}: trace of {len(trace)} events replays correctly")
+
+
+def test_batched_events(algorithm_class, grid, budget=5):
+    """Check that batched chunks carry the same events as find_path_animated."""
+    expected = [(cell.row * grid.cols + cell.col, EVENT_CODES[state])
+                for cell, state in algorithm_class(grid).find_path_animated()]
+
+    events = []
+    for indices, codes in algorithm_class(grid).find_path_batched(budget):
+        assert len(indices) <= budget
+        events.extend(zip(indices.tolist(), codes.tolist()))
+
+    assert events == expected, "batched events differ from animated events"
+    print(f"{algorithm_class.__name__}: {len(events)} events in chunks of {budget}")
+
+
+def test_scheduled_run(grid, rate=600.0, dt=0.05):
+    """Check that the step scheduler runs rate * dt events per frame and finishes a run."""
+    from visualization.algorithm_controller import AlgorithmController
+
+    controller = AlgorithmController(grid)
+    controller.scheduler.set_rate(rate)
+    controller.start()
+    controller.step(dt)
+    events = len(controller.trace)
+    assert rate * dt <= events <= rate * dt + controller.scheduler.chunk_size, f"{events} events in one frame"
+
+    controller.set_speed(100)
+    frames = 1
+    while not controller.step(dt):
+        frames += 1
+    assert controller.finished and controller.stats['path_found']
+    print(f"Scheduler: {events} events in the first frame at {rate:.0f}/s, "
+          f"{len(controller.trace)} events in {frames} frames unlimited")
+
+
+def test_astar_eta(grid, rate=600.0, dt=0.05):
+    """Check that the A* ETA follows the closest frontier cell, not the last visited one."""
+    from utils.constants import PALETTE_FRONTIER
+    from visualization.algorithm_controller import AlgorithmController
+
+    controller = AlgorithmController(grid)
+    controller.set_algorithm("astar")
+    controller.scheduler.set_rate(rate)
+    controller.start()
+    controller.step(dt)
+
+    goal = grid.end_cell
+    frontier = controller.trace.indices[controller.trace.events == PALETTE_FRONTIER]
+    rows, cols = frontier // grid.cols, frontier % grid.cols
+    assert controller.algorithm.best_h == (abs(rows - goal.row) + abs(cols - goal.col)).min()
+
+    eta = controller.get_live_stats()['eta']
+    assert eta is not None and eta >= 0
+    print(f"A* ETA: {eta:.3f}s left, frontier {controller.algorithm.best_h} cells from the goal")
+
+
+def test_instant_run_is_recorded(grid):
+    """Check that run_instant records a trace that can be seeked like an animated run."""
+    from visualization.algorithm_controller import AlgorithmController
+
+    controller = AlgorithmController(grid)
+    controller.set_algorithm("bfs")
+    path, stats = controller.run_instant()
+    final = SearchTrace.grid_state(grid)
+
+    assert stats['path_found'] and controller.can_seek()
+    assert controller.trace_position == len(controller.trace)
+    assert controller.seek(0) and not SearchTrace.grid_state(grid).any()
+    assert controller.seek(len(controller.trace)) and (SearchTrace.grid_state(grid) == final).all()
+    print(f"Instant run: {len(controller.trace)} events recorded for replay")
+
+
+def test_background_run(grid):
+    """Check that a worker-thread run hands over the same events as an animated run and can be cancelled."""
+    from maze.grid import Grid
+    from visualization.algorithm_controller import AlgorithmController
+    from visualization.solver_worker import SolverWorker
+
+    # BFS: heap ties in Dijkstra/A* break on id(cell), which differs on the worker's grid copy
+    expected = [cell.row * grid.cols + cell.col for cell, _ in BFS(grid).find_path_animated()]
+    expected_state = SearchTrace.grid_state(grid)
+    grid.reset_search_states()
+
+    controller = AlgorithmController(grid)
+    controller.start(background=True)
+    assert controller.worker.wait(10)
+    assert controller.step()
+    assert controller.trace.indices.tolist() == expected, "background events differ from animated events"
+    assert controller.stats['path_found'] and controller.worker is None
+
+    # The worker searched a copy; its flags reached the shared cells on this thread
+    assert (SearchTrace.grid_state(grid) == expected_state).all()
+    assert all(grid.cells[cell.row][cell.col] is cell for cell in controller.path)
+
+    # A worker that is held before its first chunk is always cancelled mid-run
+    def paused_worker(algorithm):
+        worker = SolverWorker(algorithm)
+        worker.pause()
+        return worker
+
+    big = Grid(300, 300)
+    big.set_start(0, 0)
+    big.set_end(299, 299)
+    controller = AlgorithmController(big)
+    controller.worker_factory = paused_worker
+    controller.start(background=True)
+    worker = controller.worker
+    assert controller.cancel() and not controller.running
+    assert worker.wait(0) and worker.progress.cancelled and not worker.alive
+
+    # A failing search is reported, not treated like a cancel
+    class FailingAStar(AStar):
+        def find_path_batched(self, budget=256, raw=False):
+            raise RuntimeError("search failed")
+            yield
+
+    controller = AlgorithmController(grid)
+    controller.worker_factory = lambda algorithm: SolverWorker(FailingAStar(algorithm.grid))
+    controller.start(background=True)
+    assert controller.worker.wait(10)
+    assert controller.step()
+    assert isinstance(controller.error, RuntimeError) and not controller.running
+    assert "search failed" in controller.get_status_text()
+    print(f"Background: {len(expected)} events handed over, cancel and failure reported")
+
+
 def main():
     """Run algorithm tests."""
     grid = create_simple_maze()
@@ -45,6 +199,22 @@ def main():
     grid.reset_search_states()
 
     test_algorithm(AStar, grid)
+    grid.reset_search_states()
+
+    print()
+    for algorithm_class in (BFS, Dijkstra, AStar):
+        test_search_trace(algorithm_class, grid)
+        grid.reset_search_states()
+        test_batched_events(algorithm_class, grid)
+        grid.reset_search_states()
+
+    test_scheduled_run(grid)
+    grid.reset_search_states()
+    test_astar_eta(grid)
+    grid.reset_search_states()
+    test_instant_run_is_recorded(grid)
+    grid.reset_search_states()
+    test_background_run(grid)
 
 
 if __name__ == "__main__":
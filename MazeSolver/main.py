@@ -9,9 +9,11 @@ except:
 import pygame
 import sys
 import os
+import time
 
 from maze.grid import Grid
 from maze.maze_generator import MazeGenerator
+from maze.maze_loader import MazeLoader
 from visualization.visualizer import Visualizer
 from visualization.algorithm_controller import AlgorithmController
 from visualization.ui_manager import UIManager
@@ -20,6 +22,8 @@ from visualization.status_bar import StatusBar
 from utils.constants import *
 from utils.file_utils import FileUtils
 from utils.export_tools import ExportTools
+from utils.frame_recorder import FrameRecorder
+from utils.frame_pacer import FramePacer
 from config import config
 from utils.layout_manager import LayoutManager  # ✅ Added new layout system
 
@@ -40,9 +44,14 @@ class MazeSolver:
             pygame.RESIZABLE
         )
         pygame.display.set_caption("Maze Solver - Pathfinding Visualizer")
-        self.clock = pygame.time.Clock()
+        self.pacer = FramePacer(FPS)
         self.running = True
 
+        # Idle mode: block on input and repaint only the start/end pulse
+        self.idle = False
+        self._last_activity = time.perf_counter()
+        self._cpu_sample = (time.perf_counter(), time.process_time())
+
         # --- Core Components ---
         self.grid = Grid(self.grid_rows, self.grid_cols)
         self.maze_generator = MazeGenerator(self.grid)
@@ -66,19 +75,20 @@ class MazeSolver:
             self.layout.status_bar_height
         )
         self.control_panel.status_bar_callback = self.status_bar.set_status
+        self.status_bar.metrics_source = self._sample_metrics
 
         # --- Export Tools ---
         self.export_tools = ExportTools()
-        self.recording_frames = False
+        self.recorder = FrameRecorder()
 
         # --- Grid Setup ---
         self.selection_mode = None
-        self.grid.set_start(1, 1)
-        self.grid.set_end(self.grid_rows - 2, self.grid_cols - 2)
+        self.maze_generator.place_endpoints()
 
         # --- Input State ---
         self.mouse_pressed = False
         self.current_button = 0
+        self.panning = False
 
     #  GRID & LAYOUT RESIZE
     def resize_grid(self, rows: int, cols: int):
@@ -145,12 +155,21 @@ class MazeSolver:
         self.status_bar.set_status(f"Grid resized to {rows}x{cols}")
 
     #  EVENT HANDLING
-    def handle_events(self):
-        """Handle pygame events."""
-        for event in pygame.event.get():
+    def handle_events(self, events=None):
+        """Handle pygame events (defaults to the pending queue)."""
+        if events is None:
+            events = pygame.event.get()
+        if events:
+            self._last_activity = time.perf_counter()
+
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
 
+            # Window contents may have been lost
+            if event.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE):
+                self.visualizer.invalidate()
+
             # Let UI handle event first
             if self.ui_manager.handle_event(event):
                 continue
@@ -162,18 +181,29 @@ class MazeSolver:
             elif event.type == pygame.MOUSEBUTTONUP:
                 self.mouse_pressed = False
                 self.current_button = 0
+                self.panning = False
+
+            elif event.type == pygame.MOUSEMOTION and self.panning:
+                self.layout.pan(-event.rel[0], -event.rel[1])
 
             elif event.type == pygame.MOUSEMOTION and self.mouse_pressed:
                 self._handle_mouse_drag(event)
 
+            elif event.type == pygame.MOUSEWHEEL:
+                self._handle_mouse_wheel(event)
+
             # Keyboard events
             elif event.type == pygame.KEYDOWN:
                 self._handle_keypress(event.key)
 
     def _handle_mouse_down(self, event):
-        if self.algorithm_controller.running:
-            return
         """Handle mouse button press."""
+        # Middle drag pans the camera, also while an algorithm runs; 4/5 are wheel steps
+        if event.button == 2 and self.layout.in_viewport(*event.pos):
+            self.panning = True
+            return
+        if self.algorithm_controller.running or event.button not in (1, 3):
+            return
         pos = event.pos
         cell_pos = self.layout.get_cell_from_pos(pos[0], pos[1])
 
@@ -202,9 +232,11 @@ class MazeSolver:
         if event.button == 1:  # Left click → draw wall
             if self.grid.cells[row][col].type == 0:
                 self.grid.cells[row][col].type = 1
+                self.grid.mark_dirty(row, col)
         elif event.button == 3:  # Right click → erase wall
             if self.grid.cells[row][col].type == 1:
                 self.grid.cells[row][col].type = 0
+                self.grid.mark_dirty(row, col)
 
     def _handle_mouse_drag(self, event):
         """Handle dragging while drawing walls."""
@@ -223,8 +255,23 @@ class MazeSolver:
 
         if self.current_button == 1 and cell.type == 0:
             cell.type = 1
+            self.grid.mark_dirty(row, col)
         elif self.current_button == 3 and cell.type == 1:
             cell.type = 0
+            self.grid.mark_dirty(row, col)
+
+    def _handle_mouse_wheel(self, event):
+        """Wheel zooms at the cursor; Shift+wheel and horizontal scrolling pan."""
+        x, y = pygame.mouse.get_pos()
+        if not self.layout.in_viewport(x, y):
+            return
+
+        if pygame.key.get_mods() & pygame.KMOD_SHIFT:
+            self.layout.pan(-event.y * 40, 0)
+        elif event.x:
+            self.layout.pan(event.x * 40, 0)
+        elif self.layout.zoom_at(event.y, x, y):
+            self.status_bar.set_status(f"Zoom: {self.layout.zoom:g} px/cell")
 
     # KEYBOARD HANDLING
     def _handle_keypress(self, key: int):
@@ -261,45 +308,114 @@ class MazeSolver:
         elif key == pygame.K_c:
             self.algorithm_controller.reset()
             self.grid.clear_grid()
-            self.grid.set_start(1, 1)
-            self.grid.set_end(self.grid_rows - 2, self.grid_cols - 2)
+            self.maze_generator.place_endpoints()
             self.status_bar.set_status("Grid cleared")
 
         elif key == pygame.K_i:
+            # Solve on a worker thread; the window stays responsive and shows progress
             if not self.algorithm_controller.finished:
-                self.algorithm_controller.run_instant()
-                self.status_bar.set_status("Algorithm completed instantly")
+                self.algorithm_controller.start(background=True)
+                self.status_bar.set_status("Solving in background (Esc to cancel)")
+
+        elif key == pygame.K_ESCAPE:
+            if self.algorithm_controller.cancel():
+                self.status_bar.set_status("Search cancelled")
+
+        # Trace Replay (after a run has finished)
+        elif key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_HOME, pygame.K_END):
+            controller = self.algorithm_controller
+            if controller.can_seek():
+                controller.stop_replay()
+                total = len(controller.trace)
+                jump = max(1, total // 20) if pygame.key.get_mods() & pygame.KMOD_SHIFT else 1
+                targets = {
+                    pygame.K_LEFT: controller.trace_position - jump,
+                    pygame.K_RIGHT: controller.trace_position + jump,
+                    pygame.K_HOME: 0,
+                    pygame.K_END: total,
+                }
+                controller.seek(targets[key])
+                self.status_bar.set_status(f"Step {controller.trace_position}/{total}")
+
+        elif key in (pygame.K_PERIOD, pygame.K_COMMA):
+            controller = self.algorithm_controller
+            if controller.can_seek():
+                speed = abs(controller.replay_speed) or None
+                if key == pygame.K_COMMA:
+                    controller.start_replay(-(speed or controller.default_replay_speed()))
+                else:
+                    controller.start_replay(speed)
+                self.status_bar.set_status(controller.get_status_text())
+
+        elif key in (pygame.K_LEFTBRACKET, pygame.K_RIGHTBRACKET):
+            controller = self.algorithm_controller
+            if controller.replaying:
+                factor = 0.5 if key == pygame.K_LEFTBRACKET else 2.0
+                controller.set_replay_speed(controller.replay_speed * factor)
+                self.status_bar.set_status(f"Replay speed: {abs(controller.replay_speed):.0f} steps/s")
+
+        elif key == pygame.K_t and pygame.key.get_mods() & pygame.KMOD_CTRL:
+            filepath = "outputs/search_trace.npz"
+            if self.algorithm_controller.save_trace(filepath):
+                self.status_bar.set_status(f"Trace saved to {filepath}")
+
+        # Camera
+        elif key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS, pygame.K_MINUS, pygame.K_KP_MINUS):
+            steps = -1 if key in (pygame.K_MINUS, pygame.K_KP_MINUS) else 1
+            if self.layout.zoom_at(steps):
+                self.status_bar.set_status(f"Zoom: {self.layout.zoom:g} px/cell")
+
+        elif key == pygame.K_0:
+            if self.layout.reset_camera():
+                self.status_bar.set_status("View reset")
 
         # Maze Generation
         elif key == pygame.K_g:
             self.algorithm_controller.reset()
             self.maze_generator.generate_dfs(complexity=0.75)
+            self.maze_generator.place_endpoints()
             self.maze_generator.make_solvable()
-            self.grid.set_start(1, 1)
-            self.grid.set_end(self.grid_rows - 2, self.grid_cols - 2)
             self.status_bar.set_status("Generated DFS maze")
 
         elif key == pygame.K_d:
             self.algorithm_controller.reset()
             self.maze_generator.generate_recursive_division(wall_density=0.5)
+            self.maze_generator.place_endpoints()
             self.maze_generator.make_solvable()
-            self.grid.set_start(1, 1)
-            self.grid.set_end(self.grid_rows - 2, self.grid_cols - 2)
             self.status_bar.set_status("Generated Recursive Division maze")
 
+        elif key == pygame.K_k:
+            self.algorithm_controller.reset()
+            self.maze_generator.generate_kruskal()
+            self.maze_generator.place_endpoints()
+            self.maze_generator.make_solvable()
+            self.status_bar.set_status("Generated Kruskal maze")
+
+        elif key == pygame.K_w:
+            self.algorithm_controller.reset()
+            self.maze_generator.generate_wilson()
+            self.maze_generator.place_endpoints()
+            self.maze_generator.make_solvable()
+            self.status_bar.set_status("Generated Wilson maze")
+
+        elif key == pygame.K_m:
+            self.algorithm_controller.reset()
+            self.maze_generator.generate_tiled()
+            self.maze_generator.place_endpoints()
+            self.maze_generator.make_solvable()
+            self.status_bar.set_status("Generated tiled maze")
+
         elif key == pygame.K_b:
             self.algorithm_controller.reset()
             self.maze_generator.generate_binary_tree()
+            self.maze_generator.place_endpoints()
             self.maze_generator.make_solvable()
-            self.grid.set_start(1, 1)
-            self.grid.set_end(self.grid_rows - 2, self.grid_cols - 2)
             self.status_bar.set_status("Generated Binary Tree maze")
 
         elif key == pygame.K_o:
             self.algorithm_controller.reset()
             self.maze_generator.generate_random_obstacles(obstacle_density=0.3)
-            self.grid.set_start(1, 1)
-            self.grid.set_end(self.grid_rows - 2, self.grid_cols - 2)
+            self.maze_generator.place_endpoints()
             self.status_bar.set_status("Generated random obstacles")
 
         # Save/Load
@@ -316,12 +432,9 @@ class MazeSolver:
 
         elif key == pygame.K_l and pygame.key.get_mods() & pygame.KMOD_CTRL:
             try:
-                maze_data = FileUtils.load_maze_from_text("outputs/saved_maze.txt")
-                self.grid = Grid(len(maze_data), len(maze_data[0]))
-                FileUtils.apply_maze_data(self.grid, maze_data)
-                self.maze_generator = MazeGenerator(self.grid)
-                self.visualizer.grid = self.grid
-                self.algorithm_controller.grid = self.grid
+                maze_data, start, end = MazeLoader.load_array("outputs/saved_maze.txt")
+                self.resize_grid(*maze_data.shape)
+                self.grid.load_from_ndarray(maze_data, start, end)
                 self.status_bar.set_status("Maze loaded")
             except Exception as e:
                 self.status_bar.set_status(f"Load failed: {e}")
@@ -332,9 +445,25 @@ class MazeSolver:
             self.status_bar.set_status(f"Screenshot: {filename}")
 
         elif key == pygame.K_F11:
-            self.recording_frames = not self.recording_frames
-            state = "started" if self.recording_frames else "stopped"
-            self.status_bar.set_status(f"Recording {state}")
+            if self.recorder.recording:
+                self.recorder.stop()
+                stats = self.recorder.get_stats()
+                self.status_bar.set_status(
+                    f"Recording stopped ({stats['written']} frames, {stats['dropped']} dropped)"
+                )
+            elif pygame.key.get_mods() & pygame.KMOD_SHIFT:
+                self.recorder.start("outputs/animation.gif")
+                self.status_bar.set_status("Recording to outputs/animation.gif")
+            else:
+                self.recorder.start()
+                self.status_bar.set_status("Recording started")
+
+        elif key == pygame.K_F9:
+            stats = self.pacer.get_stats()
+            self.status_bar.set_status(
+                f"{stats['fps']:.0f} FPS | frame {stats['mean']:.1f} ms (p95 {stats['p95']:.1f}, "
+                f"p99 {stats['p99']:.1f}) | dropped {stats['dropped']} | CPU {self.get_cpu_usage():.1f}%"
+            )
 
         elif key == pygame.K_F10:
             gif_file = self.export_tools.frames_to_gif()
@@ -342,9 +471,8 @@ class MazeSolver:
                 self.status_bar.set_status(f"GIF saved: {gif_file}")
 
     #  UPDATE / RENDER
-    def update(self):
-        """Update game state."""
-        dt = self.clock.tick(FPS) / 1000.0
+    def update(self, dt: float):
+        """Update game state by dt seconds."""
 
         # Update UI
         self.ui_manager.update(dt)
@@ -355,27 +483,81 @@ class MazeSolver:
         # Update animations
         self.visualizer.update_animations(dt)
 
+        # Replay a recorded run
+        self.algorithm_controller.update_replay(dt)
+
         # Update algorithm controller
         if self.algorithm_controller.running and not self.algorithm_controller.paused:
-            completed = self.algorithm_controller.step()
+            completed = self.algorithm_controller.step(dt)
 
             if completed:
                 stats = self.algorithm_controller.get_stats()
-                if stats['path_found']:
-                    self.status_bar.set_status(f"Path found! Length: {stats['path_length']}")
+                if self.algorithm_controller.error is not None:
+                    self.status_bar.set_status(f"Search failed: {self.algorithm_controller.error}")
+                elif stats['path_found']:
+                    self.status_bar.set_status(
+                        f"Path found! Length: {stats['path_length']} ({stats.get('steps_per_second', 0):,.0f} steps/s)"
+                    )
                 else:
                     self.status_bar.set_status("No path found")
 
         # Update control panel button states
         self.control_panel.update_button_states()
 
+    #  IDLE MODE
+    def is_idle(self) -> bool:
+        """True when nothing animates but the start/end pulse and there was no recent input."""
+        controller = self.algorithm_controller
+        busy = ((controller.running and not controller.paused) or controller.replaying
+                or self.recorder.recording or self.mouse_pressed or self.panning
+                or self.status_bar.message_timer > 0)
+        now = time.perf_counter()
+        if busy:
+            self._last_activity = now
+            return False
+        return now - self._last_activity >= IDLE_DELAY
+
+    def wait_idle(self):
+        """
+        Block until input arrives or the next pulse repaint is due.
+
+        Returns:
+            (events, dt) - the received events and the seconds since the last frame
+        """
+        timeout = int(1000 / IDLE_FPS) if IDLE_FPS else 0  # 0 waits for input only
+        event = pygame.event.wait(timeout)
+        events = [] if event.type == pygame.NOEVENT else [event]
+        return events + pygame.event.get(), self.pacer.resync()
+
+    def _sample_metrics(self):
+        """Live metrics for the status bar (sampled a few times per second)."""
+        metrics = self.algorithm_controller.get_live_stats()
+        if metrics is not None:
+            metrics['frame_ms'] = self.pacer.get_stats(last=FPS // 4)['mean']
+        return metrics
+
+    def get_cpu_usage(self) -> float:
+        """Process CPU usage in percent of one core since the previous call."""
+        wall, cpu = time.perf_counter(), time.process_time()
+        last_wall, last_cpu = self._cpu_sample
+        self._cpu_sample = (wall, cpu)
+        return 100.0 * (cpu - last_cpu) / (wall - last_wall) if wall > last_wall else 0.0
+
     def render(self):
         """Render everything."""
-        # Clear screen
-        self.screen.fill(COLOR_BACKGROUND)
+        # While a search runs, the scheduler caps the render rate to leave time for stepping
+        controller = self.algorithm_controller
+        if controller.running and not controller.paused and not controller.render_due:
+            return
 
-        # Render visualization
-        self.visualizer.render()
+        # Render visualization (clears the screen only on full redraws)
+        dirty_rects = self.visualizer.render()
+
+        # Idle: UI and status bar are unchanged, only the pulsing cells are repainted
+        if self.idle and dirty_rects is not None:
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+            return
 
         # Render UI
         self.ui_manager.render(self.screen)
@@ -384,21 +566,33 @@ class MazeSolver:
         stats = self.algorithm_controller.get_stats() if self.algorithm_controller.finished else None
         self.status_bar.render(self.screen, stats)
 
-        # Update display
-        pygame.display.flip()
+        # Update display: whole window after a full redraw, else changed cells and UI
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects + self.ui_manager.get_rects() + [self.status_bar.rect])
 
         # Record frames if enabled
-        if self.recording_frames and self.algorithm_controller.running:
-            self.export_tools.create_animation_frames(self.screen)
+        if self.recorder.recording and (self.algorithm_controller.running or self.algorithm_controller.replaying):
+            self.recorder.capture(self.screen)
 
     #  MAIN LOOP
     def run(self):
         """Main game loop."""
         while self.running:
-            self.handle_events()
-            self.update()
-            self.render()
-            self.clock.tick(FPS)
+            self.idle = self.is_idle()
+            if self.idle:
+                events, dt = self.wait_idle()
+            else:
+                events, dt = None, self.pacer.tick()
+            self.handle_events(events)
+            if events:
+                self.idle = False
+            self.update(dt)
+            # Skip a render now and then when the frame already missed its deadline
+            if self.pacer.should_render():
+                self.render()
+        self.recorder.stop()
         pygame.quit()
         sys.exit()
 
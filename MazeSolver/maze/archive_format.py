@@ -0,0 +1,206 @@
+"""Compressed maze archive (.mazez) with independently compressed tiles.
+
+Layout (little-endian):
+    header   magic, version, codec, rows, cols, tile size, start, end, tile count
+    index    uint64 offset and uint32 size per tile, row-major tile order
+    tiles    compressed np.packbits of each tile's wall mask
+
+Tiles decompress independently, so a whole maze is decoded in parallel on a
+thread pool (zlib and lzma release the GIL) and single tiles can be read
+without touching the rest of the file.
+"""
+
+import lzma
+import os
+import struct
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from utils.constants import CELL_WALL
+
+
+class MazeArchive:
+    """Read and write .mazez archives."""
+
+    MAGIC = b'MAZZ'
+    VERSION = 1
+    EXTENSION = '.mazez'
+
+    CODECS = {
+        'zlib': (1, lambda data, level: zlib.compress(data, level), zlib.decompress),
+        'lzma': (2, lambda data, level: lzma.compress(data, preset=level), lzma.decompress),
+    }
+
+    # magic, version, codec, rows, cols, tile size, start (r, c), end (r, c), tile count
+    HEADER = struct.Struct('<4sHHIIIiiiiI')
+    INDEX_DTYPE = np.dtype([('offset', '<u8'), ('size', '<u4')])
+
+    def __init__(self, filepath: str):
+        """Open an archive and read its header and tile index."""
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"Maze file not found: {filepath}")
+
+        self.filepath = filepath
+        self._data = np.memmap(filepath, dtype=np.uint8, mode='r')
+        header_size = self.HEADER.size
+        if len(self._data) < header_size:
+            raise ValueError(f"Not a .mazez file: {filepath}")
+
+        (magic, version, codec_id, self.rows, self.cols, self.tile_size,
+         start_row, start_col, end_row, end_col, tile_count) = self.HEADER.unpack(
+            self._data[:header_size].tobytes())
+
+        if magic != self.MAGIC:
+            raise ValueError(f"Not a .mazez file: {filepath}")
+        if version > self.VERSION:
+            raise ValueError(f"Unsupported .mazez version {version}")
+
+        if self.tile_size < 1:
+            raise ValueError(f"Invalid tile size {self.tile_size} in {filepath}")
+
+        codecs = {codec_id: (name, decompress) for name, (codec_id, _, decompress) in self.CODECS.items()}
+        if codec_id not in codecs:
+            raise ValueError(f"Unknown codec id {codec_id}")
+        self.codec, self._decompress = codecs[codec_id]
+
+        self.start_pos = (start_row, start_col) if start_row >= 0 else None
+        self.end_pos = (end_row, end_col) if end_row >= 0 else None
+
+        index_end = header_size + tile_count * self.INDEX_DTYPE.itemsize
+        self.index = self._data[header_size:index_end].view(self.INDEX_DTYPE)
+        self.tile_rows = -(-self.rows // self.tile_size) if self.rows else 0
+        self.tile_cols = -(-self.cols // self.tile_size) if self.cols else 0
+        if tile_count != self.tile_rows * self.tile_cols or len(self.index) != tile_count:
+            raise ValueError(f"Corrupt tile index in {filepath}")
+
+        self.stats: Dict[str, float] = {}
+
+    @staticmethod
+    def save(filepath: str, walls: np.ndarray,
+             start_pos: Optional[Tuple[int, int]] = None,
+             end_pos: Optional[Tuple[int, int]] = None,
+             tile_size: int = 256, codec: str = 'zlib', level: int = 6) -> Dict[str, float]:
+        """
+        Write a cell-type array as a tiled, compressed archive.
+
+        Args:
+            filepath: Output path
+            walls: 2D array of cell types (only CELL_WALL cells are stored as walls)
+            start_pos: Optional (row, col) of the start cell
+            end_pos: Optional (row, col) of the end cell
+            tile_size: Tile side length in cells
+            codec: 'zlib' or 'lzma'
+            level: Compression level / preset
+
+        Returns:
+            Dict with raw and compressed sizes and the compression ratio
+        """
+        if tile_size < 1:
+            raise ValueError(f"tile_size must be positive, got {tile_size}")
+        if codec not in MazeArchive.CODECS:
+            raise ValueError(f"Unknown codec: {codec}. Available: {', '.join(MazeArchive.CODECS)}")
+        codec_id, compress, _ = MazeArchive.CODECS[codec]
+
+        mask = np.asarray(walls) == CELL_WALL
+        rows, cols = mask.shape
+
+        chunks = [
+            compress(np.packbits(mask[r:r + tile_size, c:c + tile_size]).tobytes(), level)
+            for r in range(0, rows, tile_size)
+            for c in range(0, cols, tile_size)
+        ]
+
+        start = start_pos or (-1, -1)
+        end = end_pos or (-1, -1)
+        header = MazeArchive.HEADER.pack(MazeArchive.MAGIC, MazeArchive.VERSION, codec_id,
+                                         rows, cols, tile_size, start[0], start[1],
+                                         end[0], end[1], len(chunks))
+
+        index = np.zeros(len(chunks), dtype=MazeArchive.INDEX_DTYPE)
+        index['size'] = [len(chunk) for chunk in chunks]
+        data_start = len(header) + index.nbytes
+        sizes = index['size'].astype(np.uint64)
+        index['offset'] = data_start + np.cumsum(sizes) - sizes
+
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(filepath, 'wb') as file:
+            file.write(header)
+            file.write(index.tobytes())
+            for chunk in chunks:
+                file.write(chunk)
+
+        compressed = data_start + int(index['size'].sum())
+        return {
+            'raw_bytes': rows * cols,
+            'compressed_bytes': compressed,
+            'compression_ratio': rows * cols / compressed if compressed else 0.0,
+        }
+
+    @staticmethod
+    def save_grid(grid, filepath: str, **kwargs) -> Dict[str, float]:
+        """Save a Grid object as a .mazez archive."""
+        start = (grid.start_cell.row, grid.start_cell.col) if grid.start_cell else None
+        end = (grid.end_cell.row, grid.end_cell.col) if grid.end_cell else None
+        return MazeArchive.save(filepath, grid.to_array(), start, end, **kwargs)
+
+    @staticmethod
+    def is_archive(filepath: str) -> bool:
+        """Check the magic bytes of a file."""
+        with open(filepath, 'rb') as file:
+            return file.read(len(MazeArchive.MAGIC)) == MazeArchive.MAGIC
+
+    def tile_bounds(self, tile_row: int, tile_col: int) -> Tuple[int, int, int, int]:
+        """Cell bounds (row_start, row_end, col_start, col_end) of a tile."""
+        row_start = tile_row * self.tile_size
+        col_start = tile_col * self.tile_size
+        return (row_start, min(row_start + self.tile_size, self.rows),
+                col_start, min(col_start + self.tile_size, self.cols))
+
+    def load_tile(self, tile_row: int, tile_col: int) -> np.ndarray:
+        """Decompress a single tile into a uint8 array of cell types."""
+        if not (0 <= tile_row < self.tile_rows and 0 <= tile_col < self.tile_cols):
+            raise IndexError(f"Tile ({tile_row}, {tile_col}) out of range")
+
+        row_start, row_end, col_start, col_end = self.tile_bounds(tile_row, tile_col)
+        entry = self.index[tile_row * self.tile_cols + tile_col]
+        offset, size = int(entry['offset']), int(entry['size'])
+        packed = np.frombuffer(self._decompress(self._data[offset:offset + size].tobytes()), dtype=np.uint8)
+
+        height, width = row_end - row_start, col_end - col_start
+        return np.unpackbits(packed, count=height * width).reshape(height, width)
+
+    def load(self, workers: Optional[int] = None) -> np.ndarray:
+        """
+        Decompress every tile in parallel into one uint8 array of cell types.
+
+        Compression ratio and decode throughput are recorded in self.stats.
+        """
+        types = np.empty((self.rows, self.cols), dtype=np.uint8)
+        tiles = [(tr, tc) for tr in range(self.tile_rows) for tc in range(self.tile_cols)]
+
+        def decode(tile):
+            row_start, row_end, col_start, col_end = self.tile_bounds(*tile)
+            types[row_start:row_end, col_start:col_end] = self.load_tile(*tile)
+
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            list(executor.map(decode, tiles))
+        elapsed = time.perf_counter() - start_time
+
+        compressed = len(self._data)
+        self.stats = {
+            'raw_bytes': self.rows * self.cols,
+            'compressed_bytes': compressed,
+            'compression_ratio': self.rows * self.cols / compressed if compressed else 0.0,
+            'decode_seconds': elapsed,
+            'cells_per_second': self.rows * self.cols / elapsed if elapsed > 0 else 0.0,
+            'decoded_mb_per_second': self.rows * self.cols / elapsed / 1e6 if elapsed > 0 else 0.0,
+        }
+        return types
@@ -0,0 +1,179 @@
+"""Compact binary maze format (.mazeb) with bit-packed walls and mmap loading.
+
+Layout (little-endian):
+    header      magic, version, flags, rows, cols, start, end, layer count, digest
+    layer names 16 bytes each, NUL padded
+    walls       np.packbits of the row-major wall mask, padded to 8 bytes
+    layers      one float32 rows x cols array per cost layer
+
+The digest is a BLAKE2b hash of everything after the header and layer names.
+"""
+
+import hashlib
+import os
+import struct
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from utils.constants import CELL_WALL
+
+
+class BinaryMazeFormat:
+    """Read and write .mazeb files."""
+
+    MAGIC = b'MAZB'
+    VERSION = 1
+    EXTENSION = '.mazeb'
+
+    # magic, version, flags, rows, cols, start (r, c), end (r, c), layers, reserved, digest
+    HEADER = struct.Struct('<4sHHIIiiiiHH16s')
+    LAYER_NAME_SIZE = 16
+    ALIGNMENT = 8
+
+    @staticmethod
+    def save(filepath: str, walls: np.ndarray,
+             start_pos: Optional[Tuple[int, int]] = None,
+             end_pos: Optional[Tuple[int, int]] = None,
+             cost_layers: Optional[Dict[str, np.ndarray]] = None) -> str:
+        """
+        Save a cell-type array and optional cost layers.
+
+        Args:
+            filepath: Output path
+            walls: 2D array of cell types (only CELL_WALL cells are stored as walls)
+            start_pos: Optional (row, col) of the start cell
+            end_pos: Optional (row, col) of the end cell
+            cost_layers: Optional mapping of layer name to 2D float array
+
+        Returns:
+            The path written
+        """
+        walls = np.asarray(walls)
+        rows, cols = walls.shape
+        cost_layers = cost_layers or {}
+
+        wall_bytes = BinaryMazeFormat._pad(np.packbits(walls.ravel() == CELL_WALL).tobytes())
+        layer_bytes = []
+        for name, layer in cost_layers.items():
+            if len(name.encode()) > BinaryMazeFormat.LAYER_NAME_SIZE:
+                raise ValueError(f"Layer name too long: {name}")
+            if np.shape(layer) != (rows, cols):
+                raise ValueError(f"Layer {name} has shape {np.shape(layer)}, expected {(rows, cols)}")
+            layer_bytes.append(np.ascontiguousarray(layer, dtype='<f4').tobytes())
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(wall_bytes)
+        for data in layer_bytes:
+            digest.update(data)
+
+        start = start_pos or (-1, -1)
+        end = end_pos or (-1, -1)
+        header = BinaryMazeFormat.HEADER.pack(
+            BinaryMazeFormat.MAGIC, BinaryMazeFormat.VERSION, 0,
+            rows, cols, start[0], start[1], end[0], end[1],
+            len(cost_layers), 0, digest.digest()
+        )
+        names = b''.join(name.encode().ljust(BinaryMazeFormat.LAYER_NAME_SIZE, b'\0')
+                         for name in cost_layers)
+
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(filepath, 'wb') as file:
+            file.write(BinaryMazeFormat._pad(header + names))
+            file.write(wall_bytes)
+            for data in layer_bytes:
+                file.write(data)
+
+        return filepath
+
+    @staticmethod
+    def save_grid(grid, filepath: str, cost_layers: Optional[Dict[str, np.ndarray]] = None) -> str:
+        """Save a Grid object to a .mazeb file."""
+        start = (grid.start_cell.row, grid.start_cell.col) if grid.start_cell else None
+        end = (grid.end_cell.row, grid.end_cell.col) if grid.end_cell else None
+        return BinaryMazeFormat.save(filepath, grid.to_array(), start, end, cost_layers)
+
+    @staticmethod
+    def load(filepath: str, verify: bool = False) -> Tuple[
+            np.ndarray, Optional[Tuple[int, int]], Optional[Tuple[int, int]], Dict[str, np.ndarray]]:
+        """
+        Memory-map a .mazeb file.
+
+        Walls are unpacked into a uint8 array of cell types; cost layers are
+        returned as read-only views into the mapped file, so they are not copied.
+
+        Args:
+            filepath: Path to .mazeb file
+            verify: Check the content hash (reads the whole file); the payload
+                length is always checked against the header
+
+        Raises:
+            ValueError: If the file is not a .mazeb file, is truncated or fails verification
+
+        Returns:
+            Tuple of (walls, start_pos, end_pos, cost_layers)
+        """
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"Maze file not found: {filepath}")
+
+        mapped = np.memmap(filepath, dtype=np.uint8, mode='r')
+        header_size = BinaryMazeFormat.HEADER.size
+        if len(mapped) < header_size:
+            raise ValueError(f"Not a .mazeb file: {filepath}")
+
+        (magic, version, _flags, rows, cols, start_row, start_col, end_row, end_col,
+         layer_count, _reserved, digest) = BinaryMazeFormat.HEADER.unpack(mapped[:header_size].tobytes())
+
+        if magic != BinaryMazeFormat.MAGIC:
+            raise ValueError(f"Not a .mazeb file: {filepath}")
+        if version > BinaryMazeFormat.VERSION:
+            raise ValueError(f"Unsupported .mazeb version {version}")
+
+        names_end = header_size + layer_count * BinaryMazeFormat.LAYER_NAME_SIZE
+        names = [
+            mapped[offset:offset + BinaryMazeFormat.LAYER_NAME_SIZE].tobytes().rstrip(b'\0').decode()
+            for offset in range(header_size, names_end, BinaryMazeFormat.LAYER_NAME_SIZE)
+        ]
+
+        offset = BinaryMazeFormat._aligned(names_end)
+        count = rows * cols
+        wall_size = BinaryMazeFormat._aligned((count + 7) // 8)
+        expected = offset + wall_size + layer_count * count * 4
+        if len(mapped) < expected:
+            raise ValueError(f"Truncated .mazeb file: {filepath} "
+                             f"({len(mapped)} bytes, header requires {expected})")
+
+        if verify and hashlib.blake2b(mapped[offset:], digest_size=16).digest() != digest:
+            raise ValueError(f"Content hash mismatch: {filepath}")
+
+        walls = np.unpackbits(mapped[offset:offset + wall_size], count=count).reshape(rows, cols)
+        offset += wall_size
+
+        layers = {}
+        for name in names:
+            layers[name] = mapped[offset:offset + count * 4].view('<f4').reshape(rows, cols)
+            offset += count * 4
+
+        start = (start_row, start_col) if start_row >= 0 else None
+        end = (end_row, end_col) if end_row >= 0 else None
+        return walls, start, end, layers
+
+    @staticmethod
+    def is_binary_maze(filepath: str) -> bool:
+        """Check the magic bytes of a file."""
+        with open(filepath, 'rb') as file:
+            return file.read(len(BinaryMazeFormat.MAGIC)) == BinaryMazeFormat.MAGIC
+
+    @staticmethod
+    def _aligned(size: int) -> int:
+        """Round size up to the format alignment."""
+        alignment = BinaryMazeFormat.ALIGNMENT
+        return (size + alignment - 1) // alignment * alignment
+
+    @staticmethod
+    def _pad(data: bytes) -> bytes:
+        """Pad data with zeros up to the format alignment."""
+        return data.ljust(BinaryMazeFormat._aligned(len(data)), b'\0')
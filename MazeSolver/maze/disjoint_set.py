@@ -0,0 +1,32 @@
+"""Array-backed disjoint-set (union-find) structure."""
+
+from typing import List
+
+
+class DisjointSet:
+    """Union-find over integer ids 0..size-1 backed by flat lists."""
+
+    def __init__(self, size: int):
+        self.parent: List[int] = list(range(size))
+        self.rank: List[int] = [0] * size
+
+    def find(self, item: int) -> int:
+        """Return the representative of item's set (with path halving)."""
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets containing a and b. Returns False if already joined."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+        return True
@@ -0,0 +1,213 @@
+"""Registry of maze file formats keyed by extension and magic bytes.
+
+Each handler imports its heavy dependencies (NumPy, Pillow, codecs) on first
+use, so importing the registry - or loading a text maze - never pays for
+Pillow. Every handler returns a uint8 array of cell types plus start/end.
+"""
+
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+
+class MazeFormat(ABC):
+    """Base class for a maze file format handler."""
+
+    name = ''
+    extensions: Tuple[str, ...] = ()
+    magic = b''
+
+    @abstractmethod
+    def load_array(self, filepath: str, **options):
+        """Return (types, start_pos, end_pos) with types as a 2D uint8 array."""
+
+    @abstractmethod
+    def save(self, grid, filepath: str, **options):
+        """Save a Grid object in this format. Returns the path written."""
+
+
+class TextFormat(MazeFormat):
+    """Plain text mazes ('1' wall, 'S' start, 'E' end)."""
+
+    name = 'text'
+    extensions = ('.txt', '.maze')
+
+    def load_array(self, filepath: str, **options):
+        from utils.text_codec import TextMazeCodec
+
+        types, _lengths, start_pos, end_pos = TextMazeCodec.read_array(filepath)
+        return types, start_pos, end_pos
+
+    def save(self, grid, filepath: str, **options):
+        from utils.text_codec import TextMazeCodec
+
+        TextMazeCodec.write(filepath, grid, grid.start_cell, grid.end_cell)
+        return filepath
+
+
+class ImageFormat(MazeFormat):
+    """Raster images; dark pixels become walls."""
+
+    name = 'image'
+    extensions = ('.png', '.jpg', '.jpeg', '.bmp')
+
+    def load_array(self, filepath: str, threshold: int = 128, block_size: int = 1,
+                   block_mode: str = 'majority', **options):
+        import numpy as np
+        from PIL import Image
+        from utils.constants import CELL_EMPTY, CELL_WALL
+
+        if block_mode not in ('majority', 'minimum'):
+            raise ValueError(f"Invalid block mode: {block_mode}")
+
+        # Load and convert image to grayscale
+        pixels = np.asarray(Image.open(filepath).convert('L'))
+        dark = pixels < threshold
+
+        if block_size > 1:
+            # Pad ragged edges by repeating the border, then reduce each block
+            pad_rows = -pixels.shape[0] % block_size
+            pad_cols = -pixels.shape[1] % block_size
+            dark = np.pad(dark, ((0, pad_rows), (0, pad_cols)), mode='edge')
+            blocks = dark.reshape(dark.shape[0] // block_size, block_size,
+                                  dark.shape[1] // block_size, block_size)
+
+            if block_mode == 'majority':
+                dark = blocks.sum(axis=(1, 3)) * 2 > block_size * block_size
+            else:
+                # Minimum brightness below threshold == any dark pixel in block
+                dark = blocks.any(axis=(1, 3))
+
+        types = np.where(dark, CELL_WALL, CELL_EMPTY).astype(np.uint8)
+
+        # Auto-detect start (top-left empty) and end (bottom-right empty)
+        start_pos = find_empty_cell(types, from_start=True)
+        end_pos = find_empty_cell(types, from_start=False)
+        return types, start_pos, end_pos
+
+    def save(self, grid, filepath: str, cell_size: int = 1, **options):
+        """Walls black, everything else white; load with block_size=cell_size to read it back."""
+        import numpy as np
+        from PIL import Image
+        from utils.constants import CELL_WALL
+
+        pixels = np.where(grid.to_array() == CELL_WALL, 0, 255).astype(np.uint8)
+        if cell_size > 1:
+            pixels = np.repeat(np.repeat(pixels, cell_size, axis=0), cell_size, axis=1)
+
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        Image.fromarray(pixels, 'L').save(filepath)
+        return filepath
+
+
+class BinaryFormat(MazeFormat):
+    """Bit-packed, memory-mapped .mazeb files."""
+
+    name = 'binary'
+    extensions = ('.mazeb',)
+    magic = b'MAZB'
+
+    def load_array(self, filepath: str, verify: bool = False, **options):
+        from maze.binary_format import BinaryMazeFormat
+
+        walls, start_pos, end_pos, _layers = BinaryMazeFormat.load(filepath, verify)
+        return walls, start_pos, end_pos
+
+    def save(self, grid, filepath: str, **options):
+        from maze.binary_format import BinaryMazeFormat
+
+        return BinaryMazeFormat.save_grid(grid, filepath, **options)
+
+
+class ArchiveFormat(MazeFormat):
+    """Tiled, compressed .mazez archives."""
+
+    name = 'archive'
+    extensions = ('.mazez',)
+    magic = b'MAZZ'
+
+    def __init__(self):
+        self.last_stats: dict = {}
+
+    def load_array(self, filepath: str, workers: Optional[int] = None, **options):
+        from maze.archive_format import MazeArchive
+
+        archive = MazeArchive(filepath)
+        types = archive.load(workers)
+        self.last_stats = archive.stats
+        return types, archive.start_pos, archive.end_pos
+
+    def save(self, grid, filepath: str, **options):
+        from maze.archive_format import MazeArchive
+
+        MazeArchive.save_grid(grid, filepath, **options)
+        return filepath
+
+
+def find_empty_cell(types, from_start: bool = True) -> Optional[Tuple[int, int]]:
+    """Find first empty cell from start or end of a 2D array of cell types."""
+    import numpy as np
+    from utils.constants import CELL_EMPTY
+
+    types = np.asarray(types)
+    if types.ndim != 2 or types.size == 0:
+        return None
+
+    empty = np.flatnonzero(types.ravel() == CELL_EMPTY)
+    if not len(empty):
+        return None
+
+    row, col = divmod(int(empty[0] if from_start else empty[-1]), types.shape[1])
+    return (row, col)
+
+
+class FormatRegistry:
+    """Look up maze format handlers by name, extension or magic bytes."""
+
+    _formats: Dict[str, MazeFormat] = {}
+
+    @classmethod
+    def register(cls, handler: MazeFormat):
+        """Register (or replace) a format handler."""
+        cls._formats[handler.name] = handler
+
+    @classmethod
+    def get(cls, name: str) -> MazeFormat:
+        """Get a handler by format name."""
+        if name not in cls._formats:
+            available = ', '.join(cls._formats)
+            raise ValueError(f"Invalid file type: {name}. Available: {available}")
+        return cls._formats[name]
+
+    @classmethod
+    def names(cls) -> List[str]:
+        """Names of all registered formats."""
+        return list(cls._formats)
+
+    @classmethod
+    def detect(cls, filepath: str) -> MazeFormat:
+        """Pick a handler from the file extension, falling back to magic bytes."""
+        ext = os.path.splitext(filepath)[1].lower()
+        for handler in cls._formats.values():
+            if ext in handler.extensions:
+                return handler
+
+        if os.path.exists(filepath):
+            with open(filepath, 'rb') as file:
+                head = file.read(16)
+            for handler in cls._formats.values():
+                if handler.magic and head.startswith(handler.magic):
+                    return handler
+
+        raise ValueError(f"Unknown file type: {ext}")
+
+    @classmethod
+    def resolve(cls, filepath: str, file_type: str = 'auto') -> MazeFormat:
+        """Handler for an explicit file type, or detected when file_type is 'auto'."""
+        return cls.detect(filepath) if file_type == 'auto' else cls.get(file_type)
+
+
+for _handler in (TextFormat(), ImageFormat(), BinaryFormat(), ArchiveFormat()):
+    FormatRegistry.register(_handler)
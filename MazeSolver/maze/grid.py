@@ -1,5 +1,8 @@
+import gc
 from typing import Tuple, Optional, List
-from utils.constants import CELL_EMPTY, CELL_WALL, CELL_START, CELL_END
+from utils.constants import (
+    CELL_EMPTY, CELL_WALL, CELL_START, CELL_END, PALETTE_PATH, PALETTE_VISITED, PALETTE_FRONTIER
+)
 
 class Cell:
     """Represents a single cell in the maze grid."""
@@ -14,6 +17,21 @@ class Cell:
         self.distance = float('inf')
         self.parent: Optional['Cell'] = None
 
+    def state_code(self) -> int:
+        """
+        Palette index (PALETTE_*) including search state.
+        Walls/start/end win over path, which wins over visited, then frontier.
+        """
+        if self.type != CELL_EMPTY:
+            return self.type
+        if self.in_path:
+            return PALETTE_PATH
+        if self.visited:
+            return PALETTE_VISITED
+        if self.in_frontier:
+            return PALETTE_FRONTIER
+        return CELL_EMPTY
+
     def reset_search_state(self):
         """Reset cell state for new search."""
         self.visited = False
@@ -50,16 +68,27 @@ class Grid:
         self.cells: List[List[Cell]] = []
         self.start_cell: Optional[Cell] = None
         self.end_cell: Optional[Cell] = None
+
+        # Change journal for incremental rendering (see take_dirty)
+        self.version = 0  # Bumped on structural changes: cell types, start/end
+        self._all_dirty = True
+        self._dirty_cells = set()
+
         self._initialize_grid()
 
     def _initialize_grid(self):
         """Initialize empty grid."""
-        self.cells = []
-        for row in range(self.rows):
-            row_cells = []
-            for col in range(self.cols):
-                row_cells.append(Cell(row, col))
-            self.cells.append(row_cells)
+        self.mark_all_dirty()
+
+        # Fresh cells form no reference cycles; pausing the cyclic GC while
+        # allocating millions of them halves the time spent here
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self.cells = [[Cell(row, col) for col in range(self.cols)] for row in range(self.rows)]
+        finally:
+            if gc_was_enabled:
+                gc.enable()
 
     def get_cell(self, row: int, col: int) -> Optional[Cell]:
         """Get cell at position, return None if out of bounds."""
@@ -93,10 +122,12 @@ class Grid:
         # Clear previous start if exists
         if self.start_cell:
             self.start_cell.type = CELL_EMPTY
+            self.mark_dirty(self.start_cell.row, self.start_cell.col)
 
         # Set new start
         self.cells[row][col].type = CELL_START
         self.start_cell = self.cells[row][col]
+        self.mark_dirty(row, col)
 
     def set_end(self, row: int, col: int):
         """Set the end cell."""
@@ -108,28 +139,33 @@ class Grid:
         # Clear previous end if exists
         if self.end_cell:
             self.end_cell.type = CELL_EMPTY
+            self.mark_dirty(self.end_cell.row, self.end_cell.col)
 
         # Set new end
         self.cells[row][col].type = CELL_END
         self.end_cell = self.cells[row][col]
+        self.mark_dirty(row, col)
 
     def set_wall(self, row: int, col: int):
         """Set cell as wall."""
         cell = self.get_cell(row, col)
         if cell and cell.type not in [CELL_START, CELL_END]:
             cell.type = CELL_WALL
+            self.mark_dirty(row, col)
 
     def clear_cell(self, row: int, col: int):
         """Clear cell (make it empty)."""
         cell = self.get_cell(row, col)
         if cell and cell.type not in [CELL_START, CELL_END]:
             cell.type = CELL_EMPTY
+            self.mark_dirty(row, col)
 
     def reset_search_states(self):
         """Reset all cells for new search."""
         for row in self.cells:
             for cell in row:
                 cell.reset_search_state()
+        self.mark_all_dirty(structural=False)
 
     def clear_grid(self):
         """Clear entire grid."""
@@ -138,6 +174,88 @@ class Grid:
                 if cell.type not in [CELL_START, CELL_END]:
                     cell.type = CELL_EMPTY
                 cell.reset_search_state()
+        self.mark_all_dirty()
+
+    def mark_dirty(self, row: int, col: int, structural: bool = True):
+        """Record that a cell changed (structural: its type, not just search state)."""
+        self._dirty_cells.add(row * self.cols + col)
+        if structural:
+            self.version += 1
+
+    def mark_dirty_indices(self, indices):
+        """Record search-state changes of flat cell indices (row * cols + col)."""
+        if hasattr(indices, 'tolist'):
+            indices = indices.tolist()
+        self._dirty_cells.update(indices)
+
+    def mark_all_dirty(self, structural: bool = True):
+        """Record that every cell may have changed."""
+        self._all_dirty = True
+        if structural:
+            self.version += 1
+
+    def take_dirty(self) -> Tuple[bool, List[int]]:
+        """
+        Return changes since the last call and clear the journal.
+
+        Returns:
+            Tuple of (all_dirty, flat indices of changed cells)
+        """
+        all_dirty, cells = self._all_dirty, list(self._dirty_cells)
+        self._all_dirty = False
+        self._dirty_cells = set()
+        return all_dirty, cells
+
+    def to_array(self):
+        """Export cell types as a 2D NumPy uint8 array."""
+        import numpy as np
+
+        return np.array([[cell.type for cell in row] for row in self.cells], dtype=np.uint8)
+
+    def copy(self) -> 'Grid':
+        """Independent grid with the same cell types and start/end (search state is not copied)."""
+        grid = Grid(self.rows, self.cols)
+        grid.load_type_array(self.to_array())
+        if self.start_cell:
+            grid.start_cell = grid.cells[self.start_cell.row][self.start_cell.col]
+        if self.end_cell:
+            grid.end_cell = grid.cells[self.end_cell.row][self.end_cell.col]
+        return grid
+
+    def to_state_array(self):
+        """
+        Export cells as palette indices (PALETTE_*), including search state.
+        Walls/start/end win over path, which wins over visited, then frontier.
+        """
+        import numpy as np
+
+        return np.array([[cell.state_code() for cell in row] for row in self.cells], dtype=np.uint8)
+
+    def load_type_array(self, array, previous=None):
+        """
+        Write cell types from a 2D array into the existing cells (same shape).
+
+        Args:
+            array: Cell types as a (rows, cols) NumPy array
+            previous: The grid's current cell types; when given, only the cells
+                that differ are written and marked dirty
+        """
+        if previous is None:
+            for row_cells, row_types in zip(self.cells, array.tolist()):
+                for cell, cell_type in zip(row_cells, row_types):
+                    cell.type = cell_type
+            self.mark_all_dirty()
+            return
+
+        import numpy as np
+
+        changed = np.flatnonzero(array != previous)
+        cols = self.cols
+        for index, cell_type in zip(changed.tolist(), array.ravel()[changed].tolist()):
+            self.cells[index // cols][index % cols].type = cell_type
+        if len(changed):
+            self.mark_dirty_indices(changed)
+            self.version += 1
 
     def load_from_array(self, array: List[List[int]],
                        start_pos: Optional[Tuple[int, int]] = None,
@@ -157,3 +275,19 @@ class Grid:
 
         if end_pos:
             self.set_end(end_pos[0], end_pos[1])
+
+    def load_from_ndarray(self, types,
+                          start_pos: Optional[Tuple[int, int]] = None,
+                          end_pos: Optional[Tuple[int, int]] = None):
+        """Load grid from a 2D NumPy array of cell types (resizes the grid)."""
+        self.rows, self.cols = (int(n) for n in types.shape)
+        self.start_cell = None
+        self.end_cell = None
+        self._initialize_grid()
+        self.load_type_array(types)
+
+        if start_pos:
+            self.set_start(start_pos[0], start_pos[1])
+
+        if end_pos:
+            self.set_end(end_pos[0], end_pos[1])
@@ -1,12 +1,15 @@
 import random
 from typing import List, Tuple, Optional
 from maze.grid import Grid
-from utils.constants import CELL_WALL, CELL_EMPTY
+from utils.constants import CELL_WALL, CELL_EMPTY, CELL_START, CELL_END
 
 
 class MazeGenerator:
     """Generate random solvable mazes using various algorithms."""
 
+    # Share of removable walls cleared per unit of (1 - complexity) in generate_dfs
+    BRAID_SCALE = 0.2
+
     def __init__(self, grid: Grid):
         self.grid = grid
 
@@ -28,6 +31,7 @@ class MazeGenerator:
 
         # Recursive division
         self._divide(1, 1, self.grid.cols - 2, self.grid.rows - 2, wall_density)
+        self.grid.mark_all_dirty()
 
     def _divide(self, x: int, y: int, width: int, height: int, density: float):
         """Recursively divide the maze into chambers."""
@@ -134,9 +138,130 @@ class MazeGenerator:
             else:
                 stack.pop()
 
-        # Add some random openings based on complexity
+        self.grid.mark_all_dirty()
+
+        # Add loops: clear a share of the walls between two corridors, based on complexity
         if complexity < 1.0:
-            self._add_random_openings(int((1.0 - complexity) * self.grid.rows * self.grid.cols * 0.1))
+            self.braid((1.0 - complexity) * self.BRAID_SCALE)
+
+    def generate_kruskal(self):
+        """
+        Generate a perfect maze using randomized Kruskal's algorithm.
+        Rooms are flat indices; a disjoint set keeps the carved passages acyclic.
+        """
+        import numpy as np
+        from maze.disjoint_set import DisjointSet
+
+        room_rows, room_cols = self._room_shape()
+        rooms = np.arange(room_rows * room_cols, dtype=np.int64).reshape(room_rows, room_cols)
+
+        # Every wall between two adjacent rooms, shuffled in one NumPy call
+        edges_a = np.concatenate([rooms[:, :-1].ravel(), rooms[:-1, :].ravel()])
+        edges_b = np.concatenate([rooms[:, 1:].ravel(), rooms[1:, :].ravel()])
+        order = np.random.default_rng(random.getrandbits(64)).permutation(len(edges_a))
+        edges_a, edges_b = edges_a[order], edges_b[order]
+
+        sets = DisjointSet(room_rows * room_cols)
+        union = sets.union
+        carved = np.zeros(len(edges_a), dtype=bool)
+        remaining = room_rows * room_cols - 1
+
+        for i, (a, b) in enumerate(zip(edges_a.tolist(), edges_b.tolist())):
+            if union(a, b):
+                carved[i] = True
+                remaining -= 1
+                if not remaining:
+                    break
+
+        self._apply_rooms(edges_a[carved], edges_b[carved], room_cols)
+
+    def generate_wilson(self):
+        """
+        Generate a uniform spanning tree maze using Wilson's algorithm
+        (loop-erased random walks). Unbiased, unlike DFS or Kruskal.
+        """
+        room_rows, room_cols = self._room_shape()
+        count = room_rows * room_cols
+        in_tree = bytearray(count)
+        next_room = [0] * count
+        randrange = random.randrange
+
+        in_tree[randrange(count)] = 1
+        tree_a: List[int] = []
+        tree_b: List[int] = []
+
+        for origin in range(count):
+            if in_tree[origin]:
+                continue
+
+            # Random walk until hitting the tree; overwriting next_room erases loops
+            current = origin
+            while not in_tree[current]:
+                r, c = divmod(current, room_cols)
+                while True:
+                    direction = randrange(4)
+                    if direction == 0 and r > 0:
+                        nxt = current - room_cols
+                    elif direction == 1 and r < room_rows - 1:
+                        nxt = current + room_cols
+                    elif direction == 2 and c > 0:
+                        nxt = current - 1
+                    elif direction == 3 and c < room_cols - 1:
+                        nxt = current + 1
+                    else:
+                        continue
+                    break
+                next_room[current] = nxt
+                current = nxt
+
+            # Add the loop-erased path to the tree
+            current = origin
+            while not in_tree[current]:
+                in_tree[current] = 1
+                tree_a.append(current)
+                tree_b.append(next_room[current])
+                current = next_room[current]
+
+        import numpy as np
+
+        self._apply_rooms(np.array(tree_a, dtype=np.int64), np.array(tree_b, dtype=np.int64), room_cols)
+
+    def _room_shape(self) -> Tuple[int, int]:
+        """Size of the room lattice (rooms sit on odd grid coordinates)."""
+        room_rows = (self.grid.rows - 1) // 2
+        room_cols = (self.grid.cols - 1) // 2
+        if room_rows < 1 or room_cols < 1:
+            raise ValueError(f"Grid {self.grid.rows}x{self.grid.cols} is too small for a maze")
+        return room_rows, room_cols
+
+    def _apply_rooms(self, rooms_a, rooms_b, room_cols: int):
+        """Write a room lattice with passages between rooms_a[i] and rooms_b[i] into the grid."""
+        import numpy as np
+
+        cells = np.full((self.grid.rows, self.grid.cols), CELL_WALL, dtype=np.uint8)
+        room_rows = (self.grid.rows - 1) // 2
+        cells[1:2 * room_rows:2, 1:2 * room_cols:2] = CELL_EMPTY
+
+        ra, ca = np.divmod(rooms_a, room_cols)
+        rb, cb = np.divmod(rooms_b, room_cols)
+        cells[ra + rb + 1, ca + cb + 1] = CELL_EMPTY
+
+        self.grid.load_type_array(cells)
+
+    def generate_tiled(self, workers: Optional[int] = None, tile_size: Optional[int] = None,
+                       perfect: bool = True, extra_passages: int = 1):
+        """
+        Generate a large maze by carving tiles in parallel worker processes.
+
+        Args:
+            workers: Number of worker processes (defaults to all cores)
+            tile_size: Tile side length in rooms (defaults to an even split)
+            perfect: Keep the stitched maze perfect (single path between cells)
+            extra_passages: Extra passages per tile boundary when not perfect
+        """
+        from maze.tiled_generator import TiledMazeGenerator
+
+        TiledMazeGenerator(self.grid, workers, tile_size).generate(perfect, extra_passages)
 
     def generate_random_obstacles(self, obstacle_density: float = 0.3):
         """
@@ -165,6 +290,8 @@ class MazeGenerator:
         if self.grid.end_cell:
             self.grid.end_cell.type = CELL_EMPTY
 
+        self.grid.mark_all_dirty()
+
     def generate_binary_tree(self):
         """
         Generate maze using binary tree algorithm.
@@ -195,6 +322,8 @@ class MazeGenerator:
                     wall_row, wall_col = random.choice(neighbors)
                     self.grid.set_wall(wall_row, wall_col)
 
+        self.grid.mark_all_dirty()
+
     def _add_border_walls(self):
         """Add walls around the border of the grid."""
         # Top and bottom borders
@@ -207,15 +336,64 @@ class MazeGenerator:
             self.grid.set_wall(row, 0)
             self.grid.set_wall(row, self.grid.cols - 1)
 
-    def _add_random_openings(self, count: int):
-        """Add random openings to make maze less dense."""
-        for _ in range(count):
-            row = random.randint(1, self.grid.rows - 2)
-            col = random.randint(1, self.grid.cols - 2)
+    def braid(self, loop_fraction: float) -> int:
+        """
+        Add loops by clearing a fraction of the walls that separate two passages.
 
-            cell = self.grid.get_cell(row, col)
-            if cell and cell.type == CELL_WALL:
-                cell.type = CELL_EMPTY
+        A removable wall has passages on two opposite sides and walls on the
+        other two, so clearing it always joins two corridors instead of eroding
+        structure. Candidates are found and sampled in bulk with NumPy.
+
+        Args:
+            loop_fraction: Fraction of removable walls to clear (0.0-1.0)
+
+        Returns:
+            Number of walls removed
+        """
+        import numpy as np
+
+        if self.grid.rows < 3 or self.grid.cols < 3:
+            return 0
+
+        cells = self.grid.to_array()
+        passable = cells != CELL_WALL
+        up, down = passable[:-2, 1:-1], passable[2:, 1:-1]
+        left, right = passable[1:-1, :-2], passable[1:-1, 2:]
+
+        removable = ~passable[1:-1, 1:-1] & (
+            (left & right & ~up & ~down) | (up & down & ~left & ~right)
+        )
+        candidates = np.flatnonzero(removable)
+
+        count = int(round(len(candidates) * max(0.0, min(1.0, loop_fraction))))
+        if count == 0:
+            return 0
+
+        rng = np.random.default_rng(random.getrandbits(64))
+        chosen = rng.choice(candidates, size=count, replace=False)
+        rows, cols = np.divmod(chosen, self.grid.cols - 2)
+
+        opened = cells.copy()
+        opened[rows + 1, cols + 1] = CELL_EMPTY
+        self.grid.load_type_array(opened, previous=cells)
+        return count
+
+    def place_endpoints(self):
+        """
+        Put the start at (1, 1) and the end in the far corner.
+
+        Carving generators only open odd rows and columns, so on an even-sized
+        grid (rows - 2, cols - 2) is a wall; the end snaps to the last odd cell.
+        """
+        # Endpoints overwritten by the generator are not restored by set_start/set_end
+        if self.grid.start_cell and self.grid.start_cell.type != CELL_START:
+            self.grid.start_cell = None
+        if self.grid.end_cell and self.grid.end_cell.type != CELL_END:
+            self.grid.end_cell = None
+
+        self.grid.set_start(1, 1)
+        self.grid.set_end(max(1, (self.grid.rows - 1) // 2 * 2 - 1),
+                          max(1, (self.grid.cols - 1) // 2 * 2 - 1))
 
     def ensure_solvable(self) -> bool:
         """
@@ -290,6 +468,7 @@ class MazeGenerator:
                             # Try breaking through wall
                             if random.random() < 0.3:
                                 neighbor.type = CELL_EMPTY
+                                self.grid.mark_dirty(neighbor.row, neighbor.col)
                                 queue.append(neighbor)
 
             if self.ensure_solvable():
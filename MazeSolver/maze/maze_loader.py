@@ -1,13 +1,17 @@
 import os
-from typing import List, Tuple, Optional
-from PIL import Image
-import numpy as np
+from typing import List, Tuple, Optional, TYPE_CHECKING
 from maze.grid import Grid
-from utils.constants import CELL_EMPTY, CELL_WALL, CELL_START, CELL_END
+from maze.format_registry import FormatRegistry, find_empty_cell
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class MazeLoader:
-    """Load mazes from various file formats."""
+    """Load mazes from various file formats through the format registry."""
+
+    # Compression ratio and decode throughput of the last archive load
+    last_archive_stats: dict = {}
 
     @staticmethod
     def load_from_text(filepath: str) -> Tuple[List[List[int]], Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
@@ -26,35 +30,43 @@ class MazeLoader:
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Maze file not found: {filepath}")
 
-        grid_data = []
-        start_pos = None
-        end_pos = None
-
-        with open(filepath, 'r') as file:
-            for row_idx, line in enumerate(file):
-                line = line.strip()
-                if not line:
-                    continue
-
-                row = []
-                for col_idx, char in enumerate(line):
-                    if char == 'S':
-                        row.append(CELL_EMPTY)
-                        start_pos = (row_idx, col_idx)
-                    elif char == 'E':
-                        row.append(CELL_EMPTY)
-                        end_pos = (row_idx, col_idx)
-                    elif char == '1':
-                        row.append(CELL_WALL)
-                    else:
-                        row.append(CELL_EMPTY)
-
-                grid_data.append(row)
-
-        return grid_data, start_pos, end_pos
+        from utils.text_codec import TextMazeCodec
+
+        return TextMazeCodec.read(filepath)
+
+    @staticmethod
+    def load_from_binary(filepath: str, verify: bool = False) -> Tuple[
+        'np.ndarray', Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        """
+        Load maze from a memory-mapped binary .mazeb file.
+
+        Args:
+            filepath: Path to .mazeb file
+            verify: Check the stored content hash
+
+        Returns:
+            Tuple of (grid_data, start_pos, end_pos) with grid_data as a uint8 array
+        """
+        return MazeLoader.load_array(filepath, 'binary', verify=verify)
+
+    @staticmethod
+    def load_from_archive(filepath: str, workers: Optional[int] = None) -> Tuple[
+        'np.ndarray', Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        """
+        Load maze from a tiled .mazez archive, decompressing tiles in parallel.
+
+        Args:
+            filepath: Path to .mazez file
+            workers: Decoder threads (defaults to os.cpu_count())
+
+        Returns:
+            Tuple of (grid_data, start_pos, end_pos) with grid_data as a uint8 array
+        """
+        return MazeLoader.load_array(filepath, 'archive', workers=workers)
 
     @staticmethod
-    def load_from_image(filepath: str, threshold: int = 128) -> Tuple[
+    def load_from_image(filepath: str, threshold: int = 128, block_size: int = 1,
+                        block_mode: str = 'majority') -> Tuple[
         List[List[int]], Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
         """
         Load maze from image file.
@@ -63,76 +75,80 @@ class MazeLoader:
         Args:
             filepath: Path to image file
             threshold: Brightness threshold (0-255)
+            block_size: Map each block_size x block_size pixel block to one cell
+            block_mode: 'majority' (most pixels dark) or 'minimum' (any pixel dark)
 
         Returns:
             Tuple of (grid_data, start_pos, end_pos)
         """
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"Image file not found: {filepath}")
+        grid_data, start_pos, end_pos = MazeLoader.load_image_array(
+            filepath, threshold, block_size, block_mode
+        )
+        return grid_data.tolist(), start_pos, end_pos
 
-        # Load and convert image to grayscale
-        img = Image.open(filepath).convert('L')
-        img_array = np.array(img)
+    @staticmethod
+    def load_image_array(filepath: str, threshold: int = 128, block_size: int = 1,
+                         block_mode: str = 'majority') -> Tuple[
+        'np.ndarray', Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        """
+        Load maze from image file as a uint8 array of cell types.
 
-        grid_data = []
-        for row in img_array:
-            grid_row = []
-            for pixel in row:
-                if pixel < threshold:
-                    grid_row.append(CELL_WALL)
-                else:
-                    grid_row.append(CELL_EMPTY)
-            grid_data.append(grid_row)
+        Thresholding and block reduction are done on whole arrays, so scanned
+        mazes can be collapsed to their logical resolution cheaply.
 
-        # Auto-detect start (top-left empty) and end (bottom-right empty)
-        start_pos = MazeLoader._find_empty_cell(grid_data, from_start=True)
-        end_pos = MazeLoader._find_empty_cell(grid_data, from_start=False)
+        Returns:
+            Tuple of (grid_data, start_pos, end_pos)
+        """
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"Image file not found: {filepath}")
 
-        return grid_data, start_pos, end_pos
+        return MazeLoader.load_array(filepath, 'image', threshold=threshold,
+                                     block_size=block_size, block_mode=block_mode)
 
     @staticmethod
-    def _find_empty_cell(grid_data: List[List[int]], from_start: bool = True) -> Optional[Tuple[int, int]]:
+    def _find_empty_cell(grid_data, from_start: bool = True) -> Optional[Tuple[int, int]]:
         """Find first empty cell from start or end of grid."""
-        rows = len(grid_data)
-        cols = len(grid_data[0]) if grid_data else 0
-
-        if from_start:
-            for row in range(rows):
-                for col in range(cols):
-                    if grid_data[row][col] == CELL_EMPTY:
-                        return (row, col)
-        else:
-            for row in range(rows - 1, -1, -1):
-                for col in range(cols - 1, -1, -1):
-                    if grid_data[row][col] == CELL_EMPTY:
-                        return (row, col)
-
-        return None
+        return find_empty_cell(grid_data, from_start)
+
+    @staticmethod
+    def load_array(filepath: str, file_type: str = 'auto', **options) -> Tuple[
+        'np.ndarray', Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        """
+        Load any registered format as a uint8 array of cell types.
+
+        Args:
+            filepath: Path to maze file
+            file_type: Registered format name, or 'auto' (extension / magic bytes)
+            **options: Format-specific options (threshold, block_size, verify, workers, ...)
+
+        Returns:
+            Tuple of (grid_data, start_pos, end_pos)
+        """
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"Maze file not found: {filepath}")
+
+        handler = FormatRegistry.resolve(filepath, file_type)
+        result = handler.load_array(filepath, **options)
+
+        if handler.name == 'archive':
+            MazeLoader.last_archive_stats = handler.last_stats
+        return result
 
     @staticmethod
-    def load_into_grid(grid: Grid, filepath: str, file_type: str = 'auto'):
+    def load_into_grid(grid: Grid, filepath: str, file_type: str = 'auto', **options):
         """
         Load maze directly into Grid object.
 
         Args:
             grid: Grid instance to load into
             filepath: Path to maze file
-            file_type: 'text', 'image', or 'auto' (detect from extension)
+            file_type: 'text', 'image', 'binary', 'archive', or 'auto' (detect from extension)
+            **options: Format-specific options passed to the handler
         """
-        if file_type == 'auto':
-            ext = os.path.splitext(filepath)[1].lower()
-            if ext in ['.txt', '.maze']:
-                file_type = 'text'
-            elif ext in ['.png', '.jpg', '.jpeg', '.bmp']:
-                file_type = 'image'
-            else:
-                raise ValueError(f"Unknown file type: {ext}")
-
-        if file_type == 'text':
-            grid_data, start, end = MazeLoader.load_from_text(filepath)
-        elif file_type == 'image':
-            grid_data, start, end = MazeLoader.load_from_image(filepath)
-        else:
-            raise ValueError(f"Invalid file type: {file_type}")
-
-        grid.load_from_array(grid_data, start, end)
+        grid_data, start, end = MazeLoader.load_array(filepath, file_type, **options)
+        grid.load_from_ndarray(grid_data, start, end)
+
+    @staticmethod
+    def save_grid(grid: Grid, filepath: str, file_type: str = 'auto', **options) -> str:
+        """Save a Grid in any registered format."""
+        return FormatRegistry.resolve(filepath, file_type).save(grid, filepath, **options)
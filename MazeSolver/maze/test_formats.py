@@ -0,0 +1,220 @@
+"""Round-trip and corruption tests for the maze file formats."""
+
+import os
+import random
+import tempfile
+
+import numpy as np
+
+from maze.grid import Grid
+from maze.maze_generator import MazeGenerator
+from maze.binary_format import BinaryMazeFormat
+from maze.archive_format import MazeArchive
+
+
+def make_maze(rows: int = 31, cols: int = 45, seed: int = 7) -> np.ndarray:
+    """Cell-type array of a seeded Kruskal maze."""
+    random.seed(seed)
+    grid = Grid(rows, cols)
+    MazeGenerator(grid).generate_kruskal()
+    return grid.to_array()
+
+
+def test_binary_round_trip():
+    """A .mazeb file loads back to the same walls, endpoints and cost layers."""
+    walls = make_maze()
+    costs = np.random.default_rng(1).random(walls.shape).astype(np.float32)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "maze.mazeb")
+        BinaryMazeFormat.save(path, walls, (1, 1), (29, 43), {'cost': costs})
+        loaded, start, end, layers = BinaryMazeFormat.load(path, verify=True)
+
+        assert (loaded == walls).all()
+        assert start == (1, 1) and end == (29, 43)
+        assert (layers['cost'] == costs).all()
+        del layers  # Release the memory map before the directory is removed
+
+
+def test_binary_truncated():
+    """A truncated .mazeb file is rejected even without verify."""
+    walls = make_maze()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "maze.mazeb")
+        BinaryMazeFormat.save(path, walls, (1, 1), (29, 43))
+        with open(path, 'rb') as file:
+            data = file.read()
+        with open(path, 'wb') as file:
+            file.write(data[:-16])
+
+        try:
+            BinaryMazeFormat.load(path)
+        except ValueError as e:
+            assert "Truncated" in str(e)
+        else:
+            raise AssertionError("truncated file loaded without error")
+
+
+def test_archive_round_trip():
+    """Both codecs round-trip a grid whose size is not a multiple of the tile size."""
+    walls = make_maze(45, 71)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for codec in ('zlib', 'lzma'):
+            path = os.path.join(directory, f"maze_{codec}.mazez")
+            MazeArchive.save(path, walls, (1, 1), (43, 69), tile_size=16, codec=codec)
+
+            archive = MazeArchive(path)
+            assert (archive.tile_rows, archive.tile_cols) == (3, 5)
+            assert archive.codec == codec
+            assert archive.start_pos == (1, 1) and archive.end_pos == (43, 69)
+            assert (archive.load(workers=2) == walls).all()
+            assert (archive.load_tile(2, 4) == walls[32:45, 64:71]).all()
+            del archive
+
+
+def test_archive_rejects_bad_tile_size():
+    """tile_size 0 is a ValueError when writing and when reading a corrupt header."""
+    walls = make_maze(9, 9)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "maze.mazez")
+        for action in ('save', 'load'):
+            try:
+                if action == 'save':
+                    MazeArchive.save(path, walls, tile_size=0)
+                else:
+                    MazeArchive.save(path, walls, tile_size=4)
+                    with open(path, 'r+b') as file:
+                        file.seek(16)  # tile size field
+                        file.write((0).to_bytes(4, 'little'))
+                    MazeArchive(path)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"tile_size 0 accepted on {action}")
+
+
+def reference_image_cells(pixels: np.ndarray, threshold: int, block_size: int, block_mode: str):
+    """Per-pixel reduction of each block_size x block_size block (reference for the vectorized import)."""
+    rows = -(-pixels.shape[0] // block_size)
+    cols = -(-pixels.shape[1] // block_size)
+    cells = []
+    for block_row in range(rows):
+        row = []
+        for block_col in range(cols):
+            dark = total = 0
+            darkest = 255
+            for y in range(block_row * block_size, (block_row + 1) * block_size):
+                for x in range(block_col * block_size, (block_col + 1) * block_size):
+                    # Pixels past the edge repeat the border pixel
+                    pixel = int(pixels[min(y, pixels.shape[0] - 1), min(x, pixels.shape[1] - 1)])
+                    dark += pixel < threshold
+                    total += 1
+                    darkest = min(darkest, pixel)
+            is_wall = dark * 2 > total if block_mode == 'majority' else darkest < threshold
+            row.append(1 if is_wall else 0)
+        cells.append(row)
+    return cells
+
+
+def test_image_block_reduce():
+    """Vectorized image import matches the per-pixel reduction for every block size and mode."""
+    from PIL import Image
+    from maze.maze_loader import MazeLoader
+
+    pixels = np.random.default_rng(3).integers(0, 256, size=(23, 37), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "maze.png")
+        Image.fromarray(pixels, 'L').save(path)
+
+        for block_size in (1, 2, 3, 4, 8):
+            for block_mode in ('majority', 'minimum'):
+                cells, start, end = MazeLoader.load_from_image(path, 100, block_size, block_mode)
+                expected = reference_image_cells(pixels, 100, block_size, block_mode)
+                assert cells == expected, (block_size, block_mode)
+
+                empty = [(r, c) for r, row in enumerate(expected) for c, cell in enumerate(row) if cell == 0]
+                assert (start, end) == ((empty[0], empty[-1]) if empty else (None, None))
+
+
+def test_image_save_round_trip():
+    """Saving through the registry and loading back keeps the walls and the grid size."""
+    from maze.format_registry import MazeFormat
+    from maze.maze_loader import MazeLoader
+
+    class LoadOnly(MazeFormat):
+        def load_array(self, filepath, **options):
+            return None
+
+    try:
+        LoadOnly()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("format handler without save() was instantiated")
+
+    walls = make_maze(21, 33)
+    grid = Grid(1, 1)
+    grid.load_from_ndarray(walls, (1, 1), (19, 31))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "maze.png")
+        MazeLoader.save_grid(grid, path, cell_size=3)
+        types, start, end = MazeLoader.load_array(path, block_size=3)
+        assert (types == (grid.to_array() == 1)).all()
+        assert start == (1, 1) and end == (19, 31)
+
+
+def test_streaming_reader_matches_full_load():
+    """Streamed rows and tiles equal a full load, with and without the .rowidx.npz cache."""
+    from maze.text_stream import StreamingMazeReader
+    from utils.text_codec import TextMazeCodec
+
+    walls = make_maze(41, 57)
+    ragged = "1101\r\n\r\n10S\r\n111111\r\n\r\n0E1\r\n"
+
+    with tempfile.TemporaryDirectory() as directory:
+        fixed_path = os.path.join(directory, "maze.txt")
+        TextMazeCodec.write(fixed_path, walls, (1, 1), (39, 55))
+        ragged_path = os.path.join(directory, "ragged.txt")
+        with open(ragged_path, 'w', newline='') as file:
+            file.write(ragged)
+
+        for path in (fixed_path, ragged_path):
+            types, _, start, end = TextMazeCodec.read_array(path)
+            with open(path) as file:
+                raw_rows = [i for i, line in enumerate(file) if line.strip()]
+
+            for use_cache in (False, True, True):  # The second cached pass reads the saved index
+                with StreamingMazeReader(path, chunk_size=64, use_cache=use_cache) as reader:
+                    assert os.path.exists(reader.index_path) == use_cache
+                    assert (reader.read_rows(0, reader.rows) == types).all()
+                    assert (reader.read_tile(3, 9, 2, 5) == types[3:9, 2:5]).all()
+                    chunks = np.concatenate([block for _, block in reader.iter_row_chunks(4)])
+                    assert (chunks == types).all()
+
+                    # The reader counts grid rows, the full load counts raw file lines
+                    for streamed, loaded in ((reader.start_pos, start), (reader.end_pos, end)):
+                        assert loaded == (raw_rows[streamed[0]], streamed[1])
+
+
+def main():
+    """Run maze format tests."""
+    test_binary_round_trip()
+    test_binary_truncated()
+    print("Binary format: round trip and truncation ok")
+    test_archive_round_trip()
+    test_archive_rejects_bad_tile_size()
+    print("Archive: round trip for zlib and lzma, bad tile size rejected")
+    test_image_block_reduce()
+    print("Image import: block reduce matches the per-pixel result")
+    test_image_save_round_trip()
+    print("Image export: round trip through the registry ok")
+    test_streaming_reader_matches_full_load()
+    print("Streaming reader matches a full load")
+
+
+if __name__ == "__main__":
+    main()
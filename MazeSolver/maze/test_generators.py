@@ -0,0 +1,117 @@
+"""Test and benchmark script for maze generators."""
+
+import time
+from collections import deque
+
+from maze.grid import Grid
+from maze.maze_generator import MazeGenerator
+
+
+GENERATORS = {
+    'DFS': lambda gen: gen.generate_dfs(complexity=1.0),
+    'Kruskal': lambda gen: gen.generate_kruskal(),
+    'Wilson': lambda gen: gen.generate_wilson(),
+    'Tiled': lambda gen: gen.generate_tiled(workers=2, tile_size=8),
+}
+
+
+def is_perfect(grid: Grid) -> bool:
+    """Check that open cells form a single tree (connected, no loops)."""
+    types = grid.to_array()
+    open_cells = list(zip(*(types == 0).nonzero()))
+    if not open_cells:
+        return False
+
+    seen = {open_cells[0]}
+    queue = deque([open_cells[0]])
+    edges = 0
+
+    while queue:
+        row, col = queue.popleft()
+        for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+            neighbor = (row + dr, col + dc)
+            if 0 <= neighbor[0] < grid.rows and 0 <= neighbor[1] < grid.cols and types[neighbor] == 0:
+                edges += 1
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+
+    return len(seen) == len(open_cells) and edges // 2 == len(open_cells) - 1
+
+
+def test_generators_are_perfect():
+    """Every perfect-maze generator should produce a spanning tree."""
+    for name, generate in GENERATORS.items():
+        for rows, cols in [(5, 5), (21, 31), (30, 40)]:
+            grid = Grid(rows, cols)
+            generate(MazeGenerator(grid))
+            assert is_perfect(grid), f"{name} {rows}x{cols} is not a perfect maze"
+
+
+def test_braid_clears_corridor_walls():
+    """Braiding clears exactly the reported number of walls, all between two corridors."""
+    import random
+
+    random.seed(3)
+    grid = Grid(41, 41)
+    generator = MazeGenerator(grid)
+    generator.generate_kruskal()
+    before = grid.to_array()
+
+    removed = generator.braid(0.5)
+    after = grid.to_array()
+    cleared = list(zip(*(before != after).nonzero()))
+
+    assert removed > 0 and len(cleared) == removed
+    for row, col in cleared:
+        horizontal = before[row, col - 1] == 0 and before[row, col + 1] == 0
+        vertical = before[row - 1, col] == 0 and before[row + 1, col] == 0
+        assert horizontal != vertical, f"({row}, {col}) does not separate two corridors"
+
+
+def test_even_size_endpoints():
+    """Rendering an even-sized maze keeps every generated wall and a reachable end."""
+    import random
+    from utils.constants import CELL_WALL
+    from utils.offline_renderer import build_grid
+
+    for name in ('dfs', 'kruskal', 'wilson', 'tiled'):
+        random.seed(11)
+        reference = Grid(30, 40)
+        getattr(MazeGenerator(reference), f"generate_{name}")()
+
+        grid = build_grid({'generator': name, 'rows': 30, 'cols': 40, 'seed': 11})
+        walls = (grid.to_array() == CELL_WALL).sum()
+        assert walls == (reference.to_array() == CELL_WALL).sum(), f"{name} lost walls"
+        assert (grid.end_cell.row, grid.end_cell.col) == (27, 37)
+        assert MazeGenerator(grid).ensure_solvable()
+
+
+def benchmark(sizes=(51, 101, 201, 401)):
+    """Time each generator across grid sizes."""
+    print(f"\n{'Size':>10}" + "".join(f"{name:>12}" for name in GENERATORS))
+    print("-" * (10 + 12 * len(GENERATORS)))
+
+    for size in sizes:
+        timings = []
+        for generate in GENERATORS.values():
+            grid = Grid(size, size)
+            start = time.perf_counter()
+            generate(MazeGenerator(grid))
+            timings.append(time.perf_counter() - start)
+        print(f"{size:>4}x{size:<5}" + "".join(f"{t * 1000:>10.1f}ms" for t in timings))
+
+
+def main():
+    """Run generator tests and benchmark."""
+    test_generators_are_perfect()
+    print("All generators produce perfect mazes")
+    test_braid_clears_corridor_walls()
+    print("Braiding clears corridor walls only")
+    test_even_size_endpoints()
+    print("Even-sized renders keep their walls")
+    benchmark()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Streaming access to huge text mazes by row range or tile.
+
+The file is scanned once in fixed-size chunks to index where each row
+starts; the index is cached next to the maze as ``<file>.rowidx.npz`` and
+reused while the file size and modification time match. Rows are then read
+through a memory map, so memory use is bounded by the requested region.
+
+Expects files written by FileUtils.save_maze_to_text: no leading
+whitespace, LF or CRLF line endings. Blank lines are skipped; start and
+end positions are reported in grid rows (blank lines not counted).
+"""
+
+import os
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from utils.constants import CELL_EMPTY, CELL_WALL
+
+
+class StreamingMazeReader:
+    """Index a text maze once, then page in arbitrary rows or tiles."""
+
+    INDEX_SUFFIX = '.rowidx.npz'
+
+    def __init__(self, filepath: str, chunk_size: int = 16 * 1024 * 1024, use_cache: bool = True):
+        """
+        Args:
+            filepath: Path to text maze
+            chunk_size: Bytes scanned per read while building the index
+            use_cache: Load/save the row index next to the file
+        """
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"Maze file not found: {filepath}")
+
+        self.filepath = filepath
+        self.chunk_size = chunk_size
+        self.index_path = filepath + self.INDEX_SUFFIX
+
+        stat = os.stat(filepath)
+        self._signature = np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+        if not (use_cache and self._load_index()):
+            self._build_index()
+            if use_cache:
+                self._save_index()
+
+        self._data = np.memmap(filepath, dtype=np.uint8, mode='r') if stat.st_size else np.zeros(0, np.uint8)
+        self.rows = len(self.row_starts)
+        self.cols = int(self.row_lengths.max()) if self.rows else 0
+
+        # Fixed-width files can be viewed as one 2D array without per-row work
+        self._stride = None
+        if self.rows and (self.row_lengths == self.cols).all():
+            steps = np.diff(self.row_starts)
+            if len(steps) == 0 or (steps == steps[0]).all():
+                self._stride = int(steps[0]) if len(steps) else self.cols
+
+    def _build_index(self):
+        """Scan the file in chunks and record row offsets and lengths."""
+        newlines = []
+        start_hits = []
+        end_hits = []
+        offset = 0
+
+        with open(self.filepath, 'rb') as file:
+            while True:
+                chunk = file.read(self.chunk_size)
+                if not chunk:
+                    break
+                data = np.frombuffer(chunk, dtype=np.uint8)
+                newlines.append(np.flatnonzero(data == ord('\n')) + offset)
+                start_hits.append(np.flatnonzero(data == ord('S'))[-1:] + offset)
+                end_hits.append(np.flatnonzero(data == ord('E'))[-1:] + offset)
+                offset += len(chunk)
+
+        size = offset
+        breaks = np.concatenate(newlines) if newlines else np.zeros(0, dtype=np.int64)
+        starts = np.concatenate([[0], breaks + 1]).astype(np.int64)
+        ends = np.concatenate([breaks, [size]]).astype(np.int64)
+
+        # Drop CR of CRLF endings, then blank lines
+        if size:
+            data = np.memmap(self.filepath, dtype=np.uint8, mode='r')
+            has_cr = (ends > starts) & (data[np.maximum(ends - 1, 0)] == ord('\r'))
+            ends = ends - has_cr
+            del data
+        lengths = ends - starts
+        keep = lengths > 0
+        self.row_starts = starts[keep]
+        self.row_lengths = lengths[keep]
+
+        self.start_pos = self._locate(start_hits)
+        self.end_pos = self._locate(end_hits)
+
+    def _locate(self, hits) -> Optional[Tuple[int, int]]:
+        """Convert the last byte offset among hits into a (row, col) position."""
+        hits = np.concatenate(hits) if hits else np.zeros(0, dtype=np.int64)
+        if not len(hits):
+            return None
+        position = int(hits[-1])
+        row = int(np.searchsorted(self.row_starts, position, side='right')) - 1
+        return row, position - int(self.row_starts[row])
+
+    def _load_index(self) -> bool:
+        """Load a cached index if it matches the current file."""
+        if not os.path.exists(self.index_path):
+            return False
+        try:
+            with np.load(self.index_path) as cached:
+                if not np.array_equal(cached['signature'], self._signature):
+                    return False
+                self.row_starts = cached['row_starts']
+                self.row_lengths = cached['row_lengths']
+                positions = cached['positions']
+        except (OSError, KeyError, ValueError):
+            return False
+
+        self.start_pos = tuple(int(v) for v in positions[0]) if positions[0, 0] >= 0 else None
+        self.end_pos = tuple(int(v) for v in positions[1]) if positions[1, 0] >= 0 else None
+        return True
+
+    def _save_index(self):
+        """Write the index next to the maze file (best effort)."""
+        positions = np.array([self.start_pos or (-1, -1), self.end_pos or (-1, -1)], dtype=np.int64)
+        try:
+            with open(self.index_path, 'wb') as file:
+                np.savez(file, signature=self._signature, row_starts=self.row_starts,
+                         row_lengths=self.row_lengths, positions=positions)
+        except OSError:
+            pass
+
+    def read_chars(self, row_start: int, row_end: int, col_start: int = 0,
+                   col_end: Optional[int] = None) -> np.ndarray:
+        """Raw characters of a region; short rows are padded with '0'."""
+        row_start, row_end = max(0, row_start), min(self.rows, row_end)
+        col_end = self.cols if col_end is None else min(self.cols, col_end)
+        col_start = max(0, min(col_start, col_end))
+        height, width = max(0, row_end - row_start), col_end - col_start
+
+        if self._stride is not None and height:
+            base = int(self.row_starts[row_start])
+            view = self._data[base:base + height * self._stride]
+            if len(view) < height * self._stride:
+                # Last row of a file without a trailing newline
+                view = np.concatenate([view, np.zeros(height * self._stride - len(view), np.uint8)])
+            return np.array(view.reshape(height, self._stride)[:, col_start:col_end])
+
+        chars = np.full((height, width), ord('0'), dtype=np.uint8)
+        for out_row, row in enumerate(range(row_start, row_end)):
+            length = min(int(self.row_lengths[row]), col_end) - col_start
+            if length > 0:
+                base = int(self.row_starts[row]) + col_start
+                chars[out_row, :length] = self._data[base:base + length]
+        return chars
+
+    def read_tile(self, row_start: int, row_end: int, col_start: int = 0,
+                  col_end: Optional[int] = None) -> np.ndarray:
+        """Cell types (CELL_WALL / CELL_EMPTY) of rows [row_start, row_end) x [col_start, col_end)."""
+        chars = self.read_chars(row_start, row_end, col_start, col_end)
+        return np.where(chars == ord('1'), CELL_WALL, CELL_EMPTY).astype(np.uint8)
+
+    def read_rows(self, row_start: int, row_end: int) -> np.ndarray:
+        """Cell types of full rows [row_start, row_end)."""
+        return self.read_tile(row_start, row_end)
+
+    def iter_row_chunks(self, rows_per_chunk: int = 1024) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yield (first_row, types) blocks covering the whole maze."""
+        for row_start in range(0, self.rows, rows_per_chunk):
+            yield row_start, self.read_rows(row_start, row_start + rows_per_chunk)
+
+    def close(self):
+        """Release the memory map."""
+        self._data = np.zeros(0, np.uint8)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,182 @@
+"""Parallel tiled maze generation using worker processes and shared memory."""
+
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from maze.disjoint_set import DisjointSet
+from maze.grid import Grid
+from utils.constants import CELL_EMPTY, CELL_WALL
+
+
+def _carve_rooms(cells: np.ndarray, r0: int, r1: int, c0: int, c1: int, rng: random.Random):
+    """
+    Carve a perfect maze over rooms [r0, r1) x [c0, c1) with an iterative DFS.
+
+    Rooms live on odd grid coordinates (room r is grid row 2r + 1), like in
+    MazeGenerator.generate_dfs. Only cells strictly inside the tile are written.
+    """
+    h, w = r1 - r0, c1 - c0
+    visited = bytearray(h * w)
+    start = rng.randrange(h * w)
+    visited[start] = 1
+    stack = [start]
+    wall_rows: List[int] = []
+    wall_cols: List[int] = []
+
+    while stack:
+        current = stack[-1]
+        r, c = divmod(current, w)
+
+        options = []
+        if r > 0 and not visited[current - w]:
+            options.append(current - w)
+        if r < h - 1 and not visited[current + w]:
+            options.append(current + w)
+        if c > 0 and not visited[current - 1]:
+            options.append(current - 1)
+        if c < w - 1 and not visited[current + 1]:
+            options.append(current + 1)
+
+        if options:
+            nxt = rng.choice(options)
+            visited[nxt] = 1
+            nr, nc = divmod(nxt, w)
+            # Wall between rooms sits halfway between their grid coordinates
+            wall_rows.append(2 * r0 + r + nr + 1)
+            wall_cols.append(2 * c0 + c + nc + 1)
+            stack.append(nxt)
+        else:
+            stack.pop()
+
+    cells[2 * r0 + 1:2 * r1:2, 2 * c0 + 1:2 * c1:2] = CELL_EMPTY
+    if wall_rows:
+        cells[wall_rows, wall_cols] = CELL_EMPTY
+
+
+def _carve_tile(shm_name: str, shape: Tuple[int, int],
+                bounds: Tuple[int, int, int, int], seed: int):
+    """Worker entry point: attach to the shared grid and carve one tile in place."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        cells = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+        _carve_rooms(cells, *bounds, random.Random(seed))
+        del cells
+    finally:
+        shm.close()
+
+
+class TiledMazeGenerator:
+    """Generate one large maze by carving tiles in parallel and stitching them."""
+
+    def __init__(self, grid: Grid, workers: Optional[int] = None, tile_size: Optional[int] = None):
+        """
+        Args:
+            grid: Grid to generate into
+            workers: Number of worker processes (defaults to os.cpu_count())
+            tile_size: Tile side length in rooms (defaults to an even split across workers)
+        """
+        self.grid = grid
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.tile_size = tile_size
+
+    def generate(self, perfect: bool = True, extra_passages: int = 1):
+        """
+        Generate a tiled maze.
+
+        Args:
+            perfect: If True, tiles are joined along a spanning tree so the result
+                     is a perfect maze; otherwise every tile boundary gets passages
+            extra_passages: Passages opened on each non-tree boundary when not perfect
+        """
+        rows, cols = self.grid.rows, self.grid.cols
+        room_rows = (rows - 1) // 2
+        room_cols = (cols - 1) // 2
+        if room_rows < 1 or room_cols < 1:
+            raise ValueError(f"Grid {rows}x{cols} is too small for a maze")
+
+        row_bounds, col_bounds = self._split(room_rows, room_cols)
+        tiles = [(r0, r1, c0, c1) for r0, r1 in row_bounds for c0, c1 in col_bounds]
+        seeds = [random.getrandbits(32) for _ in tiles]
+
+        shm = shared_memory.SharedMemory(create=True, size=rows * cols)
+        try:
+            cells = np.ndarray((rows, cols), dtype=np.uint8, buffer=shm.buf)
+            cells.fill(CELL_WALL)
+
+            if self.workers == 1 or len(tiles) == 1:
+                for bounds, seed in zip(tiles, seeds):
+                    _carve_tile(shm.name, (rows, cols), bounds, seed)
+            else:
+                with ProcessPoolExecutor(max_workers=min(self.workers, len(tiles))) as executor:
+                    list(executor.map(_carve_tile, [shm.name] * len(tiles),
+                                      [(rows, cols)] * len(tiles), tiles, seeds))
+
+            self._stitch(cells, row_bounds, col_bounds, perfect, extra_passages)
+            result = cells.copy()
+            del cells
+        finally:
+            shm.close()
+            shm.unlink()
+
+        self.grid.load_type_array(result)
+
+    def _split(self, room_rows: int, room_cols: int):
+        """Split the room lattice into row and column tile bounds."""
+        tile_size = self.tile_size
+        if not tile_size:
+            tile_size = max(8, math.ceil(math.sqrt(room_rows * room_cols / self.workers)))
+
+        def bounds(n: int) -> List[Tuple[int, int]]:
+            return [(start, min(start + tile_size, n)) for start in range(0, n, tile_size)]
+
+        return bounds(room_rows), bounds(room_cols)
+
+    def _stitch(self, cells: np.ndarray, row_bounds, col_bounds, perfect: bool, extra_passages: int):
+        """Open passages between adjacent tiles."""
+        tile_rows, tile_cols = len(row_bounds), len(col_bounds)
+        count = tile_rows * tile_cols
+
+        # Every boundary between two adjacent tiles, as (tile_a, tile_b)
+        edges = []
+        for tr in range(tile_rows):
+            for tc in range(tile_cols):
+                tile = tr * tile_cols + tc
+                if tc + 1 < tile_cols:
+                    edges.append((tile, tile + 1))
+                if tr + 1 < tile_rows:
+                    edges.append((tile, tile + tile_cols))
+        random.shuffle(edges)
+
+        # Randomized Kruskal over tiles picks a spanning tree of boundaries
+        tile_sets = DisjointSet(count)
+        for a, b in edges:
+            if tile_sets.union(a, b):
+                self._open_boundary(cells, a, b, tile_cols, row_bounds, col_bounds, 1)
+            elif not perfect:
+                self._open_boundary(cells, a, b, tile_cols, row_bounds, col_bounds, extra_passages)
+
+    @staticmethod
+    def _open_boundary(cells: np.ndarray, a: int, b: int, tile_cols: int,
+                       row_bounds, col_bounds, passages: int):
+        """Open up to `passages` walls on the boundary between tiles a and b."""
+        ar, ac = divmod(a, tile_cols)
+        br, bc = divmod(b, tile_cols)
+
+        if ar == br:
+            # Horizontal neighbours: vertical boundary at the first column of b
+            r0, r1 = row_bounds[ar]
+            wall_col = 2 * col_bounds[bc][0]
+            for room in random.sample(range(r0, r1), min(passages, r1 - r0)):
+                cells[2 * room + 1, wall_col] = CELL_EMPTY
+        else:
+            # Vertical neighbours: horizontal boundary at the first row of b
+            c0, c1 = col_bounds[ac]
+            wall_row = 2 * row_bounds[br][0]
+            for room in random.sample(range(c0, c1), min(passages, c1 - c0)):
+                cells[wall_row, 2 * room + 1] = CELL_EMPTY
@@ -0,0 +1,314 @@
+"""Streaming GIF / APNG encoders with frame differencing.
+
+Frames are appended one at a time as palette-index arrays (PALETTE_*
+values) or RGB arrays, which are mapped onto a fixed palette built from the
+color constants. Each frame is compared with the previous one and only the
+bounding box of changed pixels is written; unchanged frames extend the
+previous frame's duration. At most the previous full frame and one pending
+cropped frame are held in memory.
+"""
+
+import io
+import os
+import struct
+import zlib
+from typing import Optional, Tuple
+
+import numpy as np
+
+from utils.constants import (
+    PALETTE_COLORS, COLOR_BACKGROUND, COLOR_GRID_LINE, COLOR_TEXT
+)
+
+
+def build_palette() -> np.ndarray:
+    """
+    Fixed 256-color palette shared by all encoders.
+
+    Indices 0-6 are PALETTE_COLORS, so palette-index arrays from
+    Grid.to_state_array() encode without conversion. Remaining UI colors and
+    a 6x6x6 color cube cover screen captures.
+    """
+    colors = list(PALETTE_COLORS) + [COLOR_BACKGROUND, COLOR_GRID_LINE, COLOR_TEXT,
+                                     (0, 0, 0), (255, 255, 255)]
+    levels = (0, 51, 102, 153, 204, 255)
+    colors += [(r, g, b) for r in levels for g in levels for b in levels]
+    colors += [(0, 0, 0)] * (256 - len(colors))
+    return np.array(colors[:256], dtype=np.uint8)
+
+
+FIXED_PALETTE = build_palette()
+
+
+class AnimationEncoder:
+    """Base class: frame differencing and duration merging; subclasses write chunks."""
+
+    # Longest duration one frame can store (ms); longer holds are split across frames
+    MAX_DURATION = 65535
+
+    def __init__(self, filepath: str, duration: int = 50, loop: int = 0):
+        """
+        Args:
+            filepath: Output path
+            duration: Default frame duration in milliseconds
+            loop: Number of loops (0 = forever)
+        """
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.filepath = filepath
+        self.duration = duration
+        self.loop = loop
+        self.size: Optional[Tuple[int, int]] = None  # (width, height)
+
+        self._file = open(filepath, 'wb')
+        self._previous: Optional[np.ndarray] = None
+        self._pending = None  # (x, y, indices, duration)
+
+        self.frames_in = 0
+        self.frames_written = 0
+
+    def to_indices(self, frame) -> np.ndarray:
+        """Convert a palette-index (H, W) or RGB (H, W, 3) array to palette indices."""
+        frame = np.asarray(frame)
+        if frame.ndim == 2:
+            return frame.astype(np.uint8, copy=False)
+        if frame.ndim != 3 or frame.shape[2] < 3:
+            raise ValueError(f"Unsupported frame shape: {frame.shape}")
+
+        from PIL import Image
+
+        palette_image = Image.new('P', (1, 1))
+        palette_image.putpalette(FIXED_PALETTE.ravel().tolist())
+        rgb = Image.fromarray(np.ascontiguousarray(frame[:, :, :3], dtype=np.uint8), 'RGB')
+        return np.asarray(rgb.quantize(palette=palette_image, dither=Image.Dither.NONE))
+
+    def append(self, frame, duration: Optional[int] = None):
+        """
+        Add one frame.
+
+        Args:
+            frame: (H, W) palette indices or (H, W, 3) RGB array
+            duration: Frame duration in milliseconds (defaults to self.duration)
+        """
+        if self._file is None:
+            raise ValueError("Encoder is closed")
+
+        indices = self.to_indices(frame)
+        duration = self.duration if duration is None else duration
+        height, width = indices.shape
+
+        if self._previous is None:
+            self.size = (width, height)
+            self._write_header()
+            box = (0, 0, width, height)
+        else:
+            if indices.shape != self._previous.shape:
+                raise ValueError(f"Frame size changed from {self._previous.shape} to {indices.shape}")
+            box = self._changed_box(self._previous, indices)
+
+        self.frames_in += 1
+        if box is None:
+            # Nothing changed: show the pending frame longer
+            x, y, data, pending_duration = self._pending
+            self._pending = (x, y, data, pending_duration + duration)
+            return
+
+        self._flush_pending()
+        x0, y0, x1, y1 = box
+        self._pending = (x0, y0, indices[y0:y1, x0:x1].copy(), duration)
+        self._previous = indices.copy()
+
+    @staticmethod
+    def _changed_box(previous: np.ndarray, current: np.ndarray):
+        """(x0, y0, x1, y1) bounding box of differing pixels, or None."""
+        diff = previous != current
+        rows = np.flatnonzero(diff.any(axis=1))
+        if not len(rows):
+            return None
+        cols = np.flatnonzero(diff.any(axis=0))
+        return int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1
+
+    def _flush_pending(self):
+        if self._pending is None:
+            return
+        x, y, data, duration = self._pending
+        self._pending = None
+
+        self._write_frame(x, y, data, min(duration, self.MAX_DURATION))
+        self.frames_written += 1
+
+        # The rest of a long hold repeats one unchanged pixel
+        remaining = duration - self.MAX_DURATION
+        while remaining > 0:
+            self._write_frame(x, y, data[:1, :1], min(remaining, self.MAX_DURATION))
+            self.frames_written += 1
+            remaining -= self.MAX_DURATION
+
+    def close(self):
+        """Write the last frame and finish the file."""
+        if self._file is None:
+            return
+        self._flush_pending()
+        if self._previous is not None:
+            self._write_trailer()
+        self._file.close()
+        self._file = None
+        self._previous = None
+
+    def _write_header(self):
+        raise NotImplementedError
+
+    def _write_frame(self, x: int, y: int, indices: np.ndarray, duration: int):
+        raise NotImplementedError
+
+    def _write_trailer(self):
+        raise NotImplementedError
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class GifEncoder(AnimationEncoder):
+    """Streaming GIF writer; LZW data for each cropped frame comes from Pillow."""
+
+    MAX_DURATION = 655350  # 65535 centiseconds
+
+    def _write_header(self):
+        width, height = self.size
+        # Global color table flag, 8-bit color resolution, 256 entries
+        self._file.write(b'GIF89a' + struct.pack('<HHBBB', width, height, 0xF7, 0, 0))
+        self._file.write(FIXED_PALETTE.tobytes())
+        # NETSCAPE2.0 looping extension
+        self._file.write(b'\x21\xFF\x0BNETSCAPE2.0\x03\x01' + struct.pack('<H', self.loop) + b'\x00')
+
+    def _write_frame(self, x: int, y: int, indices: np.ndarray, duration: int):
+        from PIL import Image
+
+        image = Image.fromarray(indices, 'P')
+        image.putpalette(FIXED_PALETTE.ravel().tolist())
+        buffer = io.BytesIO()
+        image.save(buffer, 'GIF', optimize=False, interlace=False)
+        flags, color_table, image_data = self._split_gif(buffer.getvalue())
+
+        # Graphic control extension: do not dispose, delay in centiseconds
+        delay = max(1, round(duration / 10))
+        self._file.write(b'\x21\xF9\x04' + struct.pack('<BHBB', 0x04, delay, 0, 0))
+
+        height, width = indices.shape
+        self._file.write(b'\x2C' + struct.pack('<HHHHB', x, y, width, height, flags))
+        self._file.write(color_table)
+        self._file.write(image_data)
+
+    @staticmethod
+    def _split_gif(data: bytes):
+        """
+        Extract (descriptor flags, color table, LZW data) from a single-frame GIF.
+
+        If Pillow wrote a palette other than FIXED_PALETTE, it is kept as a
+        local color table so the frame still decodes correctly.
+        """
+        packed = data[10]
+        position = 13
+        global_table = b''
+        if packed & 0x80:
+            table_size = 3 << ((packed & 7) + 1)
+            global_table = data[position:position + table_size]
+            position += table_size
+
+        # Skip extensions up to the image descriptor
+        while data[position] == 0x21:
+            position += 2
+            while data[position]:
+                position += data[position] + 1
+            position += 1
+        if data[position] != 0x2C:
+            raise ValueError("Unexpected GIF structure")
+
+        flags = data[position + 9]
+        position += 10
+        if flags & 0x80:
+            table_size = 3 << ((flags & 7) + 1)
+            color_table = data[position:position + table_size]
+            position += table_size
+        else:
+            color_table = global_table
+            flags = 0x80 | (flags & 0x40) | ((packed & 7) if global_table else 0)
+
+        if color_table == FIXED_PALETTE.tobytes():
+            color_table = b''
+            flags &= 0x40
+
+        # LZW minimum code size, then data sub-blocks up to the terminator
+        start = position
+        position += 1
+        while data[position]:
+            position += data[position] + 1
+        return flags, color_table, data[start:position + 1]
+
+    def _write_trailer(self):
+        self._file.write(b'\x3B')
+
+
+class ApngEncoder(AnimationEncoder):
+    """Streaming APNG writer (8-bit palette, zlib per frame)."""
+
+    SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+    def __init__(self, filepath: str, duration: int = 50, loop: int = 0, compress_level: int = 6):
+        super().__init__(filepath, duration, loop)
+        self.compress_level = compress_level
+        self._sequence = 0
+        self._actl_offset = 0
+
+    def _chunk(self, kind: bytes, payload: bytes):
+        self._file.write(struct.pack('>I', len(payload)) + kind + payload)
+        self._file.write(struct.pack('>I', zlib.crc32(kind + payload) & 0xFFFFFFFF))
+
+    def _write_header(self):
+        width, height = self.size
+        self._file.write(self.SIGNATURE)
+        self._chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 3, 0, 0, 0))
+        self._chunk(b'PLTE', FIXED_PALETTE.tobytes())
+        # Frame count is patched in close()
+        self._actl_offset = self._file.tell()
+        self._chunk(b'acTL', struct.pack('>II', 0, self.loop))
+
+    def _write_frame(self, x: int, y: int, indices: np.ndarray, duration: int):
+        height, width = indices.shape
+        self._chunk(b'fcTL', struct.pack('>IIIIIHHBB', self._sequence, width, height, x, y,
+                                         duration, 1000, 0, 0))
+        self._sequence += 1
+
+        # Filter type 0 (None) in front of every scanline
+        rows = np.zeros((height, width + 1), dtype=np.uint8)
+        rows[:, 1:] = indices
+        data = zlib.compress(rows.tobytes(), self.compress_level)
+
+        if self.frames_written == 0:
+            self._chunk(b'IDAT', data)
+        else:
+            self._chunk(b'fdAT', struct.pack('>I', self._sequence) + data)
+            self._sequence += 1
+
+    def _write_trailer(self):
+        self._chunk(b'IEND', b'')
+        end = self._file.tell()
+        self._file.seek(self._actl_offset)
+        self._chunk(b'acTL', struct.pack('>II', self.frames_written, self.loop))
+        self._file.seek(end)
+
+
+ENCODERS = {'.gif': GifEncoder, '.png': ApngEncoder, '.apng': ApngEncoder}
+
+
+def open_encoder(filepath: str, duration: int = 50, loop: int = 0) -> AnimationEncoder:
+    """Create a GIF or APNG encoder based on the file extension."""
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext not in ENCODERS:
+        raise ValueError(f"Unsupported animation format: {ext}. Available: {', '.join(ENCODERS)}")
+    return ENCODERS[ext](filepath, duration, loop)
@@ -7,6 +7,8 @@ CELL_SIZE = 20
 
 # Frame Rate
 FPS = 60
+IDLE_FPS = 15       # Start/end pulse repaint rate while idle (0 = wait for input only)
+IDLE_DELAY = 1.0    # Seconds without input or activity before going idle
 
 # Colors (RGB)
 COLOR_BACKGROUND = (15, 15, 25)
@@ -32,6 +34,25 @@ CELL_START = 2
 CELL_END = 3
 CELL_PATH = 4
 
+# Palette indices for array-based rendering and export
+# (base cell types share their CELL_* values)
+PALETTE_EMPTY = 0
+PALETTE_WALL = 1
+PALETTE_START = 2
+PALETTE_END = 3
+PALETTE_VISITED = 4
+PALETTE_FRONTIER = 5
+PALETTE_PATH = 6
+
+# Screen colors by palette index
+PALETTE_COLORS = [
+    COLOR_EMPTY, COLOR_WALL, COLOR_START, COLOR_END,
+    COLOR_VISITED, COLOR_FRONTIER, COLOR_PATH,
+]
+
+# Grids with at least this many cells render through pygame.surfarray
+ARRAY_RENDER_THRESHOLD = 10000
+
 # Direction Vectors (for pathfinding)
 DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # Right, Down, Left, Up
 DIRECTIONS_8 = [(0, 1), (1, 0), (0, -1), (-1, 0),
@@ -1,17 +1,17 @@
-import pygame
 import os
 from datetime import datetime
 from typing import Optional, Tuple
-from PIL import Image
-import numpy as np
+from utils.constants import COLOR_VISITED, COLOR_FRONTIER, COLOR_PATH
 
 
 class ExportTools:
     """Tools for exporting mazes and visualizations."""
 
     @staticmethod
-    def screenshot(screen: pygame.Surface, filename: Optional[str] = None) -> str:
+    def screenshot(screen: 'pygame.Surface', filename: Optional[str] = None) -> str:
         """Take screenshot of current screen."""
+        import pygame
+
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"outputs/screenshot_{timestamp}.png"
@@ -20,46 +20,52 @@ class ExportTools:
         pygame.image.save(screen, filename)
         return filename
 
-    @staticmethod
-    def export_maze_as_image(grid, filename: str, cell_size: int = 20):
-        """Export maze as image file."""
-        from maze.grid import Grid
-
-        width = grid.cols * cell_size
-        height = grid.rows * cell_size
-
-        # Create image
-        img = Image.new('RGB', (width, height), color=(255, 255, 255))
-        pixels = img.load()
-
-        for row in grid.cells:
-            for cell in row:
-                x_start = cell.col * cell_size
-                y_start = cell.row * cell_size
-
-                # Determine color
-                if cell.type == 1:  # Wall
-                    color = (0, 0, 0)
-                elif cell.type == 2:  # Start
-                    color = (0, 255, 0)
-                elif cell.type == 3:  # End
-                    color = (255, 0, 0)
-                else:
-                    color = (255, 255, 255)
-
-                # Fill cell
-                for dx in range(cell_size):
-                    for dy in range(cell_size):
-                        if x_start + dx < width and y_start + dy < height:
-                            pixels[x_start + dx, y_start + dy] = color
+    # Export colors by palette index (PALETTE_*); search layers use screen colors
+    EXPORT_COLORS = [
+        (255, 255, 255),  # Empty
+        (0, 0, 0),        # Wall
+        (0, 255, 0),      # Start
+        (255, 0, 0),      # End
+        COLOR_VISITED,
+        COLOR_FRONTIER,
+        COLOR_PATH,
+    ]
 
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+    @staticmethod
+    def export_maze_as_image(grid, filename: str, cell_size: int = 20, include_search: bool = False):
+        """
+        Export maze as image file.
+
+        Builds a palette-index array from the grid, maps it to RGB through a
+        color lookup table, upscales it by array repetition and hands it to
+        Pillow in one call. Any format Pillow can write is accepted.
+
+        Args:
+            grid: Grid to export
+            filename: Output image path
+            cell_size: Pixels per cell
+            include_search: Overlay visited/frontier/path layers
+        """
+        import numpy as np
+        from PIL import Image
+
+        codes = grid.to_state_array() if include_search else grid.to_array()
+        lut = np.array(ExportTools.EXPORT_COLORS, dtype=np.uint8)
+        pixels = np.repeat(np.repeat(lut[codes], cell_size, axis=0), cell_size, axis=1)
+
+        img = Image.fromarray(pixels, 'RGB')
+
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
         img.save(filename)
         return filename
 
     @staticmethod
-    def create_animation_frames(screen: pygame.Surface, frame_dir: str = "outputs/frames"):
+    def create_animation_frames(screen: 'pygame.Surface', frame_dir: str = "outputs/frames"):
         """Save animation frame."""
+        import pygame
+
         os.makedirs(frame_dir, exist_ok=True)
 
         # Count existing frames
@@ -71,25 +77,25 @@ class ExportTools:
 
     @staticmethod
     def frames_to_gif(frame_dir: str = "outputs/frames", output_file: str = "outputs/animation.gif", duration: int = 50):
-        """Convert animation frames to GIF."""
+        """
+        Convert animation frames to GIF (or APNG for .png/.apng output).
+
+        Frames are streamed through the encoder one at a time, so memory use
+        does not grow with the length of the recording.
+        """
         try:
             from PIL import Image
             import glob
+            import numpy as np
+            from utils.animation_encoder import open_encoder
 
-            frames = []
             frame_files = sorted(glob.glob(os.path.join(frame_dir, "frame_*.png")))
 
-            for frame_file in frame_files:
-                frames.append(Image.open(frame_file))
-
-            if frames:
-                frames[0].save(
-                    output_file,
-                    save_all=True,
-                    append_images=frames[1:],
-                    duration=duration,
-                    loop=0
-                )
+            if frame_files:
+                with open_encoder(output_file, duration) as encoder:
+                    for frame_file in frame_files:
+                        with Image.open(frame_file) as frame:
+                            encoder.append(np.asarray(frame.convert('RGB')))
                 print(f"Created GIF: {output_file}")
                 return output_file
         except Exception as e:
@@ -1,7 +1,5 @@
 import os
 from typing import List, Tuple, Optional
-from PIL import Image
-import numpy as np
 
 
 class FileUtils:
@@ -14,66 +12,26 @@ class FileUtils:
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"File not found: {filepath}")
 
-        grid_data = []
-        start_pos = None
-        end_pos = None
+        from utils.text_codec import TextMazeCodec
 
-        with open(filepath, 'r') as file:
-            for row_idx, line in enumerate(file):
-                line = line.strip()
-                if not line:
-                    continue
-
-                row = []
-                for col_idx, char in enumerate(line):
-                    if char == 'S':
-                        row.append(0)
-                        start_pos = (row_idx, col_idx)
-                    elif char == 'E':
-                        row.append(0)
-                        end_pos = (row_idx, col_idx)
-                    elif char == '1':
-                        row.append(1)
-                    else:
-                        row.append(0)
-
-                grid_data.append(row)
-
-        return grid_data, start_pos, end_pos
+        return TextMazeCodec.read(filepath)
 
     @staticmethod
     def save_maze_to_text(grid: List[List[int]], filepath: str,
                           start_pos: Optional[Tuple[int, int]] = None,
                           end_pos: Optional[Tuple[int, int]] = None):
         """Save maze to text file."""
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        from utils.text_codec import TextMazeCodec
 
-        with open(filepath, 'w') as file:
-            for row_idx, row in enumerate(grid):
-                line = ""
-                for col_idx, cell in enumerate(row):
-                    if start_pos and (row_idx, col_idx) == start_pos:
-                        line += 'S'
-                    elif end_pos and (row_idx, col_idx) == end_pos:
-                        line += 'E'
-                    elif cell == 1:
-                        line += '1'
-                    else:
-                        line += '0'
-                file.write(line + '\n')
+        TextMazeCodec.write(filepath, grid, start_pos, end_pos)
 
     @staticmethod
     def load_maze_from_image(filepath: str, threshold: int = 128) -> List[List[int]]:
         """Load maze from image file."""
-        img = Image.open(filepath).convert('L')
-        img_array = np.array(img)
-
-        grid_data = []
-        for row in img_array:
-            grid_row = [1 if pixel < threshold else 0 for pixel in row]
-            grid_data.append(grid_row)
+        from maze.format_registry import FormatRegistry
 
-        return grid_data
+        grid_data, _start, _end = FormatRegistry.get('image').load_array(filepath, threshold=threshold)
+        return grid_data.tolist()
 
     @staticmethod
     def create_sample_maze(filepath: str) -> None:
@@ -1,5 +1,7 @@
 import pygame
 import os
+from collections import OrderedDict
+from typing import Dict, Tuple
 
 
 class FontManager:
@@ -24,3 +26,66 @@ class FontManager:
             FontManager._fonts[key] = font
 
         return FontManager._fonts[key]
+
+    @staticmethod
+    def get_default_font(size: int = 24) -> pygame.font.Font:
+        """Get pygame's default font (Font(None, size)) with caching."""
+        key = (None, size)
+
+        if key not in FontManager._fonts:
+            FontManager._fonts[key] = pygame.font.Font(None, size)
+
+        return FontManager._fonts[key]
+
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces keyed by (text, font, color, antialias).
+
+    Returned surfaces are shared between callers and must only be blitted,
+    never drawn on.
+    """
+
+    def __init__(self, capacity: int = 512):
+        self.capacity = max(1, capacity)
+        self._surfaces: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int],
+               antialias: bool = True) -> pygame.Surface:
+        """Return the rendered text, calling font.render only on a cache miss."""
+        key = (text, font, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Drop all cached surfaces (counters are kept)."""
+        self._surfaces.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Cache counters for display or logging."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._surfaces),
+        }
+
+
+# Shared cache for all UI text
+text_cache = TextCache()
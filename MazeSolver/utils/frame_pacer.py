@@ -0,0 +1,164 @@
+"""Frame pacing for the main loop: one clock, accurate dt and frame-time statistics."""
+
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+
+class FramePacer:
+    """
+    Pace the main loop at a target frame rate.
+
+    Deadlines are absolute (each one interval after the previous), so time
+    spent handling events, updating and rendering is subtracted from the
+    sleep automatically. The sleep wakes up early by the measured oversleep
+    of previous frames (at most SPIN_LIMIT) and busy-waits the rest, so an
+    idle loop spins for no more than about a millisecond per frame.
+    When the loop falls more than a frame behind, missed deadlines are
+    dropped instead of being caught up in a burst, and should_render() lets
+    the loop skip a few renders to catch up.
+    """
+
+    SPIN_LIMIT = 0.001  # Longest busy-wait before a deadline, in seconds
+
+    def __init__(self, fps: float = 60, history: int = 600, max_dt: float = 0.25,
+                 max_skip: int = 4, clock: Callable[[], float] = time.perf_counter,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            fps: Target frames per second
+            history: Frame times kept for statistics
+            max_dt: Upper bound for dt (e.g. after the window was dragged)
+            max_skip: Maximum consecutive skipped renders
+            clock: Time source in seconds (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.interval = 1.0 / fps
+        self.max_dt = max_dt
+        self.max_skip = max_skip
+        self.clock = clock
+        self.sleep = sleep
+
+        self._times = deque(maxlen=history)
+        self._last = None
+        self._next = 0.0
+        self._oversleep = 0.0  # Moving average of how late sleep() returns
+        self._skipped = 0
+
+        self.frames = 0
+        self.dropped = 0
+        self.skipped_renders = 0
+
+    def tick(self) -> float:
+        """
+        Wait for the next frame deadline.
+
+        Returns:
+            Seconds since the previous tick (capped at max_dt)
+        """
+        now = self.clock()
+        if self._last is None:
+            self._last = now
+            self._next = now + self.interval
+            return self.interval
+
+        self._wait_until(self._next)
+        now = self.clock()
+
+        frame_time = now - self._last
+        self._last = now
+        self._times.append(frame_time)
+        self.frames += 1
+
+        # Next deadline; if we are already past it, drop the missed frames
+        self._next += self.interval
+        if now > self._next:
+            missed = int((now - self._next) / self.interval) + 1
+            self.dropped += missed
+            self._next += missed * self.interval
+
+        return min(frame_time, self.max_dt)
+
+    def resync(self) -> float:
+        """
+        Restart pacing after the loop waited elsewhere (e.g. idle on input),
+        without counting the wait as frame time or dropped frames.
+
+        Returns:
+            Seconds since the previous tick (capped at max_dt)
+        """
+        now = self.clock()
+        elapsed = now - self._last if self._last is not None else self.interval
+        self._last = now
+        self._next = now + self.interval
+        return min(elapsed, self.max_dt)
+
+    def _wait_until(self, deadline: float):
+        """Sleep until shortly before the deadline, then spin for the rest (at most SPIN_LIMIT)."""
+        remaining = deadline - self.clock()
+        if remaining <= 0:
+            return
+
+        # A coarse system timer makes the frame late rather than burning a core
+        coarse = remaining - min(self._oversleep, self.SPIN_LIMIT)
+        if coarse > 0:
+            before = self.clock()
+            self.sleep(coarse)
+            late = (self.clock() - before) - coarse
+            self._oversleep = 0.9 * self._oversleep + 0.1 * max(0.0, late)
+
+        # Sleep again if the wake-up came early
+        remaining = deadline - self.clock()
+        while remaining > self.SPIN_LIMIT:
+            self.sleep(remaining - self.SPIN_LIMIT)
+            remaining = deadline - self.clock()
+
+        while self.clock() < deadline:
+            pass
+
+    def should_render(self) -> bool:
+        """False when the frame is already past its deadline (at most max_skip times in a row)."""
+        if self._last is not None and self.clock() > self._next and self._skipped < self.max_skip:
+            self._skipped += 1
+            self.skipped_renders += 1
+            return False
+        self._skipped = 0
+        return True
+
+    def reset_stats(self):
+        """Clear frame-time history and counters."""
+        self._times.clear()
+        self.frames = 0
+        self.dropped = 0
+        self.skipped_renders = 0
+
+    @staticmethod
+    def _percentile(ordered, fraction: float) -> float:
+        """Nearest-rank percentile of an ascending list."""
+        index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+        return ordered[index]
+
+    def get_stats(self, last: Optional[int] = None) -> Dict[str, float]:
+        """
+        Frame-time statistics in milliseconds over the recent history, plus counters.
+
+        Args:
+            last: Only use the most recent `last` frames
+        """
+        times = list(self._times)[-last:] if last else self._times
+        ordered = sorted(times)
+        if not ordered:
+            return {'frames': self.frames, 'mean': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0,
+                    'fps': 0.0, 'dropped': self.dropped, 'skipped': self.skipped_renders}
+
+        mean = sum(ordered) / len(ordered)
+        return {
+            'frames': self.frames,
+            'mean': mean * 1000,
+            'p95': self._percentile(ordered, 0.95) * 1000,
+            'p99': self._percentile(ordered, 0.99) * 1000,
+            'max': ordered[-1] * 1000,
+            'fps': 1.0 / mean if mean else 0.0,
+            'dropped': self.dropped,
+            'skipped': self.skipped_renders,
+        }
@@ -0,0 +1,179 @@
+"""Background frame recording with a bounded in-memory ring buffer."""
+
+import os
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+
+class FrameRecorder:
+    """
+    Record frames without stalling the render loop.
+
+    capture() only copies the surface into a bounded buffer; a worker thread
+    converts, encodes and writes the frames. When the buffer is full, the overflow
+    policy decides what happens:
+        'drop_newest' - discard the incoming frame (default)
+        'drop_oldest' - ring behaviour, discard the oldest buffered frame
+        'block'       - backpressure, wait for the worker to catch up
+
+    Frames are written as numbered PNGs, or streamed into a single GIF/APNG
+    when start() is given an output file.
+    """
+
+    POLICIES = ('drop_newest', 'drop_oldest', 'block')
+
+    def __init__(self, frame_dir: str = "outputs/frames", capacity: int = 64,
+                 policy: str = 'drop_newest', compress_level: int = 1, frame_duration: int = 50):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown policy: {policy}. Available: {', '.join(self.POLICIES)}")
+
+        self.frame_dir = frame_dir
+        self.capacity = max(1, capacity)
+        self.policy = policy
+        self.compress_level = compress_level
+        self.frame_duration = frame_duration
+
+        self._buffer = deque()
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._recording = False
+        self._encoder = None
+
+        self.next_frame = 0
+        self.captured = 0
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+
+    @property
+    def recording(self) -> bool:
+        """True while frames are being accepted."""
+        return self._recording
+
+    def start(self, output_file: Optional[str] = None):
+        """
+        Start recording and the encoder thread.
+
+        Args:
+            output_file: Stream frames into this .gif/.apng instead of PNG files
+        """
+        if self._recording:
+            return
+        if self._worker:
+            # A recording stopped with wait=False may still be draining into the buffer/encoder
+            self._worker.join()
+            self._worker = None
+
+        if output_file:
+            from utils.animation_encoder import open_encoder
+
+            self._encoder = open_encoder(output_file, self.frame_duration)
+            self.next_frame = 0
+        else:
+            os.makedirs(self.frame_dir, exist_ok=True)
+            # Continue numbering after frames already on disk (counted once, not per frame)
+            self.next_frame = len([f for f in os.listdir(self.frame_dir)
+                                   if f.startswith('frame_') and f.endswith('.png')])
+        self.captured = self.written = self.dropped = self.errors = 0
+
+        self._recording = True
+        self._worker = threading.Thread(target=self._run, name="FrameRecorder", daemon=True)
+        self._worker.start()
+
+    def stop(self, wait: bool = True):
+        """
+        Stop accepting frames; optionally wait until buffered frames are written.
+        Without waiting, the worker finishes in the background (start() waits for it).
+        """
+        if not self._worker:
+            return
+
+        with self._cond:
+            self._recording = False
+            self._cond.notify_all()
+
+        if wait:
+            self._worker.join()
+            self._worker = None
+
+    def capture(self, surface) -> bool:
+        """Copy the surface into the buffer. Returns False if the frame was dropped."""
+        if not self._recording:
+            return False
+
+        # A surface-to-surface copy is the cheapest snapshot; conversion happens on the worker
+        frame = surface.copy()
+
+        with self._cond:
+            if len(self._buffer) >= self.capacity:
+                if self.policy == 'block':
+                    self._cond.wait_for(lambda: len(self._buffer) < self.capacity or not self._recording)
+                elif self.policy == 'drop_oldest':
+                    self._buffer.popleft()
+                    self.dropped += 1
+                else:
+                    self.dropped += 1
+                    return False
+
+            if not self._recording:
+                return False
+
+            self._buffer.append((self.next_frame, frame))
+            self.next_frame += 1
+            self.captured += 1
+            self._cond.notify_all()
+
+        return True
+
+    def _run(self):
+        """Worker loop: encode buffered frames until stopped and drained, then close the encoder."""
+        try:
+            while True:
+                with self._cond:
+                    self._cond.wait_for(lambda: self._buffer or not self._recording)
+                    if not self._buffer:
+                        return
+                    number, frame = self._buffer.popleft()
+                    self._cond.notify_all()
+
+                try:
+                    self._write(number, frame)
+                    self.written += 1
+                except Exception as e:
+                    self.errors += 1
+                    print(f"Error writing frame {number}: {e}")
+        finally:
+            if self._encoder:
+                self._encoder.close()
+                self._encoder = None
+
+    def _write(self, number: int, frame):
+        """Encode one frame as PNG, or append it to the animation encoder."""
+        import pygame
+        from PIL import Image
+
+        to_bytes = getattr(pygame.image, 'tobytes', None) or pygame.image.tostring
+        if self._encoder:
+            import numpy as np
+
+            width, height = frame.get_size()
+            pixels = np.frombuffer(to_bytes(frame, 'RGB'), dtype=np.uint8).reshape(height, width, 3)
+            self._encoder.append(pixels)
+            return
+
+        filename = os.path.join(self.frame_dir, f"frame_{number:04d}.png")
+        image = Image.frombytes('RGB', frame.get_size(), to_bytes(frame, 'RGB'))
+        image.save(filename, compress_level=self.compress_level)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Frame counters for display or logging."""
+        with self._cond:
+            pending = len(self._buffer)
+        return {
+            'captured': self.captured,
+            'written': self.written,
+            'dropped': self.dropped,
+            'pending': pending,
+            'errors': self.errors,
+        }
@@ -2,12 +2,27 @@
 
 
 class LayoutManager:
-    """Calculate and manage layout dimensions."""
+    """Calculate and manage layout dimensions and the grid camera."""
+
+    # The grid viewport never grows beyond this; larger grids are panned and zoomed
+    MAX_VIEW_WIDTH = 960
+    MAX_VIEW_HEIGHT = 720
+
+    # Zoom levels as (pixels per cell, cells per pixel); below 1 px/cell cells are aggregated
+    ZOOM_LEVELS = [(1, 64), (1, 32), (1, 16), (1, 8), (1, 4), (1, 2), (1, 1),
+                   (2, 1), (3, 1), (4, 1), (6, 1), (8, 1), (12, 1), (16, 1),
+                   (20, 1), (24, 1), (32, 1), (48, 1), (64, 1)]
 
     def __init__(self, grid_rows: int, grid_cols: int, cell_size: int = 20):
         self.grid_rows = grid_rows
         self.grid_cols = grid_cols
+        self.base_cell_size = cell_size
+
+        # Camera: current zoom level and the viewport's offset into the zoomed grid image
         self.cell_size = cell_size
+        self.cells_per_pixel = 1
+        self.view_x = 0
+        self.view_y = 0
 
         # Margins and spacing
         self.top_margin = 40
@@ -21,9 +36,20 @@ class LayoutManager:
 
     def _calculate_layout(self):
         """Calculate all layout dimensions."""
-        # Grid dimensions
-        self.grid_width = self.grid_cols * self.cell_size
-        self.grid_height = self.grid_rows * self.cell_size
+        # Zoom levels always include the configured cell size; the largest one
+        # that shows the whole grid (up to that size) is the initial view
+        self.zoom_levels = sorted(set(self.ZOOM_LEVELS) | {(self.base_cell_size, 1)},
+                                  key=lambda level: level[0] / level[1])
+        fitting = [level for level in self.zoom_levels
+                   if level[0] <= self.base_cell_size and self._fits(*level)]
+        self.min_zoom_level = self.zoom_levels.index(fitting[-1]) if fitting else 0
+        self.cell_size, self.cells_per_pixel = self.zoom_levels[self.min_zoom_level]
+        self.view_x = self.view_y = 0
+
+        # Grid viewport dimensions
+        image_width, image_height = self.image_size()
+        self.grid_width = min(image_width, self.MAX_VIEW_WIDTH)
+        self.grid_height = min(image_height, self.MAX_VIEW_HEIGHT)
 
         # Grid position
         self.grid_x = self.left_margin
@@ -46,27 +72,144 @@ class LayoutManager:
         self.status_bar_height = 50
 
     def update_grid_size(self, rows: int, cols: int, cell_size: int = None):
-        """Update grid size and recalculate layout."""
+        """Update grid size and recalculate layout (resets the camera)."""
         self.grid_rows = rows
         self.grid_cols = cols
         if cell_size:
-            self.cell_size = cell_size
+            self.base_cell_size = cell_size
         self._calculate_layout()
 
+    #  CAMERA
+    def _fits(self, cell_size: int, cells_per_pixel: int) -> bool:
+        """True if the whole grid fits in the maximum viewport at this zoom level."""
+        width, height = self.image_size(cell_size, cells_per_pixel)
+        return width <= self.MAX_VIEW_WIDTH and height <= self.MAX_VIEW_HEIGHT
+
+    def image_size(self, cell_size: int = None, cells_per_pixel: int = None):
+        """(width, height) of the whole grid in pixels at the given (default: current) zoom."""
+        cell_size = cell_size or self.cell_size
+        step = cells_per_pixel or self.cells_per_pixel
+        return (-(-self.grid_cols * cell_size // step), -(-self.grid_rows * cell_size // step))
+
+    @property
+    def zoom(self) -> float:
+        """Pixels per cell (below 1 when cells are aggregated)."""
+        return self.cell_size / self.cells_per_pixel
+
+    @property
+    def shows_whole_grid(self) -> bool:
+        """True if every cell is visible at its own pixel size (no pan, zoom or aggregation)."""
+        return (self.cells_per_pixel == 1 and self.view_x == 0 and self.view_y == 0
+                and self.image_size() == (self.grid_width, self.grid_height))
+
+    @property
+    def detail_level(self) -> str:
+        """
+        Level of detail for the current zoom:
+            'detail'    - cells with grid lines
+            'cells'     - one block per cell, no grid lines
+            'aggregate' - several cells per pixel
+        """
+        if self.cells_per_pixel > 1:
+            return 'aggregate'
+        return 'detail' if self.cell_size >= 4 else 'cells'
+
+    def camera_key(self):
+        """Hashable camera state; changes whenever the visible image changes."""
+        return (self.cell_size, self.cells_per_pixel, self.view_x, self.view_y)
+
+    def clamp_camera(self):
+        """Keep the viewport inside the grid image."""
+        image_width, image_height = self.image_size()
+        self.view_x = max(0, min(self.view_x, image_width - self.grid_width))
+        self.view_y = max(0, min(self.view_y, image_height - self.grid_height))
+
+    def pan(self, dx: int, dy: int) -> bool:
+        """Move the camera by screen pixels. Returns True if the view changed."""
+        before = self.camera_key()
+        self.view_x += int(dx)
+        self.view_y += int(dy)
+        self.clamp_camera()
+        return self.camera_key() != before
+
+    def zoom_at(self, steps: int, x: int = None, y: int = None) -> bool:
+        """
+        Change the zoom level, keeping the grid point under (x, y) in place.
+
+        Args:
+            steps: Zoom levels to move (positive zooms in)
+            x, y: Screen anchor; defaults to the viewport center
+
+        Returns:
+            True if the zoom changed
+        """
+        index = self.zoom_levels.index((self.cell_size, self.cells_per_pixel))
+        new_index = max(self.min_zoom_level, min(index + steps, len(self.zoom_levels) - 1))
+        if new_index == index:
+            return False
+
+        if x is None or y is None or not self.in_viewport(x, y):
+            x = self.grid_x + self.grid_width // 2
+            y = self.grid_y + self.grid_height // 2
+        px, py = x - self.grid_x, y - self.grid_y
+
+        # Anchor in cell units, then back to pixels at the new zoom
+        anchor_col = (px + self.view_x) / self.zoom
+        anchor_row = (py + self.view_y) / self.zoom
+        self.cell_size, self.cells_per_pixel = self.zoom_levels[new_index]
+        self.view_x = round(anchor_col * self.zoom) - px
+        self.view_y = round(anchor_row * self.zoom) - py
+        self.clamp_camera()
+        return True
+
+    def reset_camera(self) -> bool:
+        """Zoom out to the initial view of the whole grid. Returns True if the view changed."""
+        before = self.camera_key()
+        self.cell_size, self.cells_per_pixel = self.zoom_levels[self.min_zoom_level]
+        self.view_x = self.view_y = 0
+        return self.camera_key() != before
+
+    def in_viewport(self, x: int, y: int) -> bool:
+        """True if the screen point lies inside the grid viewport."""
+        return (self.grid_x <= x < self.grid_x + self.grid_width and
+                self.grid_y <= y < self.grid_y + self.grid_height)
+
+    def visible_range(self):
+        """
+        (first_row, end_row, first_col, end_col) of the cells inside the viewport.
+        When cells are aggregated, the first row/col are multiples of cells_per_pixel.
+        """
+        step = self.cells_per_pixel
+        offset_x, offset_y = self.view_offset()
+        first_col = (self.view_x // self.cell_size) * step
+        first_row = (self.view_y // self.cell_size) * step
+        end_col = first_col + -(-(self.grid_width + offset_x) // self.cell_size) * step
+        end_row = first_row + -(-(self.grid_height + offset_y) // self.cell_size) * step
+        return first_row, min(end_row, self.grid_rows), first_col, min(end_col, self.grid_cols)
+
+    def view_offset(self):
+        """Pixels of the first visible (partial) cell that lie left of / above the viewport."""
+        return self.view_x % self.cell_size, self.view_y % self.cell_size
+
+    #  COORDINATES
     def get_cell_from_pos(self, x: int, y: int):
         """Convert screen coordinates to grid cell coordinates."""
-        if (self.grid_x <= x < self.grid_x + self.grid_width and
-            self.grid_y <= y < self.grid_y + self.grid_height):
-
-            col = (x - self.grid_x) // self.cell_size
-            row = (y - self.grid_y) // self.cell_size
+        if self.in_viewport(x, y):
+            step = self.cells_per_pixel
+            col = (x - self.grid_x + self.view_x) * step // self.cell_size
+            row = (y - self.grid_y + self.view_y) * step // self.cell_size
 
             if 0 <= row < self.grid_rows and 0 <= col < self.grid_cols:
                 return (row, col)
         return None
 
     def get_cell_rect(self, row: int, col: int):
-        """Get screen rectangle for a cell."""
-        x = self.grid_x + col * self.cell_size
-        y = self.grid_y + row * self.cell_size
+        """Get screen rectangle for a cell (one shared pixel when cells are aggregated)."""
+        step = self.cells_per_pixel
+        x = self.grid_x + col * self.cell_size // step - self.view_x
+        y = self.grid_y + row * self.cell_size // step - self.view_y
         return (x, y, self.cell_size, self.cell_size)
+
+    def get_view_rect(self):
+        """Screen rectangle of the grid viewport."""
+        return (self.grid_x, self.grid_y, self.grid_width, self.grid_height)
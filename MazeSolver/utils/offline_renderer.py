@@ -0,0 +1,232 @@
+"""Headless rendering of search animations from find_path_batched events.
+
+No display or pygame is needed: each search event updates a palette-index
+array (PALETTE_*), frames are upscaled with NumPy and streamed into a
+GIF/APNG encoder. Batches of renders run in separate processes.
+
+Usage:
+    python -m utils.offline_renderer --maze outputs/saved_maze.txt -a bfs astar
+    python -m utils.offline_renderer --generate dfs --count 100 --workers 8
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Generator, List, Optional
+
+import numpy as np
+
+from maze.grid import Grid
+from utils.constants import (
+    CELL_EMPTY, PALETTE_VISITED, PALETTE_FRONTIER, PALETTE_PATH
+)
+
+# Higher rank wins, matching Grid.to_state_array (path > visited > frontier)
+STATE_RANK = np.zeros(256, dtype=np.uint8)
+STATE_RANK[PALETTE_FRONTIER] = 1
+STATE_RANK[PALETTE_VISITED] = 2
+STATE_RANK[PALETTE_PATH] = 3
+
+
+class OfflineRenderer:
+    """Render an algorithm's search on a grid to an animation file."""
+
+    def __init__(self, grid: Grid, cell_size: int = 8, steps_per_frame: float = 1.0,
+                 frame_duration: int = 40, final_hold: int = 1000):
+        """
+        Args:
+            grid: Grid with start and end set
+            cell_size: Pixels per cell
+            steps_per_frame: Search events per frame; values below 1 hold each step
+                for several frames
+            frame_duration: Milliseconds per frame
+            final_hold: Extra milliseconds to show the finished search
+        """
+        if steps_per_frame <= 0:
+            raise ValueError("steps_per_frame must be positive")
+
+        self.grid = grid
+        self.cell_size = cell_size
+        self.steps_per_frame = steps_per_frame
+        self.frame_duration = frame_duration
+        self.final_hold = final_hold
+
+    def frames(self, algorithm_name: str) -> Generator[np.ndarray, None, dict]:
+        """
+        Run the algorithm and yield the cell-level palette array after every
+        steps_per_frame events. The same array object is updated in place.
+
+        Returns:
+            Algorithm stats plus the number of search events
+        """
+        from algorithms.algorithm_factory import AlgorithmFactory
+
+        codes = self.grid.to_array()
+        cols = self.grid.cols
+        open_cells = (codes == CELL_EMPTY).ravel()
+        flat = codes.ravel()
+
+        algorithm = AlgorithmFactory.create(algorithm_name, self.grid)
+        chunks = algorithm.find_path_batched(4096)
+
+        yield codes
+        steps = 0.0
+        count = 0
+
+        while True:
+            try:
+                indices, event_codes = next(chunks)
+            except StopIteration as stop:
+                result = stop.value
+                break
+
+            for index, code in zip(indices.tolist(), event_codes.tolist()):
+                if open_cells[index] and STATE_RANK[code] > STATE_RANK[flat[index]]:
+                    flat[index] = code
+
+                count += 1
+                steps += 1
+                while steps >= self.steps_per_frame:
+                    steps -= self.steps_per_frame
+                    yield codes
+
+        if steps > 0:
+            yield codes
+
+        stats = dict(result[1]) if result else {}
+        stats['events'] = count
+        return stats
+
+    def upscale(self, codes: np.ndarray) -> np.ndarray:
+        """Expand cell codes to pixels (cell_size x cell_size per cell)."""
+        if self.cell_size == 1:
+            return codes
+        return np.repeat(np.repeat(codes, self.cell_size, axis=0), self.cell_size, axis=1)
+
+    def render(self, algorithm_name: str, output_file: str) -> Dict:
+        """
+        Render one search animation.
+
+        Args:
+            algorithm_name: 'bfs', 'dijkstra' or 'astar'
+            output_file: .gif, .png or .apng path
+
+        Returns:
+            Dict with algorithm stats, frame counts and render time
+        """
+        from utils.animation_encoder import open_encoder
+
+        start_time = time.perf_counter()
+        frames = self.frames(algorithm_name)
+        frame_count = 0
+
+        with open_encoder(output_file, self.frame_duration) as encoder:
+            pixels = None
+            while True:
+                try:
+                    codes = next(frames)
+                except StopIteration as stop:
+                    stats = stop.value
+                    break
+                pixels = self.upscale(codes)
+                encoder.append(pixels)
+                frame_count += 1
+
+            if pixels is not None and self.final_hold:
+                encoder.append(pixels, self.final_hold)
+
+        stats.update({
+            'output': output_file,
+            'frames': frame_count,
+            'frames_encoded': encoder.frames_written,
+            'render_seconds': time.perf_counter() - start_time,
+        })
+        return stats
+
+
+def build_grid(job: Dict) -> Grid:
+    """Create the grid for a render job from a maze file or a seeded generator."""
+    if job.get('maze'):
+        from maze.maze_loader import MazeLoader
+
+        types, start, end = MazeLoader.load_array(job['maze'])
+        grid = Grid(*types.shape)
+        grid.load_from_ndarray(types, start, end)
+        return grid
+
+    from maze.maze_generator import MazeGenerator
+
+    rows, cols = job.get('rows', 41), job.get('cols', 41)
+    grid = Grid(rows, cols)
+    random.seed(job.get('seed'))
+    generator = MazeGenerator(grid)
+    getattr(generator, f"generate_{job.get('generator', 'dfs')}")()
+    generator.place_endpoints()
+    generator.make_solvable()
+    return grid
+
+
+def _render_job(job: Dict) -> Dict:
+    """Worker entry point: render one job dict."""
+    renderer = OfflineRenderer(build_grid(job), job.get('cell_size', 8),
+                               job.get('steps_per_frame', 1.0),
+                               job.get('frame_duration', 40), job.get('final_hold', 1000))
+    return renderer.render(job.get('algorithm', 'bfs'), job['output'])
+
+
+def render_batch(jobs: List[Dict], workers: Optional[int] = None) -> List[Dict]:
+    """
+    Render many jobs in parallel processes.
+
+    Each job is a dict with 'output', 'algorithm' and either 'maze' (file path)
+    or 'rows', 'cols', 'generator' and 'seed'; optional 'cell_size',
+    'steps_per_frame', 'frame_duration' and 'final_hold'.
+    """
+    if workers == 1 or len(jobs) <= 1:
+        return [_render_job(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_render_job, jobs))
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Render search animations without a display.")
+    parser.add_argument('--maze', nargs='*', default=[], help="Maze files to render")
+    parser.add_argument('--generate', help="Generator for random mazes (dfs, kruskal, wilson, ...)")
+    parser.add_argument('--count', type=int, default=1, help="Number of generated mazes")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the first generated maze")
+    parser.add_argument('--rows', type=int, default=41)
+    parser.add_argument('--cols', type=int, default=41)
+    parser.add_argument('-a', '--algorithms', nargs='+', default=['bfs'])
+    parser.add_argument('--out-dir', default='outputs/renders')
+    parser.add_argument('--format', default='gif', choices=['gif', 'apng'])
+    parser.add_argument('--cell-size', type=int, default=8)
+    parser.add_argument('--steps-per-frame', type=float, default=1.0)
+    parser.add_argument('--duration', type=int, default=40, help="Milliseconds per frame")
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    sources = [{'maze': path, 'name': os.path.splitext(os.path.basename(path))[0]} for path in args.maze]
+    if args.generate:
+        sources += [{'generator': args.generate, 'seed': seed, 'rows': args.rows, 'cols': args.cols,
+                     'name': f"{args.generate}_{seed}"}
+                    for seed in range(args.seed, args.seed + args.count)]
+    if not sources:
+        parser.error("nothing to render: pass --maze and/or --generate")
+
+    jobs = [dict(source, algorithm=algorithm, cell_size=args.cell_size,
+                 steps_per_frame=args.steps_per_frame, frame_duration=args.duration,
+                 output=os.path.join(args.out_dir, f"{source['name']}_{algorithm}.{args.format}"))
+            for source in sources for algorithm in args.algorithms]
+
+    start_time = time.perf_counter()
+    for stats in render_batch(jobs, args.workers):
+        print(f"{stats['output']}: {stats['frames']} frames, {stats['events']} events, "
+              f"path {stats.get('path_length', 0)}, {stats['render_seconds']:.2f}s")
+    print(f"Rendered {len(jobs)} animations in {time.perf_counter() - start_time:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Tests for maze image export."""
+
+import os
+import tempfile
+
+from maze.grid import Grid
+from utils.export_tools import ExportTools
+
+
+def make_grid() -> Grid:
+    """Small grid with a wall, start and end."""
+    grid = Grid(10, 10)
+    grid.set_wall(4, 4)
+    grid.set_start(0, 0)
+    grid.set_end(9, 9)
+    return grid
+
+
+def test_export_formats():
+    """PNG and JPEG exports are written as RGB images with the export colors."""
+    from PIL import Image
+
+    grid = make_grid()
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in ('png', 'jpg'):
+            filename = os.path.join(directory, f"maze.{extension}")
+            ExportTools.export_maze_as_image(grid, filename, cell_size=4, include_search=True)
+
+            with Image.open(filename) as img:
+                assert img.mode == 'RGB' and img.size == (40, 40), (extension, img.mode, img.size)
+                if extension == 'png':
+                    assert img.getpixel((1, 1)) == (0, 255, 0)
+                    assert img.getpixel((17, 17)) == (0, 0, 0)
+                    assert img.getpixel((38, 38)) == (255, 0, 0)
+            print(f"Export: {extension} ok")
+
+
+def main():
+    """Run export tests."""
+    test_export_formats()
+
+
+if __name__ == "__main__":
+    main()
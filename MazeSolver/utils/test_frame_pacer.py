@@ -0,0 +1,108 @@
+"""Tests for frame pacing with a simulated clock."""
+
+from utils.frame_pacer import FramePacer
+
+
+class FakeClock:
+    """Clock that only advances when the loop sleeps or works (plus a tiny step per read)."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        self.now += 1e-6
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+def run_loop(work_times, fps=60):
+    """Run a paced loop where frame i takes work_times[i] seconds of work."""
+    clock = FakeClock()
+    pacer = FramePacer(fps, clock=clock, sleep=clock.sleep)
+    dts = []
+    rendered = 0
+    for work in work_times:
+        dts.append(pacer.tick())
+        clock.sleep(work)
+        if pacer.should_render():
+            rendered += 1
+    pacer.tick()
+    return pacer, dts, rendered
+
+
+def test_steady_pacing():
+    """Light frames are paced to the target interval: one sleep, accurate dt."""
+    pacer, dts, rendered = run_loop([0.004] * 120)
+    stats = pacer.get_stats()
+
+    assert abs(stats['mean'] - 1000 / 60) < 0.05, stats
+    assert stats['p99'] < 1000 / 60 + 0.05, stats
+    assert stats['dropped'] == 0 and rendered == 120
+    assert all(abs(dt - 1 / 60) < 1e-4 for dt in dts[1:])
+    print(f"Steady: mean {stats['mean']:.2f} ms, p99 {stats['p99']:.2f} ms")
+
+
+def test_slow_frames_are_dropped():
+    """A long frame drops missed deadlines instead of bursting to catch up."""
+    work = [0.004] * 30 + [0.1] + [0.004] * 30
+    pacer, dts, rendered = run_loop(work)
+    stats = pacer.get_stats()
+
+    assert stats['dropped'] >= 5, stats
+    assert max(dts) >= 0.1
+    # Frames after the hitch are paced normally again
+    assert all(abs(dt - 1 / 60) < 1e-4 for dt in dts[-20:])
+    assert stats['max'] >= 100 and stats['p95'] < 17, stats
+    print(f"Hitch: {stats['dropped']} dropped, max {stats['max']:.1f} ms")
+
+
+def test_render_skipping():
+    """Frames that overrun skip rendering, but never more than max_skip in a row."""
+    pacer, dts, rendered = run_loop([0.03] * 20)
+
+    assert pacer.skipped_renders > 0
+    assert rendered >= 20 // (pacer.max_skip + 1)
+    print(f"Overrun: {rendered}/20 rendered, {pacer.skipped_renders} skipped")
+
+
+def test_spin_is_bounded():
+    """After a stretch of 4 ms late wake-ups, an accurate timer is not met with a long busy-wait."""
+    class LateClock(FakeClock):
+        def __init__(self):
+            super().__init__()
+            self.late = 0.004
+            self.reads = 0
+
+        def __call__(self) -> float:
+            self.reads += 1
+            return super().__call__()
+
+        def sleep(self, seconds: float):
+            self.now += seconds + self.late
+
+    clock = LateClock()
+    pacer = FramePacer(60, clock=clock, sleep=clock.sleep)
+    reads = []
+    for frame in range(120):
+        clock.late = 0.004 if frame < 60 else 0.0
+        before = clock.reads
+        pacer.tick()
+        reads.append(clock.reads - before)
+
+    # Every read advances the clock by 1 us, so reads per frame bound the spin time
+    assert max(reads) < 1100, max(reads)
+    print(f"Late timer: at most {max(reads)} clock reads per frame")
+
+
+def main():
+    """Run frame pacer tests."""
+    test_steady_pacing()
+    test_slow_frames_are_dropped()
+    test_render_skipping()
+    test_spin_is_bounded()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Tests that the vectorized text maze codec matches the per-character implementation."""
+
+import os
+import random
+import tempfile
+
+import numpy as np
+
+from utils.text_codec import TextMazeCodec
+
+
+def reference_read(filepath):
+    """Original per-character parser."""
+    grid_data = []
+    start_pos = None
+    end_pos = None
+
+    with open(filepath, 'r') as file:
+        for row_idx, line in enumerate(file):
+            line = line.strip()
+            if not line:
+                continue
+
+            row = []
+            for col_idx, char in enumerate(line):
+                if char == 'S':
+                    row.append(0)
+                    start_pos = (row_idx, col_idx)
+                elif char == 'E':
+                    row.append(0)
+                    end_pos = (row_idx, col_idx)
+                elif char == '1':
+                    row.append(1)
+                else:
+                    row.append(0)
+
+            grid_data.append(row)
+
+    return grid_data, start_pos, end_pos
+
+
+def reference_write(filepath, grid, start_pos=None, end_pos=None):
+    """Original per-cell writer."""
+    with open(filepath, 'w') as file:
+        for row_idx, row in enumerate(grid):
+            line = ""
+            for col_idx, cell in enumerate(row):
+                if start_pos and (row_idx, col_idx) == start_pos:
+                    line += 'S'
+                elif end_pos and (row_idx, col_idx) == end_pos:
+                    line += 'E'
+                elif cell == 1:
+                    line += '1'
+                else:
+                    line += '0'
+            file.write(line + '\n')
+
+
+def random_position(rng, rows, cols):
+    """A position inside the grid, outside it, or None."""
+    return rng.choice([None, (rng.randrange(rows), rng.randrange(cols)),
+                       (rows + 2, 0), (0, cols + 2)])
+
+
+def test_writer_matches_reference():
+    """Vectorized output is byte-identical to the per-cell writer, for arrays and ragged lists."""
+    rng = random.Random(5)
+    with tempfile.TemporaryDirectory() as directory:
+        new_path = os.path.join(directory, "new.txt")
+        old_path = os.path.join(directory, "old.txt")
+
+        for _ in range(50):
+            rows, cols = rng.randrange(1, 12), rng.randrange(1, 12)
+            types = np.array([[rng.random() < 0.4 for _ in range(cols)] for _ in range(rows)], dtype=np.uint8)
+            grids = [types, types.tolist(), [row[:rng.randrange(cols + 1)] for row in types.tolist()]]
+            start, end = random_position(rng, rows, cols), random_position(rng, rows, cols)
+
+            for grid in grids:
+                TextMazeCodec.write(new_path, grid, start, end)
+                reference_write(old_path, grid if isinstance(grid, list) else grid.tolist(), start, end)
+                with open(new_path, 'rb') as new, open(old_path, 'rb') as old:
+                    assert new.read() == old.read(), (grid, start, end)
+
+
+def test_reader_matches_reference():
+    """The vectorized parser returns the same rows and endpoints on messy input."""
+    rng = random.Random(9)
+    alphabet = ['0', '1', '1', 'S', 'E', ' ', '\t', 'x', '\r']
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "maze.txt")
+
+        for _ in range(100):
+            lines = [''.join(rng.choice(alphabet) for _ in range(rng.randrange(0, 10)))
+                     for _ in range(rng.randrange(0, 10))]
+            newline = rng.choice(['\n', '\r\n', '\r'])
+            with open(path, 'w', newline='') as file:
+                file.write(newline.join(lines))
+
+            assert TextMazeCodec.read(path) == reference_read(path), lines
+
+
+def main():
+    """Run text codec tests."""
+    test_writer_matches_reference()
+    test_reader_matches_reference()
+    print("Text codec matches the per-character reader and writer")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Vectorized reader and writer for the text maze format.
+
+Format: one line per row, '1' = wall, 'S' = start, 'E' = end, anything
+else = empty. Lines are stripped and blank lines are skipped; start/end
+row indices count raw file lines, matching the original per-character parser.
+"""
+
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Bytes that str.strip()/text-mode reading treat differently from bytes.strip()
+_UNICODE_SEPARATORS = bytes(range(0x1c, 0x20))
+
+_WALL = ord('1')
+_EMPTY = ord('0')
+_START = ord('S')
+_END = ord('E')
+
+
+class TextMazeCodec:
+    """Parse and emit text mazes with whole-row NumPy operations."""
+
+    @staticmethod
+    def read_array(filepath: str) -> Tuple[
+            np.ndarray, List[int], Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        """
+        Read a text maze into a uint8 array of cell types.
+
+        Ragged rows are padded with empty cells; their true lengths are returned.
+
+        Returns:
+            Tuple of (types, row_lengths, start_pos, end_pos)
+        """
+        with open(filepath, 'rb') as file:
+            data = file.read()
+
+        if not data.isascii() or any(byte in data for byte in _UNICODE_SEPARATORS):
+            # Rare inputs whose line/whitespace rules differ between bytes and str
+            with open(filepath, 'r') as file:
+                lines = [line.encode('utf-32-le') for line in file]
+            return TextMazeCodec._parse_lines(lines, itemsize=4)
+
+        return TextMazeCodec._parse_lines(data.splitlines(), itemsize=1)
+
+    @staticmethod
+    def read(filepath: str) -> Tuple[
+            List[List[int]], Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        """Read a text maze as nested lists (same result as the per-character parser)."""
+        types, lengths, start_pos, end_pos = TextMazeCodec.read_array(filepath)
+
+        if len(set(lengths)) <= 1:
+            return types.tolist(), start_pos, end_pos
+
+        return [row[:length] for row, length in zip(types.tolist(), lengths)], start_pos, end_pos
+
+    @staticmethod
+    def _parse_lines(lines: List[bytes], itemsize: int):
+        """Vectorized parse of raw lines (itemsize bytes per character)."""
+        dtype = np.uint8 if itemsize == 1 else np.dtype('<u4')
+        stripped = [line.strip() if itemsize == 1 else line.decode('utf-32-le').strip().encode('utf-32-le')
+                    for line in lines]
+        raw_rows = [idx for idx, line in enumerate(stripped) if line]
+        rows = [stripped[idx] for idx in raw_rows]
+        lengths = [len(line) // itemsize for line in rows]
+
+        if not rows:
+            return np.zeros((0, 0), dtype=np.uint8), [], None, None
+
+        width = max(lengths)
+        if min(lengths) == width:
+            chars = np.frombuffer(b''.join(rows), dtype=dtype).reshape(len(rows), width)
+        else:
+            chars = np.zeros((len(rows), width), dtype=dtype)
+            for idx, line in enumerate(rows):
+                chars[idx, :lengths[idx]] = np.frombuffer(line, dtype=dtype)
+
+        types = (chars == _WALL).astype(np.uint8)
+        start_pos = TextMazeCodec._last_position(chars, _START, raw_rows)
+        end_pos = TextMazeCodec._last_position(chars, _END, raw_rows)
+        return types, lengths, start_pos, end_pos
+
+    @staticmethod
+    def _last_position(chars: np.ndarray, marker: int, raw_rows: List[int]) -> Optional[Tuple[int, int]]:
+        """Position of the last marker in file order, using raw line numbers for rows."""
+        hits = np.flatnonzero(chars.ravel() == marker)
+        if not len(hits):
+            return None
+        row, col = divmod(int(hits[-1]), chars.shape[1])
+        return raw_rows[row], col
+
+    @staticmethod
+    def write(filepath: str, grid, start_pos=None, end_pos=None):
+        """
+        Write a maze in text format.
+
+        Args:
+            filepath: Output path
+            grid: 2D list/array of cell types, or a Grid object
+            start_pos: (row, col) or Cell of the start point
+            end_pos: (row, col) or Cell of the end point
+        """
+        if hasattr(grid, 'to_array'):
+            grid = grid.to_array()
+        start_pos = TextMazeCodec._as_position(start_pos)
+        end_pos = TextMazeCodec._as_position(end_pos)
+
+        if isinstance(grid, np.ndarray) or len({len(row) for row in grid}) <= 1:
+            rows = [TextMazeCodec._encode_rows(np.asarray(grid), start_pos, end_pos)]
+        else:
+            rows = [
+                TextMazeCodec._encode_rows(np.asarray([row]), TextMazeCodec._shift(start_pos, idx),
+                                           TextMazeCodec._shift(end_pos, idx))
+                for idx, row in enumerate(grid)
+            ]
+
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(filepath, 'w') as file:
+            for block in rows:
+                file.write(block)
+
+    @staticmethod
+    def _encode_rows(types: np.ndarray, start_pos, end_pos) -> str:
+        """Encode a 2D block of cell types as newline-terminated text rows."""
+        if types.size == 0:
+            return '\n' * (types.shape[0] if types.ndim == 2 else 0)
+
+        height, width = types.shape
+        out = np.empty((height, width + 1), dtype=np.uint8)
+        out[:, :width] = np.where(types == 1, _WALL, _EMPTY)
+        out[:, width] = ord('\n')
+
+        # Start wins over end when both point at the same cell
+        for position, marker in ((end_pos, _END), (start_pos, _START)):
+            if position and 0 <= position[0] < height and 0 <= position[1] < width:
+                out[position[0], position[1]] = marker
+
+        return out.tobytes().decode('ascii')
+
+    @staticmethod
+    def _as_position(position) -> Optional[Tuple[int, int]]:
+        """Accept a Cell or a (row, col) tuple."""
+        if position is not None and hasattr(position, 'row'):
+            return position.row, position.col
+        return position
+
+    @staticmethod
+    def _shift(position, row: int) -> Optional[Tuple[int, int]]:
+        """Translate a position into single-row coordinates for the given row."""
+        if position and position[0] == row:
+            return 0, position[1]
+        return None
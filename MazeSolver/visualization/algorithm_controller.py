@@ -1,14 +1,21 @@
 """Controls algorithm execution and state."""
 
-from typing import Optional, Dict, List, Tuple, Any
+import time
+from typing import Optional, Dict, List, Tuple, Any, Callable
 from algorithms import AlgorithmFactory
+from algorithms.search_trace import SearchTrace, apply_events
 from maze.grid import Grid
+from utils.constants import FPS
 from utils.timer import Timer
+from visualization.step_scheduler import StepScheduler
+from visualization.solver_worker import SolverWorker, SolverProgress
 
 
 class AlgorithmController:
     """Manages algorithm execution and state."""
 
+    INSTANT_CHUNK = 4096  # Events per chunk recorded by run_instant()
+
     def __init__(self, grid: Grid):
         self.grid = grid
         self.algorithm_name = "bfs"
@@ -16,8 +23,8 @@ class AlgorithmController:
         self.running = False
         self.paused = False
         self.finished = False
-        self.speed = 20  # Steps per second
-        self.steps_per_frame = 1
+        self.speed = 20  # Slider value 1-100, see set_speed()
+        self.scheduler = StepScheduler(self.speed_to_rate(self.speed))
 
         # Results
         self.path = None
@@ -34,23 +41,53 @@ class AlgorithmController:
 
         # State
         self.generator = None
+        self.worker: Optional[SolverWorker] = None  # Background run, see start(background=True)
+        self.worker_factory: Callable[..., SolverWorker] = SolverWorker  # Called with the algorithm
+        self.error: Optional[BaseException] = None  # Exception that ended the last background run
+        self.last_events = None  # (indices, codes) chunk applied in the last step
         self.last_step_time = 0.0
         self.step_delay = 1.0 / self.speed
 
+        # Recorded events of the current run, for seeking and replay
+        self.trace: Optional[SearchTrace] = None
+        self.trace_position = 0
+        self.replaying = False
+        self.replay_speed = 0.0  # Events per second, negative plays backwards
+        self._replay_cursor = 0.0
+
     def set_algorithm(self, algorithm_name: str):
         """Set the current algorithm."""
         self.algorithm_name = algorithm_name
         self.reset()
 
+    @staticmethod
+    def speed_to_rate(speed: int) -> Optional[float]:
+        """
+        Map a speed setting (1-100) to search events per second.
+
+        The scale is exponential: 20 is one event per frame (60/s), every
+        20 more is 10x faster, and 100 runs as fast as possible (None).
+        """
+        if speed >= 100:
+            return None
+        return FPS * 10 ** ((speed - 20) / 20)
+
     def set_speed(self, speed: int):
-        """Set visualization speed (steps per second)."""
+        """Set visualization speed (1-100, exponential; 100 = as fast as possible)."""
         self.speed = max(1, min(100, speed))
         self.step_delay = 1.0 / self.speed
-        self.steps_per_frame = max(1, self.speed // 20)
-
-    def start(self):
-        """Start algorithm execution."""
-        if self.finished:
+        self.scheduler.set_rate(self.speed_to_rate(self.speed))
+
+    def start(self, background: bool = False):
+        """
+        Start algorithm execution.
+
+        Args:
+            background: Run the search on a worker thread (made by worker_factory)
+                as fast as possible; step() then only applies the events it has
+                produced so far
+        """
+        if self.finished or self.worker:
             self.reset()
 
         self.running = True
@@ -63,33 +100,119 @@ class AlgorithmController:
             self.grid
         )
 
-        # Get generator for step-by-step execution
-        self.generator = self.algorithm.find_path_animated()
+        self.last_events = None
+        self.error = None
+        self.trace = SearchTrace(self.grid.rows, self.grid.cols, algorithm=self.algorithm_name)
+        self.trace_position = 0
+        self.replaying = False
 
         # Start timer
         self.timer.start()
 
-    def step(self) -> bool:
-        """Execute one step of the algorithm. Returns True if completed."""
-        if not self.running or self.paused or self.finished or not self.generator:
+        if background:
+            # The worker searches a private copy, so the shared grid's old flags are cleared here
+            self.grid.reset_search_states()
+            self.generator = None
+            self.worker = self.worker_factory(self.algorithm)
+            self.worker.start()
+            return
+
+        # Get generator yielding chunks of search events; the scheduler sizes them
+        self.scheduler.reset()
+        self.generator = self.algorithm.find_path_batched(self.scheduler.chunk_size)
+        self._generator_started = False
+
+    def step(self, dt: float = 1.0 / FPS) -> bool:
+        """
+        Run this frame's share of search events (as many chunks as the
+        scheduler allows within its time budget). Returns True if completed
+        (or if a background run failed; see `error`).
+        """
+        if not self.running or self.paused or self.finished:
+            return False
+        if self.worker:
+            return self._apply_worker_events()
+        if not self.generator:
             return False
 
+        self.scheduler.begin_frame(dt)
         try:
-            # Execute multiple steps based on speed
-            for _ in range(self.steps_per_frame):
-                next(self.generator)
+            chunk = self.scheduler.next_chunk()
+            while chunk:
+                # The chunk size is re-sent so speed changes apply immediately
+                # (a fresh generator only accepts None)
+                started = time.perf_counter()
+                indices, codes = self.generator.send(chunk if self._generator_started else None)
+                self._generator_started = True
+                self.scheduler.record(len(indices), time.perf_counter() - started)
+
+                self.trace.record_batch(indices, codes)
+                self.grid.mark_dirty_indices(indices)
+                self.last_events = (indices, codes)
+                chunk = self.scheduler.next_chunk()
 
         except StopIteration as e:
             # Algorithm completed
             self.finish(e.value if hasattr(e, 'value') else None)
             return True
 
+        finally:
+            self.scheduler.end_frame()
+            if self.trace:
+                self.trace_position = len(self.trace)
+
         return False
 
+    def _apply_worker_events(self) -> bool:
+        """Apply, record and mark dirty the chunks the background worker produced. Returns True if completed or failed."""
+        done = self.worker.progress.done  # Read first: every chunk is queued once done is set
+        for indices, codes in self.worker.take_chunks():
+            apply_events(self.grid, indices, codes)
+            self.trace.record_batch(indices, codes)
+            self.grid.mark_dirty_indices(indices)
+            self.last_events = (indices, codes)
+        self.trace_position = len(self.trace)
+
+        if not done:
+            return False
+
+        worker, self.worker = self.worker, None
+        if worker.error is not None:
+            # Hand the failure to the UI thread as a completed run; the partial search stays visible
+            self.error = worker.error
+            self.running = False
+            return True
+        if worker.result is None:
+            # Cancelled; the partial search stays visible
+            self.running = False
+            return False
+        self.finish(worker.result)
+        return True
+
+    @property
+    def progress(self) -> Optional[SolverProgress]:
+        """Latest progress snapshot of a background run (None otherwise)."""
+        return self.worker.progress if self.worker else None
+
+    @property
+    def render_due(self) -> bool:
+        """False on frames the step scheduler reserves for stepping."""
+        return self.worker is not None or self.scheduler.render_this_frame
+
+    def cancel(self) -> bool:
+        """Stop a running search (animated or background) and clear its search state."""
+        if not self.running:
+            return False
+        self.reset()
+        self.grid.reset_search_states()
+        return True
+
     def finish(self, result: Optional[Tuple[List, Dict]] = None):
         """Finish algorithm execution."""
         self.running = False
         self.finished = True
+        if self.trace:
+            self.trace_position = len(self.trace)
 
         # Stop timer
         elapsed_time = self.timer.stop()
@@ -105,7 +228,8 @@ class AlgorithmController:
                 'nodes_explored': algorithm_stats.get('nodes_explored', 0),
                 'path_length': len(path) if path else 0,
                 'path_found': bool(path),
-                'algorithm_name': self.algorithm_name.upper()
+                'algorithm_name': self.algorithm_name.upper(),
+                'steps_per_second': len(self.trace) / elapsed_time if self.trace and elapsed_time else 0.0
             }
 
             # Mark path cells
@@ -126,14 +250,26 @@ class AlgorithmController:
         """Pause or resume algorithm execution."""
         if self.running:
             self.paused = not self.paused
+            if self.worker and self.paused:
+                self.worker.pause()
+            elif self.worker:
+                self.worker.resume()
 
     def reset(self):
-        """Reset algorithm state."""
+        """Reset algorithm state (stops a background run first)."""
+        if self.worker:
+            self.worker.cancel()
+            self.worker = None
         self.running = False
         self.paused = False
         self.finished = False
         self.path = None
         self.generator = None
+        self.last_events = None
+        self.error = None
+        self.trace = None
+        self.trace_position = 0
+        self.replaying = False
 
         # Reset stats
         self.stats = {
@@ -161,8 +297,17 @@ class AlgorithmController:
         # Start timer
         self.timer.start()
 
-        # Run algorithm - Fixed: use self.algorithm instead of algorithm
-        path, algorithm_stats = self.algorithm.find_path()
+        # Run in large chunks and record them, so the run can be seeked and replayed like an animated one
+        self.trace = SearchTrace(self.grid.rows, self.grid.cols, algorithm=self.algorithm_name)
+        chunks = self.algorithm.find_path_batched(self.INSTANT_CHUNK)
+        while True:
+            try:
+                indices, codes = next(chunks)
+            except StopIteration as stop:
+                path, algorithm_stats = stop.value
+                break
+            self.trace.record_batch(indices, codes)
+        self.trace_position = len(self.trace)
 
         # Stop timer
         elapsed_time = self.timer.stop()
@@ -173,13 +318,12 @@ class AlgorithmController:
             'nodes_explored': algorithm_stats.get('nodes_explored', 0),
             'path_length': len(path) if path else 0,
             'path_found': bool(path),
-            'algorithm_name': self.algorithm_name.upper()
+            'algorithm_name': self.algorithm_name.upper(),
+            'steps_per_second': len(self.trace) / elapsed_time if elapsed_time else 0.0
         }
 
-        # Mark path
-        if path:
-            for cell in path:
-                cell.in_path = True
+        # The batched search already flagged the path cells
+        self.grid.mark_all_dirty(structural=False)
 
         self.path = path
         self.finished = True
@@ -187,20 +331,146 @@ class AlgorithmController:
 
         return path, self.stats
 
+    # Trace seeking and replay (only after a run has finished)
+    def can_seek(self) -> bool:
+        """True when a finished run's trace is available."""
+        return self.finished and self.trace is not None and len(self.trace) > 0
+
+    def seek(self, step: int) -> bool:
+        """Show the search state after `step` recorded events."""
+        if not self.can_seek():
+            return False
+
+        self.trace_position = max(0, min(step, len(self.trace)))
+        self.grid.mark_dirty_indices(self.trace.apply(self.grid, self.trace_position))
+        return True
+
+    def start_replay(self, speed: Optional[float] = None):
+        """
+        Replay the recorded run without re-running the algorithm.
+
+        Args:
+            speed: Events per second, negative for reverse playback
+                (defaults to the live animation rate)
+        """
+        if not self.can_seek():
+            return
+
+        if speed is None:
+            speed = self.default_replay_speed()
+        self.replay_speed = speed
+
+        # Restart from the opposite end when already at the end we play towards
+        if speed > 0 and self.trace_position >= len(self.trace):
+            self.seek(0)
+        elif speed < 0 and self.trace_position <= 0:
+            self.seek(len(self.trace))
+
+        self._replay_cursor = float(self.trace_position)
+        self.replaying = True
+
+    def default_replay_speed(self) -> float:
+        """Replay at the animation rate; unlimited runs replay in about two seconds."""
+        if self.scheduler.rate:
+            return self.scheduler.rate
+        return max(float(FPS), len(self.trace) / 2.0 if self.trace else 0.0)
+
+    def stop_replay(self):
+        """Stop replay at the current step."""
+        self.replaying = False
+
+    def set_replay_speed(self, speed: float):
+        """Change replay speed (events per second, negative for reverse)."""
+        self.replay_speed = speed
+
+    def update_replay(self, dt: float) -> bool:
+        """Advance replay by dt seconds. Returns True if the shown step changed."""
+        if not self.replaying or not self.can_seek():
+            return False
+
+        self._replay_cursor += self.replay_speed * dt
+        self._replay_cursor = max(0.0, min(self._replay_cursor, float(len(self.trace))))
+        step = int(self._replay_cursor)
+
+        if self._replay_cursor in (0.0, float(len(self.trace))):
+            self.replaying = False
+
+        if step == self.trace_position:
+            return False
+        return self.seek(step)
+
+    def save_trace(self, filepath: str) -> bool:
+        """Save the recorded trace as .npz."""
+        if not self.trace or not len(self.trace):
+            return False
+        self.trace.save(filepath)
+        return True
+
+    def get_live_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Snapshot of a running search for live display (None when idle).
+
+        Only reads counters the algorithm keeps anyway, so it costs O(1)
+        and can be polled from the render loop.
+        """
+        if not self.running or not self.algorithm:
+            return None
+
+        elapsed = self.timer.get_elapsed()
+        return {
+            'nodes_explored': self.algorithm.nodes_explored,
+            'frontier': len(self.algorithm.frontier),
+            'elapsed': elapsed,
+            'eta': self._estimate_remaining(elapsed),
+        }
+
+    def _estimate_remaining(self, elapsed: float) -> Optional[float]:
+        """
+        A* only: seconds left, extrapolated from the frontier's closest approach to the goal.
+
+        A* expands nodes in order of f = g + h, so its open set creeps from
+        h(start) towards the goal. The algorithm tracks the smallest h ever
+        pushed to the open set (best_h); 1 - best_h / h(start) is the covered
+        share of the distance, and the remaining time follows linearly.
+        """
+        if self.algorithm_name != "astar":
+            return None
+
+        best_h = getattr(self.algorithm, 'best_h', None)
+        h_start = self.algorithm.heuristic(self.grid.start_cell, self.grid.end_cell)
+        if best_h is None or not h_start:
+            return None
+        covered = 1.0 - best_h / h_start
+        if covered <= 0:
+            return None
+        return elapsed * (1.0 - covered) / covered
+
     def get_stats(self) -> Dict[str, Any]:
         """Get current algorithm statistics."""
         return self.stats.copy()
 
     def get_status_text(self) -> str:
         """Get status text for display."""
+        if self.error is not None:
+            return f"Search failed: {self.error}"
+
         if not self.running and not self.finished:
             return f"Ready - {self.algorithm_name.upper()}"
 
         if self.paused:
             return "Paused"
 
+        if self.running and self.worker:
+            progress = self.worker.progress
+            return (f"Solving {self.algorithm_name.upper()}... {progress.visited:,} visited, "
+                    f"frontier {progress.frontier:,}")
+
         if self.running:
-            return f"Running {self.algorithm_name.upper()}..."
+            return f"Running {self.algorithm_name.upper()}... {self.scheduler.steps_per_second:,.0f} steps/s"
+
+        if self.replaying:
+            direction = "Reverse" if self.replay_speed < 0 else "Replay"
+            return f"{direction} {self.trace_position}/{len(self.trace)}"
 
         if self.finished:
             if self.stats['path_found']:
@@ -0,0 +1,128 @@
+"""Array-based grid rendering through pygame.surfarray."""
+
+import numpy as np
+import pygame
+from typing import Dict, Optional, Sequence, Tuple
+from utils.constants import (
+    PALETTE_COLORS, COLOR_GRID_LINE, PALETTE_EMPTY, PALETTE_WALL, PALETTE_START,
+    PALETTE_END, PALETTE_VISITED, PALETTE_FRONTIER, PALETTE_PATH
+)
+
+# Search states shown when cells are aggregated: the highest rank in a block wins
+AGGREGATE_RANK = np.zeros(256, dtype=np.uint8)
+AGGREGATE_CODES = np.array([PALETTE_EMPTY, PALETTE_FRONTIER, PALETTE_VISITED,
+                            PALETTE_PATH, PALETTE_START, PALETTE_END], dtype=np.uint8)
+AGGREGATE_RANK[AGGREGATE_CODES] = np.arange(len(AGGREGATE_CODES))
+
+
+class ArrayRenderer:
+    """
+    Render a (rows, cols) array of palette indices (PALETTE_*) in a few calls:
+    a color lookup table maps indices to RGB, surfarray writes one pixel per
+    cell and a single transform.scale enlarges it to cell_size. Grid lines
+    are an optional pre-rendered overlay. Below one pixel per cell, blocks
+    of cells are aggregated into single pixels first.
+    """
+
+    # Grid lines are skipped below this cell size (they would cover the cells)
+    MIN_LINE_CELL_SIZE = 4
+
+    # Overlay pixels with this color are transparent
+    COLORKEY = (255, 0, 255)
+
+    def __init__(self, colors: Sequence[Tuple[int, int, int]] = PALETTE_COLORS,
+                 grid_lines: bool = True, line_color: Tuple[int, int, int] = COLOR_GRID_LINE):
+        """
+        Args:
+            colors: RGB color per palette index
+            grid_lines: Draw cell borders over the scaled image
+            line_color: Border color
+        """
+        self.lut = np.zeros((256, 3), dtype=np.uint8)
+        self.lut[:len(colors)] = colors
+        self.grid_lines = grid_lines
+        self.line_color = line_color
+
+        self._small: Optional[pygame.Surface] = None
+        self._scaled: Optional[pygame.Surface] = None
+        self._lines: Dict[int, pygame.Surface] = {}
+
+    def set_color(self, index: int, color: Tuple[int, int, int]):
+        """Change the color of one palette index."""
+        self.lut[index] = color
+
+    def render(self, codes: np.ndarray, cell_size: int, cells_per_pixel: int = 1) -> pygame.Surface:
+        """
+        Render palette indices to a surface of (cols * cell_size, rows * cell_size),
+        or one pixel per cells_per_pixel x cells_per_pixel block.
+
+        The returned surface is reused by the next call; copy it to keep it.
+        """
+        if cells_per_pixel > 1:
+            codes = self.downsample(codes, cells_per_pixel)
+            cell_size = 1
+        rows, cols = codes.shape
+        size = (cols * cell_size, rows * cell_size)
+
+        if self._small is None or self._small.get_size() != (cols, rows):
+            self._small = pygame.Surface((cols, rows))
+        # surfarray indexes (x, y), so the (rows, cols) image is transposed
+        pygame.surfarray.blit_array(self._small, self.lut[codes].transpose(1, 0, 2))
+
+        if cell_size == 1:
+            target = self._small
+        else:
+            if self._scaled is None or self._scaled.get_size() != size:
+                self._scaled = pygame.Surface(size)
+            pygame.transform.scale(self._small, size, self._scaled)
+            target = self._scaled
+
+        if self.grid_lines and cell_size >= self.MIN_LINE_CELL_SIZE:
+            target.blit(self.grid_line_overlay(rows, cols, cell_size), (0, 0), target.get_rect())
+        return target
+
+    @staticmethod
+    def downsample(codes: np.ndarray, step: int) -> np.ndarray:
+        """
+        Aggregate step x step blocks of palette indices into one index each.
+
+        Any search state in a block (path over visited over frontier, start and
+        end above all) wins; otherwise the block is a wall if at least half of
+        its cells are walls, so maze corridors stay recognizable.
+        """
+        rows, cols = codes.shape
+        height, width = -(-rows // step), -(-cols // step)
+
+        padded = np.full((height * step, width * step), PALETTE_EMPTY, dtype=np.uint8)
+        padded[:rows, :cols] = codes
+        blocks = padded.reshape(height, step, width, step)
+
+        ranks = AGGREGATE_RANK[blocks].max(axis=(1, 3))
+        walls = (blocks == PALETTE_WALL).sum(axis=(1, 3), dtype=np.int32) * 2 >= step * step
+        base = np.where(walls, PALETTE_WALL, PALETTE_EMPTY).astype(np.uint8)
+        return np.where(ranks > 0, AGGREGATE_CODES[ranks], base)
+
+    def grid_line_overlay(self, rows: int, cols: int, cell_size: int) -> pygame.Surface:
+        """
+        Cached surface with every cell's 1px border (as drawn by
+        pygame.draw.rect(..., 1)); all other pixels are transparent.
+
+        The pattern only depends on cell_size, so one surface per cell size is
+        kept and may be larger than requested; blit its top-left part.
+        """
+        width, height = cols * cell_size, rows * cell_size
+        overlay = self._lines.get(cell_size)
+        if overlay is None or overlay.get_width() < width or overlay.get_height() < height:
+            if overlay is not None:
+                width, height = max(width, overlay.get_width()), max(height, overlay.get_height())
+            overlay = pygame.Surface((width, height))
+            overlay.fill(self.COLORKEY)
+            for x in range(0, width, cell_size):
+                overlay.fill(self.line_color, (x, 0, 1, height))
+                overlay.fill(self.line_color, (x + cell_size - 1, 0, 1, height))
+            for y in range(0, height, cell_size):
+                overlay.fill(self.line_color, (0, y, width, 1))
+                overlay.fill(self.line_color, (0, y + cell_size - 1, width, 1))
+            overlay.set_colorkey(self.COLORKEY)
+            self._lines[cell_size] = overlay
+        return overlay
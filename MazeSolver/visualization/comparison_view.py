@@ -3,6 +3,8 @@ from typing import List, Dict, Tuple
 from maze.grid import Grid
 from algorithms import AlgorithmFactory
 from utils.constants import *
+from visualization.array_renderer import ArrayRenderer
+from utils.fonts import FontManager, text_cache
 
 
 class ComparisonView:
@@ -27,7 +29,11 @@ class ComparisonView:
             grid.set_end(GRID_HEIGHT - 2, GRID_WIDTH - 2)
             self.grids.append(grid)
 
-        self.font = pygame.font.Font(None, 20)
+        self.font = FontManager.get_default_font(20)
+
+        # Large grids render through surfarray; frontier cells are shown as empty here
+        self.array_renderer = ArrayRenderer()
+        self.array_renderer.set_color(PALETTE_FRONTIER, COLOR_EMPTY)
 
     def load_maze(self, maze_data: List[List[int]], start: Tuple[int, int], end: Tuple[int, int]):
         """Load same maze into all grids."""
@@ -62,6 +68,11 @@ class ComparisonView:
 
     def _render_grid(self, grid: Grid, x_offset: int, y_offset: int):
         """Render a single grid."""
+        if grid.rows * grid.cols >= ARRAY_RENDER_THRESHOLD:
+            surface = self.array_renderer.render(grid.to_state_array(), self.cell_size)
+            self.screen.blit(surface, (x_offset + 10, y_offset))
+            return
+
         for row in grid.cells:
             for cell in row:
                 x = x_offset + cell.col * self.cell_size + 10
@@ -98,5 +109,5 @@ class ComparisonView:
         ]
 
         for i, line in enumerate(lines):
-            text = self.font.render(line, True, COLOR_TEXT)
+            text = text_cache.render(self.font, line, COLOR_TEXT)
             self.screen.blit(text, (x_offset + 10, y_offset + i * 20))
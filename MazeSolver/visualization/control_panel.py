@@ -278,8 +278,8 @@ class ControlPanel:
         """Generate DFS maze."""
         self._reset()
         self.maze_generator.generate_dfs(complexity=0.75)
-        self.maze_generator.make_solvable()
         self._set_default_start_end()
+        self.maze_generator.make_solvable()
         # 🔧 FIX: Add status message
         if hasattr(self, 'status_bar_callback'):
             self.status_bar_callback("Generated DFS maze")
@@ -288,8 +288,8 @@ class ControlPanel:
         """Generate recursive division maze."""
         self._reset()
         self.maze_generator.generate_recursive_division(wall_density=0.5)
-        self.maze_generator.make_solvable()
         self._set_default_start_end()
+        self.maze_generator.make_solvable()
         # 🔧 FIX: Add status message
         if hasattr(self, 'status_bar_callback'):
             self.status_bar_callback("Generated Recursive Division maze")
@@ -314,8 +314,7 @@ class ControlPanel:
 
     def _set_default_start_end(self):
         """Set default start and end positions."""
-        self.grid.set_start(1, 1)
-        self.grid.set_end(self.grid.rows - 2, self.grid.cols - 2)
+        self.maze_generator.place_endpoints()
 
     def update_button_states(self):
         """Update button states based on algorithm state."""
@@ -0,0 +1,130 @@
+"""Run a batched search on a worker thread and hand its events to the UI thread."""
+
+import threading
+import time
+from collections import deque
+from typing import NamedTuple, Optional
+
+
+class SolverProgress(NamedTuple):
+    """Immutable progress snapshot; the worker replaces it, readers never lock."""
+    events: int = 0
+    visited: int = 0
+    frontier: int = 0
+    elapsed: float = 0.0
+    done: bool = False
+    cancelled: bool = False
+
+
+class SolverWorker:
+    """
+    Drive an algorithm's find_path_batched generator on a daemon thread.
+
+    The worker appends event chunks to a deque and publishes a new
+    SolverProgress after every chunk. The UI thread pops chunks with
+    take_chunks() and reads `progress`; deque appends/pops and attribute
+    assignment are atomic, so neither side takes a lock in its hot loop.
+
+    The search runs on a private copy of the grid, so the worker never
+    writes the cells the UI renders. The UI thread sets the shared cells'
+    flags from the chunks (apply_events) along with dirty marking and trace
+    recording; the result path is mapped back to the shared cells.
+    """
+
+    def __init__(self, algorithm, chunk_size: int = 4096):
+        """
+        Args:
+            algorithm: Algorithm instance (BFS, Dijkstra or AStar) on the shared grid;
+                the worker points it at a private copy when it starts
+            chunk_size: Events per handed-over chunk
+        """
+        self.algorithm = algorithm
+        self.grid = algorithm.grid  # Shared grid, only read by the worker
+        self.chunk_size = chunk_size
+
+        self.progress = SolverProgress()
+        self.result = None   # (path, stats) once done
+        self.error: Optional[BaseException] = None
+
+        self._chunks = deque()
+        self._cancel = threading.Event()
+        self._resume = threading.Event()
+        self._resume.set()
+        self._finished = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def alive(self) -> bool:
+        """True while the worker thread runs."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the search thread."""
+        self._thread = threading.Thread(target=self._run, name="SolverWorker", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the worker has finished (done, cancelled or failed). Returns False on timeout."""
+        return self._finished.wait(timeout)
+
+    def _run(self):
+        """Worker loop: pull chunks until the search ends or is cancelled."""
+        started = time.perf_counter()
+        generator = None
+        events = 0
+        done = False
+
+        try:
+            self.algorithm.grid = self.grid.copy()
+            generator = self.algorithm.find_path_batched(self.chunk_size)
+            while not self._cancel.is_set():
+                self._resume.wait()
+                if self._cancel.is_set():
+                    break
+                try:
+                    indices, codes = next(generator)
+                except StopIteration as stop:
+                    path, stats = stop.value
+                    cells = self.grid.cells
+                    self.result = [cells[cell.row][cell.col] for cell in path], stats
+                    done = True
+                    break
+
+                self._chunks.append((indices, codes))
+                events += len(indices)
+                self.progress = SolverProgress(events, self.algorithm.nodes_explored,
+                                               len(self.algorithm.frontier),
+                                               time.perf_counter() - started)
+        except Exception as e:
+            self.error = e
+            print(f"Error in solver worker: {e}")
+        finally:
+            if generator is not None:
+                generator.close()
+            self.progress = SolverProgress(events, self.algorithm.nodes_explored,
+                                           len(self.algorithm.frontier),
+                                           time.perf_counter() - started,
+                                           done=True, cancelled=not done)
+            self._finished.set()
+
+    def take_chunks(self):
+        """Pop all chunks handed over so far, oldest first."""
+        chunks = []
+        for _ in range(len(self._chunks)):
+            chunks.append(self._chunks.popleft())
+        return chunks
+
+    def pause(self):
+        """Hold the worker after its current chunk."""
+        self._resume.clear()
+
+    def resume(self):
+        """Continue a paused worker."""
+        self._resume.set()
+
+    def cancel(self, wait: bool = True):
+        """Stop the search after its current chunk; optionally wait for the thread."""
+        self._cancel.set()
+        self._resume.set()
+        if wait and self._thread is not None:
+            self._thread.join()
@@ -1,34 +1,73 @@
 """Status bar component for displaying algorithm statistics and messages."""
 
 import pygame
-from typing import Optional, Dict
+from typing import Callable, Optional, Dict
 from utils.constants import COLOR_TEXT, COLOR_BACKGROUND
+from utils.fonts import FontManager, text_cache
 
 
 class StatusBar:
-    """Display algorithm statistics and status messages."""
+    """Display algorithm statistics, live metrics and status messages."""
+
+    # Seconds between live metric samples
+    SAMPLE_INTERVAL = 0.25
 
     def __init__(self, x: int, y: int, width: int, height: int):
         self.rect = pygame.Rect(x, y, width - 400, height)
-        self.font = pygame.font.Font(None, 26)
-        self.small_font = pygame.font.Font(None, 24)
+        self.font = FontManager.get_default_font(26)
+        self.small_font = FontManager.get_default_font(24)
 
         self.status_message = ""
         self.message_timer = 0.0
         self.message_duration = 1.0  # seconds
 
+        # Live metrics: a source callable is sampled every SAMPLE_INTERVAL seconds
+        self.metrics_source: Optional[Callable[[], Optional[Dict]]] = None
+        self.metrics: Optional[Dict] = None
+        self._sample_timer = 0.0
+        self._last_nodes = 0
+        self._last_elapsed = 0.0
+
     def set_status(self, message: str):
         """Set a temporary status message."""
         self.status_message = message
         self.message_timer = self.message_duration
 
     def update(self, dt: float):
-        """Update status message timer."""
+        """Update status message timer and sample live metrics."""
         if self.message_timer > 0:
             self.message_timer -= dt
             if self.message_timer <= 0:
                 self.status_message = ""
 
+        if self.metrics_source:
+            self._sample_timer -= dt
+            if self._sample_timer <= 0:
+                self._sample_timer = self.SAMPLE_INTERVAL
+                self.sample_metrics()
+
+    def sample_metrics(self):
+        """Read the metrics source once; nodes per second is derived from the previous sample."""
+        sample = self.metrics_source()
+        if not sample:
+            self.metrics = None
+            self._last_nodes = 0
+            self._last_elapsed = 0.0
+            return
+
+        elapsed = sample['elapsed']
+        if elapsed < self._last_elapsed:
+            # A new run started since the last sample
+            self._last_nodes = self._last_elapsed = 0.0
+        span = elapsed - self._last_elapsed
+        if span > 0:
+            sample['nodes_per_second'] = (sample['nodes_explored'] - self._last_nodes) / span
+        elif self.metrics:
+            sample['nodes_per_second'] = self.metrics.get('nodes_per_second', 0.0)
+        self._last_nodes = sample['nodes_explored']
+        self._last_elapsed = elapsed
+        self.metrics = sample
+
     def render(self, screen: pygame.Surface, stats: Optional[Dict] = None):
         """Render status bar with stats and messages."""
         # Draw background
@@ -39,10 +78,29 @@ class StatusBar:
 
         # Show status message if active
         if self.status_message:
-            text = self.font.render(self.status_message, True, COLOR_TEXT)
+            text = text_cache.render(self.font, self.status_message, COLOR_TEXT)
             screen.blit(text, (self.rect.x + 20, y_offset))
             return
 
+        # Show live metrics while a search runs
+        if self.metrics:
+            eta = self.metrics.get('eta')
+            metric_items = [
+                f"Nodes/s: {self.metrics.get('nodes_per_second', 0):,.0f}",
+                f"Frontier: {self.metrics['frontier']:,}",
+                f"Elapsed: {self.metrics['elapsed']:.1f}s",
+                f"ETA: {eta:.1f}s" if eta is not None else "ETA: -",
+                f"Frame: {self.metrics['frame_ms']:.1f} ms",
+            ]
+
+            x_start = self.rect.x + 20
+            spacing = (self.rect.width - 40) // len(metric_items)
+
+            for i, item in enumerate(metric_items):
+                text = text_cache.render(self.small_font, item, COLOR_TEXT)
+                screen.blit(text, (x_start + i * spacing, y_offset + 5))
+            return
+
         # Show stats if algorithm finished
         if stats:
             stat_items = [
@@ -56,9 +114,9 @@ class StatusBar:
             spacing = (self.rect.width - 40) // len(stat_items)
 
             for i, item in enumerate(stat_items):
-                text = self.small_font.render(item, True, COLOR_TEXT)
+                text = text_cache.render(self.small_font, item, COLOR_TEXT)
                 screen.blit(text, (x_start + i * spacing, y_offset + 5))
         else:
             # Default message
-            text = self.small_font.render("Ready", True, COLOR_TEXT)
+            text = text_cache.render(self.small_font, "Ready", COLOR_TEXT)
             screen.blit(text, (self.rect.x + 20, y_offset + 5))
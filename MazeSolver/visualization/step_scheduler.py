@@ -0,0 +1,134 @@
+"""Time-budgeted scheduling of solver steps, decoupled from rendering."""
+
+import math
+import time
+from collections import deque
+from typing import Optional
+
+from utils.constants import FPS
+
+
+class StepScheduler:
+    """
+    Decide how many solver events to run each frame and when to render.
+
+    In rate mode, events are due at `rate` per second (fractions carry over
+    between frames). In "as fast as possible" mode (rate None), events run
+    until the frame's time budget is used up. Either way stepping stops at
+    the budget, so a slow solver never stalls input handling or rendering.
+
+    Events are pulled in chunks sized from the measured throughput, so each
+    chunk takes about CHUNK_TIME and the deadline is checked often enough.
+    """
+
+    CHUNK_TIME = 0.002          # Target seconds per chunk
+    MIN_CHUNK = 16              # Chunk bounds when running as fast as possible
+    MAX_CHUNK = 65536
+    MAX_BACKLOG = 0.1           # Seconds of due events kept when falling behind
+    FAST_RENDER_FPS = 30        # Render cap while running as fast as possible
+    RATE_WINDOW = 1.0           # Seconds averaged for the achieved rate
+
+    def __init__(self, rate: Optional[float] = 60.0, frame_budget: float = 0.6 / FPS,
+                 render_fps: float = FPS):
+        """
+        Args:
+            rate: Target events per second, None for as fast as possible
+            frame_budget: Seconds of stepping per rendered frame
+            render_fps: Maximum renders per second while stepping
+        """
+        self.rate = rate
+        self.frame_budget = frame_budget
+        self.render_fps = render_fps
+
+        self.render_this_frame = True
+        self._due = 0.0
+        self._deadline = 0.0
+        self._last_render = -math.inf
+        self._throughput = 0.0  # Events per second of stepping time (moving average)
+
+        self._frame_events = 0
+        self._history = deque()  # (time, events) per frame
+        self.total_events = 0
+
+    @property
+    def unlimited(self) -> bool:
+        """True in "as fast as possible" mode."""
+        return self.rate is None
+
+    def set_rate(self, rate: Optional[float]):
+        """Set the target events per second (None for as fast as possible)."""
+        self.rate = rate
+        self._due = 0.0
+
+    def reset(self):
+        """Forget due events and rate history (new run)."""
+        self._due = 0.0
+        self._history.clear()
+        self.total_events = 0
+
+    @property
+    def chunk_size(self) -> int:
+        """Events to request per chunk."""
+        if self._throughput:
+            chunk = int(self._throughput * self.CHUNK_TIME)
+        else:
+            chunk = self.MIN_CHUNK
+        chunk = max(self.MIN_CHUNK, min(chunk, self.MAX_CHUNK))
+
+        if not self.unlimited:
+            # Never more than one frame's worth, so slow rates step smoothly
+            chunk = min(chunk, max(1, int(self.rate / FPS)))
+        return chunk
+
+    def begin_frame(self, dt: float):
+        """Start a frame: add due events and set the stepping deadline."""
+        now = time.perf_counter()
+        render_fps = min(self.render_fps, self.FAST_RENDER_FPS) if self.unlimited else self.render_fps
+        self.render_this_frame = now - self._last_render >= 1.0 / render_fps - 0.001
+        if self.render_this_frame:
+            self._last_render = now
+
+        # Frames that are not rendered can spend nearly the whole frame stepping
+        budget = self.frame_budget if self.render_this_frame else 0.9 / FPS
+        self._deadline = now + budget
+        self._frame_events = 0
+
+        if not self.unlimited:
+            self._due = min(self._due + self.rate * dt, max(1.0, self.rate * self.MAX_BACKLOG))
+
+    def next_chunk(self) -> int:
+        """Events to run next, or 0 when this frame is done."""
+        if time.perf_counter() >= self._deadline:
+            return 0
+        if self.unlimited:
+            return self.chunk_size
+        if self._due < 1:
+            return 0
+        return min(self.chunk_size, int(self._due))
+
+    def record(self, events: int, seconds: float):
+        """Account for a chunk of events that took `seconds` to run."""
+        self._frame_events += events
+        if not self.unlimited:
+            self._due -= events
+        if events and seconds > 0:
+            rate = events / seconds
+            self._throughput = rate if not self._throughput else 0.8 * self._throughput + 0.2 * rate
+
+    def end_frame(self):
+        """Finish a frame and update the achieved-rate statistics."""
+        now = time.perf_counter()
+        self.total_events += self._frame_events
+
+        self._history.append((now, self._frame_events))
+        while self._history and now - self._history[0][0] > self.RATE_WINDOW:
+            self._history.popleft()
+
+    @property
+    def steps_per_second(self) -> float:
+        """Events per second achieved over the last RATE_WINDOW seconds."""
+        if len(self._history) < 2:
+            return 0.0
+        span = self._history[-1][0] - self._history[0][0]
+        events = sum(count for _, count in list(self._history)[1:])
+        return events / span if span > 0 else 0.0
@@ -1,7 +1,7 @@
 import pygame
 from typing import Callable, Optional, Tuple
 from utils.constants import COLOR_TEXT, COLOR_BACKGROUND, COLOR_START, COLOR_END
-from utils.fonts import FontManager
+from utils.fonts import FontManager, text_cache
 
 class UIComponent:
     """Base class for UI components."""
@@ -44,7 +44,7 @@ class Button(UIComponent):
         self.text_color_disabled = (100, 100, 100)
 
         # Font
-        self.font = pygame.font.Font(None, 24)
+        self.font = FontManager.get_default_font(24)
 
 
     def handle_event(self, event: pygame.event.Event) -> bool:
@@ -91,7 +91,7 @@ class Button(UIComponent):
         pygame.draw.rect(screen, COLOR_TEXT, self.rect, 2)
 
         # Draw text
-        text_surface = self.font.render(self.text, True, text_color)
+        text_surface = text_cache.render(self.font, self.text, text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
@@ -118,7 +118,7 @@ class Slider(UIComponent):
         self.handle_color_hover = COLOR_END
 
         # Font
-        self.font = pygame.font.Font(None, 20)
+        self.font = FontManager.get_default_font(20)
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         if not self.visible or not self.enabled:
@@ -177,7 +177,7 @@ class Slider(UIComponent):
 
         # Draw label
         if self.label:
-            label_surface = self.font.render(self.label, True, COLOR_TEXT)
+            label_surface = text_cache.render(self.font, self.label, COLOR_TEXT)
             screen.blit(label_surface, (self.rect.x, self.rect.y - 20))
 
         # Draw track
@@ -192,7 +192,7 @@ class Slider(UIComponent):
 
         # Draw value
         value_text = f"{int(self.value)}"
-        value_surface = self.font.render(value_text, True, COLOR_TEXT)
+        value_surface = text_cache.render(self.font, value_text, COLOR_TEXT)
         screen.blit(value_surface, (self.rect.right + 10, self.rect.y))
 
 
@@ -203,7 +203,7 @@ class Label(UIComponent):
         super().__init__(x, y, 0, 0)
         self.text = text
         self.color = color or COLOR_TEXT
-        self.font = pygame.font.Font(None, font_size)
+        self.font = FontManager.get_default_font(font_size)
         self._update_size()
 
     def set_text(self, text: str):
@@ -213,7 +213,7 @@ class Label(UIComponent):
 
     def _update_size(self):
         """Update component size based on text."""
-        surface = self.font.render(self.text, True, self.color)
+        surface = text_cache.render(self.font, self.text, self.color)
         self.rect.width = surface.get_width()
         self.rect.height = surface.get_height()
 
@@ -221,7 +221,7 @@ class Label(UIComponent):
         if not self.visible:
             return
 
-        text_surface = self.font.render(self.text, True, self.color)
+        text_surface = text_cache.render(self.font, self.text, self.color)
         screen.blit(text_surface, self.rect.topleft)
 
 
@@ -234,7 +234,7 @@ class Panel(UIComponent):
         self.components = []
         self.background_color = (30, 30, 30)
         self.border_color = COLOR_TEXT
-        self.title_font = pygame.font.Font(None, 28)
+        self.title_font = FontManager.get_default_font(28)
 
     def add_component(self, component: UIComponent):
         """Add a component to the panel."""
@@ -264,7 +264,7 @@ class Panel(UIComponent):
 
         # Draw title
         if self.title:
-            title_surface = self.title_font.render(self.title, True, COLOR_TEXT)
+            title_surface = text_cache.render(self.title_font, self.title, COLOR_TEXT)
             title_rect = title_surface.get_rect(centerx=self.rect.centerx, top=self.rect.top + 10)
             screen.blit(title_surface, title_rect)
 
@@ -321,6 +321,6 @@ class ToggleButton(Button):
         pygame.draw.rect(screen, COLOR_TEXT, self.rect, 2)
 
         # Draw text
-        text_surface = self.font.render(self.text, True, text_color)
+        text_surface = text_cache.render(self.font, self.text, text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
@@ -40,6 +40,14 @@ class UIManager:
         for component in self.components:
             component.render(screen)
 
+    def get_rects(self) -> List[pygame.Rect]:
+        """Screen areas covered by the components (panels include their children)."""
+        rects = []
+        for component in self.components:
+            children = [child.rect for child in getattr(component, 'components', [])]
+            rects.append(component.rect.unionall(children) if children else component.rect.copy())
+        return rects
+
     def clear(self):
         """Remove all components."""
         self.components.clear()
@@ -5,100 +5,202 @@ from typing import Optional, List
 from maze.grid import Grid
 from utils.constants import *
 from visualization.animations import ColorTransition, PulseEffect, WaveEffect
-from utils.fonts import FontManager
+from visualization.array_renderer import ArrayRenderer
+from utils.fonts import FontManager, text_cache
 
 class Visualizer:
     """Handles rendering of the maze and visualization."""
 
+    # Start and end markers are drawn at least this large when zoomed out
+    MIN_MARKER_SIZE = 8
+
     def __init__(self, screen: pygame.Surface, grid: Grid, layout):
         self.screen = screen
         self.grid = grid
         self.layout = layout
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 18)
+        self.font = FontManager.get_default_font(24)
+        self.small_font = FontManager.get_default_font(18)
 
         # Animation effects (initialize without parameters - they'll be set when needed)
         self.pulse_effect = PulseEffect(speed=2.0)
         self.wave_effect = None  # Will be created when needed
 
+        # Full redraw only on first frame, resize or theme change; otherwise only dirty cells
+        self._full_redraw = True
+
+        # Cached static layers: cell types + grid lines, legend, instructions
+        self._base_layer: Optional[pygame.Surface] = None
+        self._base_version = -1
+        self._legend_layer: Optional[pygame.Surface] = None
+        self._instructions_layer: Optional[pygame.Surface] = None
+        self._layers_key = None
+        self._camera_key = None
+
+        # Large grids: palette-index array of cell + search state, rendered by ArrayRenderer
+        self._codes = None
+        self._array_renderer: Optional[ArrayRenderer] = None
+
+    @property
+    def use_array_rendering(self) -> bool:
+        """
+        True when the grid is large enough to render through surfarray, or the
+        camera is panned / zoomed (only the visible cells are rendered then).
+        """
+        return (self.grid.rows * self.grid.cols >= ARRAY_RENDER_THRESHOLD
+                or not self.layout.shows_whole_grid)
+
     def update_animations(self, dt: float):
         """Update animation effects."""
         self.pulse_effect.update(dt)
         if self.wave_effect:
             self.wave_effect.update(dt)
 
-    def render(self, stats_lines: Optional[List[str]] = None):
-        """Render the complete visualization."""
-        self.screen.fill(COLOR_BACKGROUND)
-        self.draw_grid()
-        self.draw_cells()
-        self.draw_legend()
-        self.draw_instructions()
+    def invalidate(self):
+        """Force a full redraw on the next frame (resize, theme change, window expose)."""
+        self._full_redraw = True
+        self._layers_key = None
+
+    def render(self, stats_lines: Optional[List[str]] = None) -> Optional[List[pygame.Rect]]:
+        """
+        Render the visualization incrementally.
+
+        Frames are composed from cached static layers plus a search-state
+        overlay. Cells reported by the grid's change journal (edits and solver
+        events) are redrawn; start and end are redrawn every frame for the pulse.
+
+        Returns:
+            None after a full redraw (flip the whole display), otherwise the
+            screen rects that changed (for pygame.display.update)
+        """
+        all_dirty, dirty = self.grid.take_dirty()
+        rebuilt = self._update_layers(all_dirty, dirty)
+
+        if self._full_redraw:
+            self._full_redraw = False
+            self.screen.fill(COLOR_BACKGROUND)
+            self.draw_cells()
+            self.draw_legend()
+            self.draw_instructions()
+
+            if stats_lines:
+                self.draw_stats(stats_lines)
+            return None
+
+        if all_dirty or rebuilt:
+            self.draw_cells()
+            rects = [pygame.Rect(self.layout.get_view_rect())]
+        else:
+            cols = self.grid.cols
+            for cell in (self.grid.start_cell, self.grid.end_cell):
+                if cell:
+                    dirty.append(cell.row * cols + cell.col)
+            rects = [self.draw_cell(self.grid.cells[index // cols][index % cols])
+                     for index in set(dirty) if index < cols * self.grid.rows]
+            rects = [rect for rect in rects if rect.width and rect.height]
 
         if stats_lines:
-            self.draw_stats(stats_lines)
-
-    def draw_grid(self):
-        """Draw grid lines."""
-        for row in range(self.grid.rows + 1):
-            y = self.layout.grid_y + row * self.layout.cell_size
-            pygame.draw.line(
-                self.screen,
-                COLOR_GRID_LINE,
-                (self.layout.grid_x, y),
-                (self.layout.grid_x + self.layout.grid_width, y),
-                1
-            )
-
-        for col in range(self.grid.cols + 1):
-            x = self.layout.grid_x + col * self.layout.cell_size
-            pygame.draw.line(
-                self.screen,
-                COLOR_GRID_LINE,
-                (x, self.layout.grid_y),
-                (x, self.layout.grid_y + self.layout.grid_height),
-                1
-            )
-
-    # visualizer.py - Update draw_cells method
-    def draw_cells(self):
-        """Draw all cells with visible grid lines."""
-        for row in self.grid.cells:
-            for cell in row:
-                x, y, w, h = self.layout.get_cell_rect(cell.row, cell.col)
+            rects.extend(self.draw_stats(stats_lines))
+        return rects
 
-                # Fill cell color
-                color = self._get_cell_color(cell)
-                pygame.draw.rect(self.screen, color, (x, y, w, h))
+    #  STATIC LAYERS
+    def _update_layers(self, all_dirty: bool, dirty: List[int]) -> bool:
+        """
+        Keep the cached layers in sync with layout, camera and grid structure.
 
-                # ALWAYS draw grid lines for better visibility
-                pygame.draw.rect(self.screen, COLOR_GRID_LINE, (x, y, w, h), 1)
+        The base layer is rebuilt when the layout or camera changes or the
+        whole grid changed structurally; single-cell edits are patched into it.
 
-                # Highlight start/end with thicker border
-                if cell == self.grid.start_cell or cell == self.grid.end_cell:
-                    pygame.draw.rect(self.screen, (255, 255, 255), (x, y, w, h), 2)
+        Returns:
+            True if the base layer was rebuilt
+        """
+        key = (self.grid.rows, self.grid.cols, self.layout.grid_x, self.layout.grid_y,
+               self.layout.grid_width, self.layout.grid_height)
 
-    def _get_cell_color(self, cell):
-        """Get color for a cell based on its state."""
-        if cell.type == CELL_WALL:
-            return COLOR_WALL
-        elif cell.type == CELL_START:
-            return self.pulse_effect.get_color(COLOR_START)
-        elif cell.type == CELL_END:
-            return self.pulse_effect.get_color(COLOR_END)
-        elif cell.in_path:
-            return COLOR_PATH
-        elif cell.visited:
-            return COLOR_VISITED
-        elif cell.in_frontier:
-            return COLOR_FRONTIER
-        return COLOR_EMPTY
+        if key != self._layers_key:
+            self._layers_key = key
+            self._legend_layer = self._build_legend()
+            self._instructions_layer = self._build_instructions()
+            self._base_layer = None
 
-    def draw_legend(self):
-        """Draw color legend."""
-        legend_x = 20
-        legend_y = self.layout.grid_y + self.layout.grid_height + 10
+        camera = self.layout.camera_key()
+        if camera != self._camera_key:
+            self._camera_key = camera
+            self._base_layer = None
+
+        if self.use_array_rendering:
+            return self._update_array_layer(all_dirty, dirty)
+
+        if self._base_layer is None or (all_dirty and self.grid.version != self._base_version):
+            self._base_layer = self._build_base()
+            self._base_version = self.grid.version
+            return True
+
+        if self.grid.version != self._base_version:
+            cols = self.grid.cols
+            for index in dirty:
+                if index < cols * self.grid.rows:
+                    self._draw_base_cell(self._base_layer, self.grid.cells[index // cols][index % cols])
+            self._base_version = self.grid.version
+        return False
+
+    def _update_array_layer(self, all_dirty: bool, dirty: List[int]) -> bool:
+        """
+        Render cell and search state of the visible cells in one array pass.
+        The resulting viewport-sized layer already shows search state; only
+        start and end are drawn on top.
+
+        Returns:
+            True if the layer was re-rendered
+        """
+        rows, cols = self.grid.rows, self.grid.cols
+        first_row, end_row, first_col, end_col = self.layout.visible_range()
+        visible = self._base_layer is None
+
+        if self._codes is None or all_dirty or self._codes.shape != (rows, cols):
+            self._codes = self.grid.to_state_array()
+            visible = True
+        elif dirty:
+            flat = self._codes.ravel()
+            for index in dirty:
+                if index < rows * cols:
+                    row, col = divmod(index, cols)
+                    flat[index] = self.grid.cells[row][col].state_code()
+                    visible = visible or (first_row <= row < end_row and first_col <= col < end_col)
+
+        if not visible:
+            return False
+
+        if self._array_renderer is None:
+            self._array_renderer = ArrayRenderer()
+        image = self._array_renderer.render(self._codes[first_row:end_row, first_col:end_col],
+                                            self.layout.cell_size, self.layout.cells_per_pixel)
+
+        size = (self.layout.grid_width, self.layout.grid_height)
+        if self._base_layer is None or self._base_layer.get_size() != size:
+            self._base_layer = pygame.Surface(size)
+        offset_x, offset_y = self.layout.view_offset()
+        self._base_layer.fill(COLOR_BACKGROUND)
+        self._base_layer.blit(image, (-offset_x, -offset_y))
+        return True
 
+    def _build_base(self) -> pygame.Surface:
+        """Render cell types (walls / empty) with grid lines into one surface."""
+        surface = pygame.Surface((max(1, self.layout.grid_width), max(1, self.layout.grid_height)))
+        surface.fill(COLOR_EMPTY)
+        for row in self.grid.cells:
+            for cell in row:
+                self._draw_base_cell(surface, cell)
+        return surface
+
+    def _draw_base_cell(self, surface: pygame.Surface, cell):
+        """Draw one cell's static appearance into the base layer."""
+        size = self.layout.cell_size
+        rect = (cell.col * size, cell.row * size, size, size)
+        pygame.draw.rect(surface, COLOR_WALL if cell.type == CELL_WALL else COLOR_EMPTY, rect)
+        pygame.draw.rect(surface, COLOR_GRID_LINE, rect, 1)
+
+    def _build_legend(self) -> pygame.Surface:
+        """Pre-render the color legend."""
         legend_items = [
             ("Start", COLOR_START),
             ("End", COLOR_END),
@@ -108,19 +210,22 @@ class Visualizer:
             ("Path", COLOR_PATH),
         ]
 
+        surface = pygame.Surface((len(legend_items) * 120, 20))
+        surface.fill(COLOR_BACKGROUND)
         for i, (label, color) in enumerate(legend_items):
-            x = legend_x + i * 120
+            x = i * 120
 
             # Draw color box
-            pygame.draw.rect(self.screen, color, (x, legend_y, 20, 20))
-            pygame.draw.rect(self.screen, COLOR_TEXT, (x, legend_y, 20, 20), 1)
+            pygame.draw.rect(surface, color, (x, 0, 20, 20))
+            pygame.draw.rect(surface, COLOR_TEXT, (x, 0, 20, 20), 1)
 
             # Draw label
-            text = self.small_font.render(label, True, COLOR_TEXT)
-            self.screen.blit(text, (x + 25, legend_y + 2))
+            text = text_cache.render(self.small_font, label, COLOR_TEXT)
+            surface.blit(text, (x + 25, 2))
+        return surface
 
-    def draw_instructions(self):
-        """Draw usage instructions in a horizontal layout."""
+    def _build_instructions(self) -> pygame.Surface:
+        """Pre-render the usage instructions in a horizontal layout."""
         instructions = [
             "Ctrl+Click: Set Start",
             "Shift+Click: Set End",
@@ -128,22 +233,114 @@ class Visualizer:
             "Right Click: Erase"
         ]
 
-        start_x = self.layout.grid_x
-        y = 15
-
+        surface = pygame.Surface((len(instructions) * 180, self.small_font.get_linesize()))
+        surface.fill(COLOR_BACKGROUND)
         for i, line in enumerate(instructions):
-            x = start_x + i * 180
-            text = self.small_font.render(line, True, COLOR_TEXT)
-            self.screen.blit(text, (x, y))
+            text = text_cache.render(self.small_font, line, COLOR_TEXT)
+            surface.blit(text, (i * 180, 0))
+        return surface
+
+    #  DRAWING
+    def draw_cells(self):
+        """Blit the static base layer, then overlay search state, start and end."""
+        if self._base_layer is None:
+            self._update_layers(True, [])
+        self.screen.blit(self._base_layer, (self.layout.grid_x, self.layout.grid_y))
+
+        # Partially visible cells must not spill into the margins
+        self.screen.set_clip(self.layout.get_view_rect())
+        if self.use_array_rendering:
+            for cell in (self.grid.start_cell, self.grid.end_cell):
+                if cell:
+                    self._draw_overlay_cell(cell, self._cell_rect(cell))
+        else:
+            for row in self.grid.cells:
+                for cell in row:
+                    if cell.in_path or cell.visited or cell.in_frontier or cell.type in (CELL_START, CELL_END):
+                        self._draw_overlay_cell(cell, self._cell_rect(cell))
+        self.screen.set_clip(None)
+
+    def draw_cell(self, cell) -> pygame.Rect:
+        """Redraw one cell from the base layer plus its overlay; return its visible screen rect."""
+        rect = self._cell_rect(cell).clip(self.layout.get_view_rect())
+        if not rect.width or not rect.height:
+            return rect
+
+        area = rect.move(-self.layout.grid_x, -self.layout.grid_y)
+        self.screen.blit(self._base_layer, rect, area)
+        self.screen.set_clip(rect)
+        self._draw_overlay_cell(cell, self._cell_rect(cell))
+        self.screen.set_clip(None)
+        return rect
+
+    def _cell_rect(self, cell) -> pygame.Rect:
+        """Screen rect of a cell; start and end keep a minimum size on zoomed-out array views."""
+        rect = pygame.Rect(self.layout.get_cell_rect(cell.row, cell.col))
+        # Array views redraw the whole viewport when start/end move, so the larger marker leaves no trace
+        if (rect.width < self.MIN_MARKER_SIZE and cell.type in (CELL_START, CELL_END)
+                and self.use_array_rendering):
+            center = rect.center
+            rect.size = (self.MIN_MARKER_SIZE, self.MIN_MARKER_SIZE)
+            rect.center = center
+        return rect
+
+    def _draw_overlay_cell(self, cell, rect: pygame.Rect):
+        """Draw the dynamic part of a cell (search state, pulsing start/end)."""
+        if self.use_array_rendering and cell.type not in (CELL_START, CELL_END):
+            return  # Search state is already in the array layer
+        if cell.type == CELL_WALL or not (cell.in_path or cell.visited or cell.in_frontier
+                                          or cell.type in (CELL_START, CELL_END)):
+            return
+
+        # Fill cell color
+        color = self._get_cell_color(cell)
+        pygame.draw.rect(self.screen, color, rect)
+
+        # ALWAYS draw grid lines for better visibility
+        pygame.draw.rect(self.screen, COLOR_GRID_LINE, rect, 1)
+
+        # Highlight start/end with thicker border
+        if cell == self.grid.start_cell or cell == self.grid.end_cell:
+            pygame.draw.rect(self.screen, (255, 255, 255), rect, 2)
+
+    def _get_cell_color(self, cell):
+        """Get color for a cell based on its state."""
+        if cell.type == CELL_WALL:
+            return COLOR_WALL
+        elif cell.type == CELL_START:
+            return self.pulse_effect.get_color(COLOR_START)
+        elif cell.type == CELL_END:
+            return self.pulse_effect.get_color(COLOR_END)
+        elif cell.in_path:
+            return COLOR_PATH
+        elif cell.visited:
+            return COLOR_VISITED
+        elif cell.in_frontier:
+            return COLOR_FRONTIER
+        return COLOR_EMPTY
+
+    def draw_legend(self):
+        """Draw color legend."""
+        if self._legend_layer is None:
+            self._legend_layer = self._build_legend()
+        self.screen.blit(self._legend_layer, (20, self.layout.grid_y + self.layout.grid_height + 10))
+
+    def draw_instructions(self):
+        """Draw usage instructions in a horizontal layout."""
+        if self._instructions_layer is None:
+            self._instructions_layer = self._build_instructions()
+        self.screen.blit(self._instructions_layer, (self.layout.grid_x, 15))
 
-    def draw_stats(self, stats_lines: List[str]):
-        """Draw algorithm statistics."""
+    def draw_stats(self, stats_lines: List[str]) -> List[pygame.Rect]:
+        """Draw algorithm statistics and return the rects drawn."""
         x = self.layout.grid_x + self.layout.grid_width + 20
         y = 20
 
+        rects = []
         for i, line in enumerate(stats_lines):
-            text = self.font.render(line, True, COLOR_TEXT)
-            self.screen.blit(text, (x, y + i * 25))
+            text = text_cache.render(self.font, line, COLOR_TEXT)
+            rects.append(self.screen.blit(text, (x, y + i * 25)))
+        return rects
 
     def highlight_cell(self, row: int, col: int, color: tuple):
         """Highlight a specific cell."""